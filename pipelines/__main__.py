@@ -27,6 +27,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from pipelines.lib.connections import close_all_connections
+from pipelines.lib.storage import close_all_storage_clients
 from pipelines.lib._path_utils import storage_path_exists
 
 
@@ -308,7 +309,7 @@ def explain_yaml_pipeline(yaml_path: str, layer: Optional[str], run_date: str) -
     print(f"Run Date: {run_date}")
     print(f"Layer: {layer or 'all (bronze → silver)'}")
     print()
-    print(pipeline.explain())
+    print(pipeline.explain(run_date))
     print("=" * 60)
 
 
@@ -550,6 +551,8 @@ def explain_pipeline(module: Any, layer: Optional[str], run_date: str) -> None:
 
     Shows configuration details and execution plan.
     """
+    from pipelines.lib.pipeline import describe_catalog
+
     print()
     print("=" * 60)
     print("PIPELINE EXPLANATION")
@@ -571,6 +574,8 @@ def explain_pipeline(module: Any, layer: Optional[str], run_date: str) -> None:
         print(f"  Load Pattern: {bronze.load_pattern.value}")
         if bronze.watermark_column:
             print(f"  Watermark:    {bronze.watermark_column}")
+        for line in describe_catalog(bronze, run_date):
+            print(line)
         print()
 
     # Check for silver configuration
@@ -1593,6 +1598,7 @@ Examples:
 
         finally:
             close_all_connections()
+            close_all_storage_clients()
 
     else:
         # Python module pipeline
@@ -1644,6 +1650,7 @@ Examples:
         finally:
             # Clean up connections
             close_all_connections()
+            close_all_storage_clients()
 
 
 if __name__ == "__main__":
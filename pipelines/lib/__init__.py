@@ -21,6 +21,7 @@ from pipelines.lib.api import (
     build_pagination_config_from_dict,
     build_pagination_state,
     create_api_source_from_options,
+    get_rate_limiter,
     rate_limited,
 )
 from pipelines.lib.bronze import (
@@ -40,6 +41,13 @@ from pipelines.lib.checksum import (
     write_checksum_manifest,
 )
 from pipelines.lib.connections import close_all_connections, get_connection
+from pipelines.lib.engine import (
+    EngineSettings,
+    close_all_engines,
+    configure_engine,
+    get_engine,
+    materialized,
+)
 from pipelines.lib.env import (
     expand_env_vars,
     expand_options,
@@ -96,7 +104,7 @@ from pipelines.lib.quality import (
 )
 from pipelines.lib.resilience import with_retry
 from pipelines.lib.runner import pipeline
-from pipelines.lib.silver import EntityKind, HistoryMode, SilverEntity
+from pipelines.lib.silver import EntityKind, HistoryMode, MergeMode, SilverEntity
 from pipelines.lib.config_loader import (
     BronzeConfig,
     LoggingConfig,
@@ -161,6 +169,12 @@ __all__ = [
     # Connections
     "close_all_connections",
     "get_connection",
+    # DuckDB engine
+    "EngineSettings",
+    "close_all_engines",
+    "configure_engine",
+    "get_engine",
+    "materialized",
     # Environment
     "expand_env_vars",
     "expand_options",
@@ -180,6 +194,7 @@ __all__ = [
     "generate_polybase_setup",
     # Rate Limiting
     "RateLimiter",
+    "get_rate_limiter",
     "rate_limited",
     # Curate
     "build_history",
@@ -227,6 +242,7 @@ __all__ = [
     # Silver
     "EntityKind",
     "HistoryMode",
+    "MergeMode",
     "SilverEntity",
     # Validate
     "BronzeConfig",
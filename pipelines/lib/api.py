@@ -6,6 +6,7 @@ Provides full-featured REST API extraction with:
 - Rate limiting
 - Retry with exponential backoff
 - Watermark-based incremental extraction
+- Conditional requests (ETag/Last-Modified) with a local response cache
 
 Example:
     from pipelines.lib.api import ApiSource, AuthConfig, AuthType
@@ -35,17 +36,39 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import itertools
+import json
 import logging
+import os
+import shutil
 import threading
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 from pipelines.lib.env import extract_nested_value, utc_now_iso
 from enum import Enum
-from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+from functools import partial, wraps
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import httpx
 import tenacity
@@ -59,14 +82,18 @@ from tenacity import (
 
 from pipelines.lib._path_utils import path_has_data, resolve_target_path
 from pipelines.lib.artifact_writer import write_artifacts
+from pipelines.lib.engine import get_engine
 from pipelines.lib.env import expand_env_vars, expand_options, parse_iso_datetime
+from pipelines.lib.http_cache import ResponseCache
 from pipelines.lib.io import (
     OutputMetadata,
     infer_column_types,
     maybe_dry_run,
     maybe_skip_if_exists,
+    records_to_arrow,
 )
 from pipelines.lib.observability import get_structlog_logger
+from pipelines.lib.staging import get_staging_root, staging_area
 from pipelines.lib.state import get_watermark, save_watermark
 
 logger = get_structlog_logger(__name__)
@@ -291,6 +318,7 @@ class PaginationConfig:
             page_param="page",
             page_size_param="per_page",
             max_pages=10,  # Optional limit
+            concurrency=8,  # Fetch up to 8 pages at once
         )
 
         # Cursor pagination (cursor-based)
@@ -320,14 +348,31 @@ class PaginationConfig:
     # Global limit (stop after this many records regardless of pagination)
     max_records: int = 0  # 0 = unlimited
 
+    # Pages requested in parallel (offset and page strategies only)
+    concurrency: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate the concurrency setting."""
+        if self.concurrency < 1:
+            raise ValueError("Pagination concurrency must be at least 1")
+
 
 class PaginationState(ABC):
     """Base class for pagination state machines.
 
     Pagination states track the progress through paginated API responses
     and build the appropriate query parameters for each request.
+
+    States whose page parameters are known up front (offset and page
+    numbers) set ``random_access`` and implement params_for_page and
+    page_index, which lets ApiSource request several pages concurrently.
+
+    checkpoint() and restore() save and resume the position, so a long
+    extraction can continue where a failed run stopped.
     """
 
+    random_access = False
+
     def __init__(
         self,
         config: PaginationConfig,
@@ -383,6 +428,40 @@ class PaginationState(ABC):
         """
         ...
 
+    def params_for_page(self, index: int) -> Dict[str, Any]:
+        """Build query parameters for a page without advancing the state.
+
+        Args:
+            index: Zero-based page index
+
+        Returns:
+            Dictionary of query parameters
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} cannot build parameters for arbitrary pages"
+        )
+
+    @property
+    def page_index(self) -> int:
+        """Zero-based index of the next page (random-access states only)."""
+        raise NotImplementedError(f"{type(self).__name__} cannot index its pages")
+
+    def page_limit(self) -> Optional[int]:
+        """Maximum number of pages worth requesting, or None if unbounded."""
+        if self.max_records > 0:
+            return -(-self.max_records // self.config.page_size)
+        return None
+
+    @abstractmethod
+    def checkpoint(self) -> Dict[str, Any]:
+        """Return the position of the next page as JSON-serializable data."""
+        ...
+
+    @abstractmethod
+    def restore(self, checkpoint: Dict[str, Any]) -> None:
+        """Resume from a position returned by checkpoint()."""
+        ...
+
 
 class NoPaginationState(PaginationState):
     """State for single-request (non-paginated) APIs."""
@@ -408,6 +487,12 @@ class NoPaginationState(PaginationState):
     def describe(self) -> str:
         return "(no pagination)"
 
+    def checkpoint(self) -> Dict[str, Any]:
+        return {"fetched": self._fetched}
+
+    def restore(self, checkpoint: Dict[str, Any]) -> None:
+        self._fetched = bool(checkpoint.get("fetched", False))
+
 
 class OffsetPaginationState(PaginationState):
     """State for offset/limit pagination.
@@ -418,6 +503,8 @@ class OffsetPaginationState(PaginationState):
         ...
     """
 
+    random_access = True
+
     def __init__(
         self,
         config: PaginationConfig,
@@ -431,10 +518,13 @@ class OffsetPaginationState(PaginationState):
         return True  # Controlled by on_response
 
     def build_params(self) -> Dict[str, Any]:
+        self._last_offset = self.offset
+        return self.params_for_page(self.offset // self.config.page_size)
+
+    def params_for_page(self, index: int) -> Dict[str, Any]:
         params = dict(self.base_params)
         params[self.config.limit_param] = self.config.page_size
-        params[self.config.offset_param] = self.offset
-        self._last_offset = self.offset
+        params[self.config.offset_param] = index * self.config.page_size
         return params
 
     def on_response(self, records: List[Dict[str, Any]], data: Any) -> bool:
@@ -446,6 +536,16 @@ class OffsetPaginationState(PaginationState):
     def describe(self) -> str:
         return f"at offset {self._last_offset}"
 
+    @property
+    def page_index(self) -> int:
+        return self.offset // self.config.page_size
+
+    def checkpoint(self) -> Dict[str, Any]:
+        return {"offset": self.offset}
+
+    def restore(self, checkpoint: Dict[str, Any]) -> None:
+        self.offset = self._last_offset = int(checkpoint.get("offset", 0))
+
 
 class PagePaginationState(PaginationState):
     """State for page number pagination.
@@ -456,6 +556,8 @@ class PagePaginationState(PaginationState):
         ...
     """
 
+    random_access = True
+
     def __init__(
         self,
         config: PaginationConfig,
@@ -473,12 +575,19 @@ class PagePaginationState(PaginationState):
         return True
 
     def build_params(self) -> Dict[str, Any]:
+        self._last_page = self.page
+        return self.params_for_page(self.page - 1)
+
+    def params_for_page(self, index: int) -> Dict[str, Any]:
         params = dict(self.base_params)
-        params[self.config.page_param] = self.page
+        params[self.config.page_param] = index + 1
         params[self.config.page_size_param] = self.config.page_size
-        self._last_page = self.page
         return params
 
+    def page_limit(self) -> Optional[int]:
+        limits = [self.config.max_pages, super().page_limit()]
+        return min((limit for limit in limits if limit), default=None)
+
     def on_response(self, records: List[Dict[str, Any]], data: Any) -> bool:
         if not records or len(records) < self.config.page_size:
             return False
@@ -488,6 +597,16 @@ class PagePaginationState(PaginationState):
     def describe(self) -> str:
         return f"from page {self._last_page}"
 
+    @property
+    def page_index(self) -> int:
+        return self.page - 1
+
+    def checkpoint(self) -> Dict[str, Any]:
+        return {"page": self.page}
+
+    def restore(self, checkpoint: Dict[str, Any]) -> None:
+        self.page = self._last_page = int(checkpoint.get("page", 1))
+
     @property
     def max_pages_limit_hit(self) -> bool:
         """Check if max_pages limit was reached."""
@@ -537,6 +656,12 @@ class CursorPaginationState(PaginationState):
             )
         return "(cursor pagination, first page)"
 
+    def checkpoint(self) -> Dict[str, Any]:
+        return {"cursor": self.cursor}
+
+    def restore(self, checkpoint: Dict[str, Any]) -> None:
+        self.cursor = checkpoint.get("cursor")
+
     def _extract_cursor(self, data: Any) -> Optional[str]:
         """Extract next cursor from response data.
 
@@ -593,6 +718,7 @@ def build_pagination_config_from_dict(
         - cursor_param: Query param for cursor (default: "cursor")
         - cursor_path: Path to cursor in response (default: "next_cursor")
         - max_records: Stop after this many records (default: 0 = unlimited)
+        - concurrency: Pages fetched in parallel for offset/page (default: 1)
 
     Args:
         options: Dictionary with pagination options
@@ -621,6 +747,7 @@ def build_pagination_config_from_dict(
         cursor_param=options.get("cursor_param", "cursor"),
         cursor_path=options.get("cursor_path", "next_cursor"),
         max_records=options.get("max_records", 0),
+        concurrency=options.get("concurrency", 1),
     )
 
 
@@ -632,10 +759,19 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 
 class RateLimiter:
-    """Token-bucket rate limiter.
+    """Token-bucket rate limiter with an optional in-flight limit.
 
-    Limits the rate of operations to a specified number per second.
-    Thread-safe for concurrent usage.
+    Limits the rate of operations to a specified number per second and,
+    with max_in_flight, how many may run at once. Thread-safe, and usable
+    from asyncio code through acquire_async and slot_async.
+
+    Callers never poll: acquiring reserves the next token (the bucket may
+    go into debt) and sleeps exactly until that token is due, so waiters
+    are served in arrival order at the configured rate.
+
+    The limiter also adapts to the server: observe() reads Retry-After and
+    X-RateLimit-Remaining/-Reset response headers and pauses or drains
+    the bucket so a vendor's quota is respected before it answers 429.
 
     Example:
         limiter = RateLimiter(requests_per_second=10)
@@ -643,25 +779,43 @@ class RateLimiter:
         for item in items:
             limiter.acquire()  # Blocks until allowed
             make_api_call(item)
+
+        # Rate plus concurrency, adapting to response headers
+        limiter = RateLimiter(requests_per_second=20, max_in_flight=5)
+        with limiter.slot():
+            response = client.get(url)
+            limiter.observe(response.headers)
+
+    Use get_rate_limiter() to share one limiter per API host or named
+    budget across every source in the process.
     """
 
     def __init__(
         self,
-        requests_per_second: float,
+        requests_per_second: float | None,
         *,
         burst_size: int | None = None,
+        max_in_flight: int | None = None,
     ) -> None:
         """Initialize rate limiter.
 
         Args:
-            requests_per_second: Maximum sustained rate
+            requests_per_second: Maximum sustained rate (None = no rate
+                limit, e.g. when only max_in_flight is wanted)
             burst_size: Maximum burst capacity (defaults to 1)
+            max_in_flight: Maximum operations holding a slot() at once
+                (None = unlimited)
         """
         self.rate = requests_per_second
         self.burst_size = burst_size or 1
+        self.max_in_flight = max_in_flight
         self.tokens = float(self.burst_size)
         self.last_update = time.monotonic()
+        self.in_flight = 0
+        self._paused_until = 0.0
         self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
 
     def acquire(self, timeout: float | None = None) -> bool:
         """Acquire a token, blocking until available.
@@ -672,35 +826,59 @@ class RateLimiter:
         Returns:
             True if token acquired, False if timeout expired
         """
-        start_time = time.monotonic()
+        wait_time = self._reserve(timeout)
+        if wait_time is None:
+            return False
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return True
 
-        while True:
-            with self._lock:
-                self._refill_tokens()
+    async def acquire_async(self, timeout: float | None = None) -> bool:
+        """Acquire a token without blocking the event loop.
 
-                if self.tokens >= 1:
-                    self.tokens -= 1
-                    return True
+        Args:
+            timeout: Maximum time to wait (None = wait forever)
 
-                # Calculate wait time for next token
-                wait_time = (1 - self.tokens) / self.rate
+        Returns:
+            True if token acquired, False if timeout expired
+        """
+        wait_time = self._reserve(timeout)
+        if wait_time is None:
+            return False
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return True
 
-            # Check timeout
-            if timeout is not None:
-                elapsed = time.monotonic() - start_time
-                if elapsed + wait_time > timeout:
-                    return False
+    def _reserve(self, timeout: float | None) -> float | None:
+        """Take the next token and return how long to wait for it.
 
-            # Wait and retry
-            time.sleep(min(wait_time, 0.1))  # Cap wait at 100ms increments
+        Returns None (and takes nothing) if the wait would exceed timeout.
+        """
+        with self._lock:
+            self._refill_tokens()
+            # Tokens only accrue once a pause ends, so the two waits add up
+            wait_time = max(0.0, self._paused_until - self.last_update)
+            if self.rate:
+                wait_time += max(0.0, (1 - self.tokens) / self.rate)
+            if timeout is not None and wait_time > timeout:
+                return None
+            self.tokens -= 1
+            return wait_time
 
     def _refill_tokens(self) -> None:
-        """Refill tokens based on elapsed time."""
+        """Refill tokens based on elapsed time, none while paused."""
         now = time.monotonic()
+        if self._paused_until > self.last_update:
+            if now <= self._paused_until:
+                self.last_update = now
+                return
+            # The pause just ended: refill from its end, without a burst
+            self.last_update = self._paused_until
+            self.tokens = min(self.tokens, 1.0)
         elapsed = now - self.last_update
         self.tokens = min(
             self.burst_size,
-            self.tokens + elapsed * self.rate,
+            self.tokens + elapsed * (self.rate or 0),
         )
         self.last_update = now
 
@@ -712,11 +890,170 @@ class RateLimiter:
         """
         with self._lock:
             self._refill_tokens()
-            if self.tokens >= 1:
+            if self._paused_until > self.last_update:
+                return False
+            if not self.rate or self.tokens >= 1:
                 self.tokens -= 1
                 return True
             return False
 
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold an in-flight slot and a token for the duration of a request."""
+        with self._slot_freed:
+            while self.max_in_flight and self.in_flight >= self.max_in_flight:
+                self._slot_freed.wait()
+            self.in_flight += 1
+        try:
+            self.acquire()
+            yield
+        finally:
+            self._release_slot()
+
+    @asynccontextmanager
+    async def slot_async(self) -> AsyncIterator[None]:
+        """Async version of slot() that waits without blocking the loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if not self.max_in_flight or self.in_flight < self.max_in_flight:
+                    self.in_flight += 1
+                    break
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+        try:
+            await self.acquire_async()
+            yield
+        finally:
+            self._release_slot()
+
+    def _release_slot(self) -> None:
+        with self._slot_freed:
+            self.in_flight -= 1
+            # Waiters re-check the limit, so waking all of them is safe
+            self._slot_freed.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake_waiter, waiter)
+
+    def observe(self, headers: Mapping[str, str]) -> None:
+        """Adapt to rate-limit headers from a response.
+
+        - Retry-After (seconds or an HTTP date) pauses the limiter until
+          the server accepts requests again.
+        - X-RateLimit-Remaining caps the available tokens at what the
+          server still allows; when it reaches zero, the limiter pauses
+          until X-RateLimit-Reset (epoch seconds or seconds from now).
+
+        Args:
+            headers: Response headers (any case)
+        """
+        lowered = {key.lower(): value for key, value in headers.items()}
+        retry_after = _parse_retry_after(lowered.get("retry-after"))
+        remaining = _parse_number(lowered.get("x-ratelimit-remaining"))
+        reset = _parse_number(lowered.get("x-ratelimit-reset"))
+
+        with self._lock:
+            self._refill_tokens()
+            pause = retry_after or 0.0
+            if remaining is not None:
+                self.tokens = min(self.tokens, remaining)
+                if remaining <= 0 and reset is not None:
+                    # Large values are epoch timestamps, small ones deltas
+                    pause = max(pause, reset - time.time() if reset > 1e9 else reset)
+            if pause > 0:
+                self._paused_until = max(self._paused_until, self.last_update + pause)
+                self.tokens = min(self.tokens, 1.0)
+                logger.debug("Rate limiter paused for %.1f seconds", pause)
+
+
+def _wake_waiter(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    seconds = _parse_number(value)
+    if seconds is not None or not value:
+        return seconds
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return (retry_at - datetime.now(timezone.utc)).total_seconds()
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    key: str,
+    requests_per_second: float | None,
+    *,
+    burst_size: int | None = None,
+    max_in_flight: int | None = None,
+) -> RateLimiter:
+    """Return the process-wide rate limiter for an API host or named budget.
+
+    Every ApiSource (and thread) calling the same vendor shares one
+    limiter, so together they stay within the vendor's quota. The first
+    call for a key creates the limiter; later calls get the same instance
+    and their settings are ignored, with a warning if they differ.
+
+    Args:
+        key: API host (e.g., "api.example.com") or a named budget
+        requests_per_second: Maximum sustained rate
+        burst_size: Maximum burst capacity (defaults to 1)
+        max_in_flight: Maximum concurrent requests (None = unlimited)
+
+    Returns:
+        The shared RateLimiter
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(
+                requests_per_second,
+                burst_size=burst_size,
+                max_in_flight=max_in_flight,
+            )
+            _limiters[key] = limiter
+            logger.debug("Created rate limiter for '%s'", key)
+        elif (requests_per_second, burst_size or 1, max_in_flight) != (
+            limiter.rate,
+            limiter.burst_size,
+            limiter.max_in_flight,
+        ):
+            logger.warning(
+                "Rate limiter for '%s' already exists with requests_per_second=%s, "
+                "burst_size=%s, max_in_flight=%s; ignoring requested "
+                "requests_per_second=%s, burst_size=%s, max_in_flight=%s",
+                key,
+                limiter.rate,
+                limiter.burst_size,
+                limiter.max_in_flight,
+                requests_per_second,
+                burst_size,
+                max_in_flight,
+            )
+        return limiter
+
+
+def clear_rate_limiters() -> None:
+    """Forget all shared rate limiters (e.g., between tests)."""
+    with _limiters_lock:
+        _limiters.clear()
+
 
 def rate_limited(
     requests_per_second: float,
@@ -774,6 +1111,8 @@ __all__ = [
     "build_pagination_config_from_dict",
     # Rate Limiting
     "RateLimiter",
+    "clear_rate_limiters",
+    "get_rate_limiter",
     "rate_limited",
     # API Source
     "ApiSource",
@@ -784,6 +1123,168 @@ __all__ = [
 # Backwards compatibility: ApiOutputMetadata is now OutputMetadata
 ApiOutputMetadata = OutputMetadata
 
+# Records buffered per staged Parquet part during extraction
+DEFAULT_API_CHUNK_SIZE = 50_000
+
+
+@dataclass
+class _FetchStats:
+    """Running counters for one paginated fetch."""
+
+    pages_fetched: int = 0
+    total_requests: int = 0
+    records: int = 0
+    not_modified: int = 0  # Pages revalidated from the response cache
+
+    def take(
+        self, records: List[Dict[str, Any]], max_records: int
+    ) -> List[Dict[str, Any]]:
+        """Count a page's records, truncated to what max_records still allows."""
+        if max_records > 0:
+            records = records[: max_records - self.records]
+        self.records += len(records)
+        return records
+
+    def limit_reached(self, max_records: int) -> bool:
+        return 0 < max_records <= self.records
+
+
+@dataclass
+class _SpooledPages:
+    """API pages staged to local Parquet parts."""
+
+    parts: List[Path] = field(default_factory=list)
+    row_count: int = 0
+
+
+CHECKPOINT_FILENAME = "_checkpoint.json"
+CHECKPOINT_VERSION = 1
+
+# Directory under the staging root holding cached API responses
+RESPONSE_CACHE_DIRNAME = "api_response_cache"
+
+
+class _PaginationCheckpoint:
+    """Persisted progress of one paginated extraction.
+
+    Lives in a directory under the staging root that survives failed runs:
+
+        <staging root>/api_checkpoints/<system>_<entity>_<run_date>/
+            _checkpoint.json    # pagination position, counters, parts
+            part-00000.parquet  # staged records
+            ...
+
+    The checkpoint carries a fingerprint of the request (endpoint, params
+    including the watermark, pagination settings), so a run with a changed
+    configuration starts over instead of resuming mismatched progress.
+    Parts written after the last checkpoint are overwritten on resume.
+    """
+
+    def __init__(self, directory: Path, fingerprint: str) -> None:
+        self.directory = directory
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def for_run(
+        cls, source: "ApiSource", run_date: str, state: PaginationState
+    ) -> "_PaginationCheckpoint":
+        identity = {
+            "base_url": source.base_url,
+            "endpoint": source._format_endpoint(),
+            "data_path": source.data_path,
+            "params": state.base_params,
+            "pagination": {
+                key: value
+                for key, value in asdict(state.config).items()
+                if key != "concurrency"
+            },
+        }
+        fingerprint = hashlib.sha256(
+            json.dumps(identity, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()[:16]
+        directory = (
+            get_staging_root()
+            / "api_checkpoints"
+            / f"{source.system}_{source.entity}_{run_date}"
+        )
+        return cls(directory, fingerprint)
+
+    @property
+    def path(self) -> Path:
+        return self.directory / CHECKPOINT_FILENAME
+
+    def resume(
+        self, state: PaginationState, stats: _FetchStats
+    ) -> Tuple[_SpooledPages, bool]:
+        """Restore state and stats from the checkpoint, if there is one.
+
+        Returns:
+            Tuple of (spooled parts so far, whether all pages were fetched)
+        """
+        try:
+            data = json.loads(self.path.read_text())
+        except FileNotFoundError:
+            data = None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable API checkpoint %s: %s", self.path, e)
+            data = None
+
+        if data is None or (data.get("version"), data.get("fingerprint")) != (
+            CHECKPOINT_VERSION,
+            self.fingerprint,
+        ):
+            if data is not None:
+                logger.info("API request changed; discarding checkpoint %s", self.path)
+            self.clear()
+            self.directory.mkdir(parents=True, exist_ok=True)
+            return _SpooledPages(), False
+
+        state.restore(data["state"])
+        stats.pages_fetched = data["pages_fetched"]
+        stats.total_requests = data["total_requests"]
+        stats.records = data["row_count"]
+        spooled = _SpooledPages(
+            parts=[self.directory / name for name in data["parts"]],
+            row_count=data["row_count"],
+        )
+        logger.info(
+            "Resuming API extraction from checkpoint: %d records in %d pages, next %s",
+            spooled.row_count,
+            stats.pages_fetched,
+            "commit" if data["complete"] else state.checkpoint(),
+        )
+        return spooled, bool(data["complete"])
+
+    def save(
+        self,
+        spooled: _SpooledPages,
+        complete: bool,
+        *,
+        state: PaginationState,
+        stats: _FetchStats,
+    ) -> None:
+        """Record progress; every listed part must already be on disk."""
+        data = {
+            "version": CHECKPOINT_VERSION,
+            "fingerprint": self.fingerprint,
+            "updated_at": utc_now_iso(),
+            "state": state.checkpoint(),
+            "complete": complete,
+            "pages_fetched": stats.pages_fetched,
+            "total_requests": stats.total_requests,
+            "row_count": spooled.row_count,
+            "parts": [path.name for path in spooled.parts],
+        }
+        # Write-then-rename so a crash never leaves a torn checkpoint
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2))
+        os.replace(tmp_path, self.path)
+        logger.debug("Saved API checkpoint after %d pages", stats.pages_fetched)
+
+    def clear(self) -> None:
+        """Remove the checkpoint and its staged parts."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
 
 @dataclass
 class ApiSource:
@@ -831,9 +1332,12 @@ class ApiSource:
     # Data extraction
     data_path: Optional[str] = None  # Path to records in response (e.g., "data.items")
 
-    # Rate limiting
+    # Rate limiting, shared by every source calling the same host (or the
+    # same rate_limit_key) in this process
     requests_per_second: Optional[float] = None
     burst_size: Optional[int] = None
+    max_in_flight: Optional[int] = None  # Concurrent requests allowed
+    rate_limit_key: Optional[str] = None  # Named budget (default: API host)
 
     # Watermarking for incremental loads
     watermark_column: Optional[str] = None  # Column in response with timestamp
@@ -855,6 +1359,19 @@ class ApiSource:
     write_checksums: bool = True
     write_metadata: bool = True
 
+    # Records per staged Parquet part; bounds extraction memory
+    chunk_size: int = DEFAULT_API_CHUNK_SIZE
+
+    # Checkpoint pagination progress and staged parts every N pages so a
+    # failed run resumes where it stopped (0 = disabled)
+    checkpoint_pages: int = 0
+
+    # Revalidate pages with ETag/Last-Modified against a local response
+    # cache; when every page is unchanged the partition is written from the
+    # cached bodies and marked unchanged, without downloading them again
+    response_cache: bool = False
+    response_cache_max_mb: int = 256
+
     def __post_init__(self) -> None:
         """Validate configuration on instantiation."""
         errors = self._validate()
@@ -885,6 +1402,15 @@ class ApiSource:
         if not self.target_path:
             errors.append("target_path is required")
 
+        if self.chunk_size < 1:
+            errors.append("chunk_size must be at least 1")
+
+        if self.checkpoint_pages < 0:
+            errors.append("checkpoint_pages must be 0 (disabled) or positive")
+
+        if self.response_cache_max_mb < 1:
+            errors.append("response_cache_max_mb must be at least 1")
+
         # Watermark validation
         if self.watermark_column and not self.watermark_param:
             logger.warning(
@@ -954,41 +1480,50 @@ class ApiSource:
                     last_watermark,
                 )
 
-        # Fetch records from API
-        records, pages_fetched, total_requests = self._fetch_all(
-            run_date, last_watermark
-        )
-
-        if not records:
-            logger.warning(
-                "No records fetched from API for %s.%s", self.system, self.entity
+        # Stream pages to local staging; records are never all in memory
+        stats = _FetchStats()
+        state = self._build_pagination_state(last_watermark)
+        with (
+            self._response_cache() as cache,
+            self._staged_pages(run_date, state, stats, cache) as spooled,
+        ):
+            unchanged = bool(stats.not_modified) and (
+                stats.not_modified == stats.pages_fetched
             )
-            return {
-                "row_count": 0,
-                "target": target,
-                "pages_fetched": pages_fetched,
-                "total_requests": total_requests,
-            }
+            if unchanged:
+                # The partition still has to exist for downstream Silver
+                # runs, so it is written from the cached bodies
+                logger.info(
+                    "API response for %s.%s unchanged since last run; "
+                    "writing the partition from the response cache",
+                    self.system,
+                    self.entity,
+                )
 
-        # Add Bronze metadata
-        now = utc_now_iso()
-        for record in records:
-            record["_load_date"] = run_date
-            record["_extracted_at"] = now
-            record["_source_system"] = self.system
-            record["_source_entity"] = self.entity
-
-        # Write to target
-        result = self._write(
-            records, target, run_date, last_watermark, pages_fetched, total_requests
-        )
+            if not spooled.row_count:
+                logger.warning(
+                    "No records fetched from API for %s.%s", self.system, self.entity
+                )
+                return {
+                    "row_count": 0,
+                    "target": target,
+                    "pages_fetched": stats.pages_fetched,
+                    "total_requests": stats.total_requests,
+                }
+
+            result = self._write(
+                spooled,
+                target,
+                run_date,
+                last_watermark,
+                stats.pages_fetched,
+                stats.total_requests,
+                unchanged=unchanged,
+            )
 
         # Save new watermark if applicable
-        if self.watermark_column and records:
-            new_watermark = self._compute_max_watermark(records)
-            if new_watermark:
-                save_watermark(self.system, self.entity, str(new_watermark))
-                result["new_watermark"] = str(new_watermark)
+        if result.get("new_watermark"):
+            save_watermark(self.system, self.entity, result["new_watermark"])
 
         return result
 
@@ -1014,73 +1549,100 @@ class ApiSource:
         run_date: str,
         last_watermark: Optional[str],
     ) -> tuple[List[Dict[str, Any]], int, int]:
-        """Fetch all records from the API with pagination.
+        """Fetch all records from the API into memory.
+
+        run() streams pages to staging instead; this is kept for callers
+        that want the records as a list.
 
         Returns:
             Tuple of (records, pages_fetched, total_requests)
         """
-        headers, auth_tuple = build_auth_headers(self.auth, extra_headers=self.headers)
-        headers.setdefault("User-Agent", _USER_AGENT)
-
-        endpoint = self._format_endpoint()
+        stats = _FetchStats()
+        state = self._build_pagination_state(last_watermark)
+        records = [record for page in self._iter_pages(state, stats) for record in page]
+        return records, stats.pages_fetched, stats.total_requests
 
+    def _build_pagination_state(self, last_watermark: Optional[str]) -> PaginationState:
+        """Create the pagination state, with the watermark in its params."""
         base_params = dict(expand_options(self.params))
         if last_watermark and self.watermark_param:
             base_params[self.watermark_param] = last_watermark
 
-        limiter = None
-        if self.requests_per_second:
-            limiter = RateLimiter(
-                self.requests_per_second,
-                burst_size=self.burst_size,
-            )
-
         pagination_config = self.pagination or PaginationConfig(
             strategy=PaginationStrategy.NONE
         )
-        state = build_pagination_state(pagination_config, base_params)
+        return build_pagination_state(pagination_config, base_params)
+
+    def _iter_pages(
+        self,
+        state: PaginationState,
+        stats: "_FetchStats",
+        cache: Optional[ResponseCache] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Fetch the API page by page, yielding each page's records.
+
+        Only the page being consumed is held by this generator, so callers
+        can stream records out without accumulating them. stats and state
+        are advanced before each page is yielded, so while the caller holds
+        a page they describe where the next page starts. With a cache, each
+        page is a conditional request answered from the cache on 304.
+        """
+        headers, auth_tuple = build_auth_headers(self.auth, extra_headers=self.headers)
+        headers.setdefault("User-Agent", _USER_AGENT)
 
-        all_records: List[Dict[str, Any]] = []
-        pages_fetched = 0
-        total_requests = 0
+        endpoint = self._format_endpoint()
+        limiter = self._get_rate_limiter()
+        pagination_config = state.config
 
         with self._create_httpx_client() as client:
-            while state.should_fetch_more():
-                if limiter:
-                    limiter.acquire()
+            if pagination_config.concurrency > 1 and state.random_access:
+                yield from self._iter_concurrent_pages(
+                    client=client,
+                    state=state,
+                    endpoint=endpoint,
+                    headers=headers,
+                    auth=auth_tuple,
+                    limiter=limiter,
+                    stats=stats,
+                    cache=cache,
+                )
+                return
 
+            while state.should_fetch_more():
                 params = state.build_params()
-                response, attempts = self._fetch_page_with_retry(
+                data, attempts, not_modified = self._fetch_page_data(
                     client=client,
                     endpoint=endpoint,
                     headers=headers,
                     params=params,
                     auth=auth_tuple,
+                    limiter=limiter,
+                    cache=cache,
                 )
-                total_requests += attempts
-                pages_fetched += 1
+                stats.total_requests += attempts
+                stats.pages_fetched += 1
+                stats.not_modified += not_modified
 
-                data = response.json()
                 records = self._extract_records(data)
 
                 if not records:
                     break
 
-                all_records.extend(records)
-
+                records = stats.take(records, state.max_records)
                 logger.info(
                     "Fetched %d records %s (total: %d)",
                     len(records),
                     state.describe(),
-                    len(all_records),
+                    stats.records,
                 )
+                more = state.on_response(records, data)
+                yield records
 
-                if state.max_records > 0 and len(all_records) >= state.max_records:
-                    all_records = all_records[: state.max_records]
+                if stats.limit_reached(state.max_records):
                     logger.info("Reached max_records limit of %d", state.max_records)
                     break
 
-                if not state.on_response(records, data):
+                if not more:
                     break
 
         if isinstance(state, PagePaginationState) and state.max_pages_limit_hit:
@@ -1088,14 +1650,232 @@ class ApiSource:
 
         logger.info(
             "Successfully fetched %d records from %s.%s in %d pages (%d requests)",
-            len(all_records),
+            stats.records,
             self.system,
             self.entity,
-            pages_fetched,
-            total_requests,
+            stats.pages_fetched,
+            stats.total_requests,
+        )
+
+    def _iter_concurrent_pages(
+        self,
+        *,
+        client: httpx.Client,
+        state: PaginationState,
+        endpoint: str,
+        headers: Dict[str, str],
+        auth: Optional[tuple[str, str]],
+        limiter: Optional[RateLimiter],
+        stats: "_FetchStats",
+        cache: Optional[ResponseCache] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Fetch offset/page paginated records with pages in flight in parallel.
+
+        Keeps up to ``concurrency`` pages requested ahead of the page being
+        consumed, all sharing one httpx client and rate limiter. Pages are
+        yielded in order, so records keep their API order, and the first
+        empty or short page ends the fetch; requests already issued past it
+        are discarded (and still counted in total_requests).
+        """
+        config = state.config
+        limit = state.page_limit()
+
+        def fetch(index: int) -> tuple[List[Dict[str, Any]], int, bool]:
+            data, attempts, not_modified = self._fetch_page_data(
+                client=client,
+                endpoint=endpoint,
+                headers=headers,
+                params=state.params_for_page(index),
+                auth=auth,
+                limiter=limiter,
+                cache=cache,
+            )
+            return self._extract_records(data), attempts, not_modified
+
+        pending: Dict[int, Future[tuple[List[Dict[str, Any]], int, bool]]] = {}
+        next_index = state.page_index
+
+        with ThreadPoolExecutor(
+            max_workers=config.concurrency, thread_name_prefix="api-page"
+        ) as pool:
+            try:
+                for index in itertools.count(state.page_index):
+                    while len(pending) < config.concurrency and (
+                        limit is None or next_index < limit
+                    ):
+                        pending[next_index] = pool.submit(fetch, next_index)
+                        next_index += 1
+                    if index not in pending:
+                        if config.max_pages and index >= config.max_pages:
+                            logger.info(
+                                "Reached max_pages limit of %d", config.max_pages
+                            )
+                        break
+
+                    records, attempts, not_modified = pending.pop(index).result()
+                    stats.total_requests += attempts
+                    stats.pages_fetched += 1
+                    stats.not_modified += not_modified
+                    if not records:
+                        break
+
+                    records = stats.take(records, state.max_records)
+                    logger.info(
+                        "Fetched %d records from page %d (total: %d)",
+                        len(records),
+                        index + 1,
+                        stats.records,
+                    )
+                    # Pages are consumed in order, so the state can advance
+                    # exactly as in a sequential fetch
+                    more = state.on_response(records, None)
+                    yield records
+
+                    if stats.limit_reached(state.max_records):
+                        logger.info(
+                            "Reached max_records limit of %d", state.max_records
+                        )
+                        break
+                    if not more:
+                        break
+            finally:
+                for future in pending.values():
+                    future.cancel()
+
+        # Pages requested past the end of the data were still sent
+        stats.total_requests += sum(
+            future.result()[1]
+            for future in pending.values()
+            if not future.cancelled() and future.exception() is None
+        )
+
+        logger.info(
+            "Successfully fetched %d records from %s.%s in %d pages "
+            "(%d requests, concurrency %d)",
+            stats.records,
+            self.system,
+            self.entity,
+            stats.pages_fetched,
+            stats.total_requests,
+            config.concurrency,
+        )
+
+    @contextmanager
+    def _response_cache(self) -> Iterator[Optional[ResponseCache]]:
+        """Open the response cache for one run, if enabled.
+
+        Responses fetched during the run are committed only when the block
+        completes, so validators never outlive a failed Bronze write.
+        """
+        if not self.response_cache:
+            yield None
+            return
+
+        cache = ResponseCache(
+            get_staging_root() / RESPONSE_CACHE_DIRNAME,
+            max_bytes=self.response_cache_max_mb * 1024 * 1024,
         )
+        try:
+            yield cache
+        except BaseException:
+            cache.discard()
+            raise
+        cache.commit()
+
+    @contextmanager
+    def _staged_pages(
+        self,
+        run_date: str,
+        state: PaginationState,
+        stats: "_FetchStats",
+        cache: Optional[ResponseCache] = None,
+    ) -> Iterator["_SpooledPages"]:
+        """Fetch every page into staged parts and yield them for the write.
+
+        Without checkpoint_pages the parts live in a private staging area
+        that is removed on exit. With it, they live in a checkpoint
+        directory that survives a failure, so the next run resumes from the
+        last checkpoint; it is removed once the block completes.
+        """
+        if not self.checkpoint_pages:
+            with staging_area(self.entity) as staging_dir:
+                yield self._spool_pages(
+                    self._iter_pages(state, stats, cache), staging_dir
+                )
+            return
+
+        checkpoint = _PaginationCheckpoint.for_run(self, run_date, state)
+        spooled, complete = checkpoint.resume(state, stats)
+        yield self._spool_pages(
+            iter(()) if complete else self._iter_pages(state, stats, cache),
+            checkpoint.directory,
+            spooled,
+            checkpoint=partial(checkpoint.save, state=state, stats=stats),
+        )
+        checkpoint.clear()
 
-        return all_records, pages_fetched, total_requests
+    def _spool_pages(
+        self,
+        pages: Iterable[List[Dict[str, Any]]],
+        staging_dir: Path,
+        spooled: Optional["_SpooledPages"] = None,
+        checkpoint: Optional[Callable[["_SpooledPages", bool], None]] = None,
+    ) -> "_SpooledPages":
+        """Stream pages into staged Parquet parts of about chunk_size records.
+
+        Each full chunk is converted to Arrow and written on a background
+        thread while the next pages are fetched. At most one chunk is being
+        written while the next one fills, so memory stays bounded by about
+        two chunks however many records the API returns.
+
+        With checkpoint, every checkpoint_pages pages the pending chunk is
+        flushed and, once all parts are on disk, checkpoint(spooled, False)
+        is called; checkpoint(spooled, True) follows the last page. Passing
+        the spooled parts of an earlier run appends to them.
+        """
+        spooled = spooled or _SpooledPages()
+        chunk: List[Dict[str, Any]] = []
+        writing: Optional[Future[None]] = None
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="api-spool") as pool:
+
+            def wait_for_write() -> None:
+                nonlocal writing
+                if writing is not None:
+                    writing.result()
+                writing = None
+
+            def flush() -> None:
+                nonlocal chunk, writing
+                wait_for_write()
+                path = staging_dir / f"part-{len(spooled.parts):05d}.parquet"
+                spooled.parts.append(path)
+                writing = pool.submit(self._write_part, chunk, path)
+                chunk = []
+
+            for count, page in enumerate(pages, 1):
+                chunk.extend(page)
+                spooled.row_count += len(page)
+                if len(chunk) >= self.chunk_size:
+                    flush()
+                if checkpoint and count % self.checkpoint_pages == 0:
+                    if chunk:
+                        flush()
+                    wait_for_write()
+                    checkpoint(spooled, False)
+            if chunk:
+                flush()
+            wait_for_write()
+            if checkpoint:
+                checkpoint(spooled, True)
+
+        return spooled
+
+    def _write_part(self, records: List[Dict[str, Any]], path: Path) -> None:
+        """Write one chunk of records to a staged Parquet part."""
+        import pyarrow.parquet as pq
+
+        pq.write_table(records_to_arrow(records), str(path))
 
     def _extract_records(self, data: Any) -> List[Dict[str, Any]]:
         """Extract records from API response.
@@ -1125,32 +1905,136 @@ class ApiSource:
             logger.warning("Unexpected data type: %s", type(data))
             return []
 
-    def _watermark_sort_key(self, value: Any) -> Any:
-        """Convert watermark value to comparable form for sorting."""
-        if isinstance(value, datetime):
-            return value
-        if isinstance(value, (int, float)):
-            return value
-        # Try parsing string as datetime
-        try:
-            return parse_iso_datetime(value)
-        except ValueError:
+    def _watermark_sort_key(self, value: Any) -> Tuple[int, Any]:
+        """Convert watermark value to comparable form for sorting.
+
+        Numbers (including numeric strings) sort before timestamps and
+        timestamps before other strings, so mixed values never fail to
+        compare. Naive timestamps are taken as UTC.
+        """
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return (0, value)
+        if not isinstance(value, datetime):
+            text = str(value)
+            for number in (int, float):
+                try:
+                    return (0, number(text))
+                except ValueError:
+                    pass
+            # Try parsing string as datetime
             try:
-                return datetime.strptime(str(value)[:10], "%Y-%m-%d")
+                value = parse_iso_datetime(text)
             except ValueError:
-                return str(value)
+                try:
+                    value = datetime.strptime(text[:10], "%Y-%m-%d")
+                except ValueError:
+                    return (2, text)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return (1, value)
 
     def _compute_max_watermark(self, records: List[Dict[str, Any]]) -> Optional[str]:
         """Compute the maximum watermark value from records."""
+        import pyarrow as pa
+
         if not self.watermark_column:
             return None
 
-        values = [
-            r[self.watermark_column]
-            for r in records
-            if self.watermark_column in r and r[self.watermark_column] is not None
-        ]
+        values = [r.get(self.watermark_column) for r in records]
+        try:
+            column = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return self._max_watermark_value([v for v in values if v is not None])
+        return self._max_watermark_in_column(column)
+
+    def _max_watermark_in_column(self, column: Any) -> Optional[str]:
+        """Compute the maximum watermark value of an Arrow column.
+
+        The original value of the maximum row is returned, so the watermark
+        keeps the API's formatting.
+        """
+        try:
+            max_val = self._max_watermark_row(column)
+        except (TypeError, ValueError) as e:
+            logger.warning(
+                "Could not compute max watermark from '%s': %s",
+                self.watermark_column,
+                e,
+            )
+            return None
+        if max_val is None:
+            return None
+        return max_val.isoformat() if hasattr(max_val, "isoformat") else str(max_val)
+
+    def _max_watermark_row(self, column: Any) -> Any:
+        """Original value of the row holding an Arrow column's maximum.
+
+        Temporal and numeric columns are reduced with Arrow compute. String
+        columns are parsed to timestamps (naive, or UTC when the values
+        carry zone offsets) or numbers in one vectorized cast; only columns
+        Arrow cannot parse fall back to comparing values one by one in
+        Python.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        column = column.drop_null()
+        if not len(column):
+            return None
+
+        keys = column
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            keys = None
+            for key_type in (
+                pa.timestamp("us"),
+                pa.timestamp("us", tz="UTC"),
+                pa.int64(),
+                pa.float64(),
+            ):
+                try:
+                    keys = pc.cast(column, key_type)
+                    break
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    continue
+        elif not (
+            pa.types.is_temporal(column.type)
+            or pa.types.is_integer(column.type)
+            or pa.types.is_floating(column.type)
+        ):
+            keys = None
+
+        if keys is None:
+            return max(column.to_pylist(), key=self._watermark_sort_key)
+
+        index = pc.index(keys, pc.max(keys)).as_py()
+        return column[index].as_py()
+
+    def _staged_watermark(self, t: Any) -> Optional[str]:
+        """Maximum watermark over the staged parts read back as one table.
+
+        Parts are unified by name, so the column has one type across parts
+        and values are compared as numbers or timestamps, not as strings.
+        The column is reduced one record batch at a time; each batch's
+        maximum row is kept and the maxima are reduced again.
+        """
+        import pyarrow as pa
+
+        if self.watermark_column not in t.columns:
+            return None
+
+        maxima: List[Any] = []
+        column_type = None
+        for batch in t.select(self.watermark_column).to_pyarrow_batches():
+            column_type = batch.schema.types[0]
+            batch_max = self._max_watermark_row(batch.column(0))
+            if batch_max is not None:
+                maxima.append(batch_max)
+        if not maxima:
+            return None
+        return self._max_watermark_in_column(pa.array(maxima, type=column_type))
 
+    def _max_watermark_value(self, values: List[Any]) -> Optional[str]:
+        """Return the largest watermark value as a string."""
         if not values:
             return None
 
@@ -1169,28 +2053,37 @@ class ApiSource:
 
     def _write(
         self,
-        records: List[Dict[str, Any]],
+        spooled: _SpooledPages,
         target: str,
         run_date: str,
         last_watermark: Optional[str],
         pages_fetched: int,
         total_requests: int,
+        *,
+        unchanged: bool = False,
     ) -> Dict[str, Any]:
-        """Write records to target with metadata and checksums."""
+        """Write staged parts to target with metadata and checksums.
+
+        The parts are read back as one table (pages may differ in which
+        fields they carry, so columns are unified by name) and the Bronze
+        metadata columns are added as literals while streaming the write.
+        The new watermark is the maximum of that table's watermark column.
+        With unchanged (every page answered 304 from the response cache),
+        the metadata and result record "unchanged": true.
+        """
         import ibis  # type: ignore[import-untyped]
 
-        if not records:
-            logger.warning("api_no_records", system=self.system, entity=self.entity)
-            return {
-                "row_count": 0,
-                "target": target,
-                "pages_fetched": pages_fetched,
-                "total_requests": total_requests,
-            }
-
-        # Create Ibis table from records
-        t = ibis.memtable(records)
-        columns = infer_column_types(records)
+        t = get_engine().read_parquet(
+            [str(path) for path in spooled.parts], union_by_name=True
+        )
+        new_watermark = self._staged_watermark(t) if self.watermark_column else None
+        t = t.mutate(
+            _load_date=ibis.literal(run_date),
+            _extracted_at=ibis.literal(utc_now_iso()),
+            _source_system=ibis.literal(self.system),
+            _source_entity=ibis.literal(self.entity),
+        )
+        columns = infer_column_types(t)
 
         # API-specific metadata
         api_extra = {
@@ -1203,6 +2096,8 @@ class ApiSource:
             "pages_fetched": pages_fetched,
             "total_requests": total_requests,
         }
+        if unchanged:
+            api_extra["unchanged"] = True
 
         # Write using unified artifact writer
         write_result = write_artifacts(
@@ -1214,6 +2109,7 @@ class ApiSource:
             extra_metadata=api_extra,
             write_metadata=self.write_metadata,
             write_checksums=self.write_checksums,
+            row_count=spooled.row_count,
             checksum_extra={
                 "system": self.system,
                 "entity": self.entity,
@@ -1242,6 +2138,10 @@ class ApiSource:
             result["metadata_file"] = write_result.metadata_file
         if write_result.checksums_file:
             result["checksums_file"] = write_result.checksums_file
+        if new_watermark:
+            result["new_watermark"] = new_watermark
+        if unchanged:
+            result["unchanged"] = True
 
         return result
 
@@ -1251,10 +2151,24 @@ class ApiSource:
             endpoint = endpoint.replace(f"{{{key}}}", expand_env_vars(value))
         return endpoint
 
+    def _get_rate_limiter(self) -> Optional[RateLimiter]:
+        """Return the shared limiter for this source's host or budget."""
+        if not (self.requests_per_second or self.max_in_flight):
+            return None
+        key = self.rate_limit_key or httpx.URL(self.base_url).host or self.base_url
+        return get_rate_limiter(
+            key,
+            self.requests_per_second,
+            burst_size=self.burst_size,
+            max_in_flight=self.max_in_flight,
+        )
+
     def _create_httpx_client(self) -> httpx.Client:
         base_url = self.base_url.rstrip("/")
+        # Concurrent pagination needs a connection per page in flight
+        concurrency = self.pagination.concurrency if self.pagination else 1
         limits = httpx.Limits(
-            max_connections=self.pool_maxsize,
+            max_connections=max(self.pool_maxsize, concurrency),
             max_keepalive_connections=self.pool_connections,
         )
         return httpx.Client(
@@ -1271,6 +2185,7 @@ class ApiSource:
         headers: Dict[str, str],
         params: Dict[str, Any],
         auth: Optional[tuple[str, str]],
+        limiter: Optional[RateLimiter] = None,
     ) -> tuple[httpx.Response, int]:
         attempts = 0
 
@@ -1289,23 +2204,80 @@ class ApiSource:
             nonlocal attempts
             attempts += 1
             logger.debug("Fetching %s with params %s", endpoint, params)
-            response = client.get(
-                endpoint,
-                headers=headers,
-                params=params,
-                auth=auth,
-                timeout=self.timeout,
-            )
+            with limiter.slot() if limiter else nullcontext():
+                response = client.get(
+                    endpoint,
+                    headers=headers,
+                    params=params,
+                    auth=auth,
+                    timeout=self.timeout,
+                )
+            if limiter:
+                limiter.observe(response.headers)
+            if response.status_code == httpx.codes.NOT_MODIFIED:
+                return response  # Conditional request; the caller has the body
             try:
                 response.raise_for_status()
             except httpx.HTTPStatusError as exc:
-                if exc.response and exc.response.status_code == 429:
+                # A shared limiter already pauses all callers for Retry-After
+                if not limiter and exc.response and exc.response.status_code == 429:
                     self._respect_retry_after(exc.response)
                 raise
             return response
 
         return do_request(), attempts
 
+    def _fetch_page_data(
+        self,
+        *,
+        client: httpx.Client,
+        endpoint: str,
+        headers: Dict[str, str],
+        params: Dict[str, Any],
+        auth: Optional[tuple[str, str]],
+        limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+    ) -> tuple[Any, int, bool]:
+        """Fetch one page's JSON, revalidating it against the response cache.
+
+        Returns:
+            Tuple of (parsed body, attempts, whether the server answered 304)
+        """
+        fetch = partial(
+            self._fetch_page_with_retry,
+            client=client,
+            endpoint=endpoint,
+            params=params,
+            auth=auth,
+            limiter=limiter,
+        )
+        if cache is None:
+            response, attempts = fetch(headers=headers)
+            return response.json(), attempts, False
+
+        key = cache.key(f"{self.base_url.rstrip('/')}{endpoint}", params, headers, auth)
+        cached = cache.get(key)
+        response, attempts = fetch(
+            headers={**headers, **cached.conditional_headers()} if cached else headers
+        )
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            if cached:
+                try:
+                    return json.loads(cached.read()), attempts, True
+                except OSError:
+                    pass  # Evicted since the lookup
+            # No cached body to reuse; fetch the page without validators
+            plain = {
+                name: value
+                for name, value in headers.items()
+                if name.lower() not in ("if-none-match", "if-modified-since")
+            }
+            response, retries = fetch(headers=plain)
+            attempts += retries
+
+        cache.stage(key, response)
+        return response.json(), attempts, False
+
     def _should_retry(self, exc: BaseException) -> bool:
         if isinstance(exc, httpx.HTTPStatusError):
             status_code = exc.response.status_code if exc.response else None
@@ -1351,11 +2323,17 @@ def create_api_source_from_options(
         - page_size: Records per page
         - data_path: Path to records in response
         - requests_per_second: Rate limit
+        - max_in_flight: Maximum concurrent requests
+        - rate_limit_key: Named budget shared across sources (default: host)
         - watermark_column: Column for incremental loads
         - watermark_param: Query param for watermark
         - headers: Additional headers dict
         - params: Additional query params dict
         - path_params: URL path substitutions
+        - chunk_size: Records per staged Parquet part (default: 50,000)
+        - checkpoint_pages: Checkpoint progress every N pages (default: 0 = off)
+        - response_cache: Revalidate pages with ETag/Last-Modified (default: off)
+        - response_cache_max_mb: Response cache size limit (default: 256)
 
     Args:
         system: Source system name
@@ -1400,6 +2378,8 @@ def create_api_source_from_options(
         data_path=options.get("data_path"),
         requests_per_second=options.get("requests_per_second"),
         burst_size=options.get("burst_size"),
+        max_in_flight=options.get("max_in_flight"),
+        rate_limit_key=options.get("rate_limit_key"),
         watermark_column=options.get("watermark_column"),
         watermark_param=options.get("watermark_param"),
         headers=options.get("headers", {}),
@@ -1409,4 +2389,8 @@ def create_api_source_from_options(
         max_retries=options.get("max_retries", 3),
         write_checksums=options.get("write_checksums", True),
         write_metadata=options.get("write_metadata", True),
+        chunk_size=options.get("chunk_size", DEFAULT_API_CHUNK_SIZE),
+        checkpoint_pages=options.get("checkpoint_pages", 0),
+        response_cache=options.get("response_cache", False),
+        response_cache_max_mb=options.get("response_cache_max_mb", 256),
     )
@@ -24,22 +24,40 @@ Usage:
 
 from __future__ import annotations
 
-import io
-from dataclasses import dataclass
+import math
+import os
+import shutil
+import uuid
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Tuple,
+    Union,
+)
 
+import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
+from pipelines.lib.catalog import update_catalog
 from pipelines.lib.checksum import (
-    compute_bytes_sha256,
+    HashingWriter,
+    resolve_checksum_algorithm,
     write_checksum_manifest,
     write_checksum_manifest_s3,
 )
 from pipelines.lib.io import OutputMetadata, utc_now_iso
 from pipelines.lib.observability import get_structlog_logger
 from pipelines.lib.storage import get_storage, parse_uri
-from pipelines.lib.storage_config import _configure_duckdb_s3, _extract_storage_options
+from pipelines.lib.engine import get_engine
+from pipelines.lib.storage_config import _extract_storage_options
 
 if TYPE_CHECKING:
     import ibis  # type: ignore[import-untyped]
@@ -48,30 +66,97 @@ logger = get_structlog_logger(__name__)
 
 __all__ = ["write_artifacts", "WriteResult"]
 
+# Read size when hashing files that were not hashed while being written
+_HASH_CHUNK_SIZE = 1024 * 1024
 
-# Helper wrappers to avoid mypy false positives around Ibis bindings
 
+def _sql_literal(value: Any) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
 
-def _duck_to_parquet(
-    duck_table: Any, target: str, partition_cols: Optional[Union[str, Tuple[str, ...]]]
-) -> List[str]:
-    """Write parquet via DuckDB Ibis table and return generated path list."""
-    duck_table.to_parquet(target, partition_by=partition_cols)
-    return [target]
 
+def _sql_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
 
-def _table_to_parquet_local(
-    table: Any,
-    output_dir: Path,
-    output_file: Path,
-    partition_cols: Optional[Union[str, Tuple[str, ...]]] = None,
-) -> List[str]:
-    """Write parquet locally, optionally partitioned."""
-    if partition_cols is None:
-        table.to_parquet(str(output_file))
-    else:
-        table.to_parquet(str(output_dir), partition_by=partition_cols)
-    return [str(output_file)]
+
+@dataclass
+class _WritePass:
+    """What the write pass learns about the data while writing it.
+
+    Streamed Parquet writes hash each file and fold every record batch into
+    per-column stats, so nothing has to be read back afterwards. Files
+    written by DuckDB (Hive partitioning) are profiled the same way but
+    hashed afterwards. files lists every data file written, relative to
+    the target.
+    """
+
+    algorithm: str = "sha256"
+    files: List[str] = field(default_factory=list)
+    digests: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    column_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+def _update_column_stats(
+    stats: Dict[str, Dict[str, Any]], batch: "pa.RecordBatch"
+) -> None:
+    """Fold one record batch into running min/max/null counts per column."""
+    for name, column in zip(batch.schema.names, batch.columns):
+        entry = stats.setdefault(name, {"min": None, "max": None, "null_count": 0})
+        entry["null_count"] += column.null_count
+        if column.null_count == len(column):
+            continue
+        try:
+            bounds = pc.min_max(column)
+        except (pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            # Nested and binary types have no ordering
+            continue
+        low, high = bounds["min"].as_py(), bounds["max"].as_py()
+        if low is None or high is None:
+            continue
+        try:
+            entry["min"] = low if entry["min"] is None else min(entry["min"], low)
+            entry["max"] = high if entry["max"] is None else max(entry["max"], high)
+        except TypeError:
+            entry["min"] = entry["max"] = None
+
+
+def _stat_value(value: Any) -> Any:
+    """Make a min/max value JSON-safe (timestamps and decimals as strings)."""
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return None if math.isnan(value) else value
+    if isinstance(value, (bytes, bytearray)):
+        return None
+    return str(value)
+
+
+def _write_parquet_batches(
+    table: "ibis.Table",
+    sink: Any,
+    compression: str,
+    chunk_size: Optional[int] = None,
+    column_stats: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> int:
+    """Stream a table into a Parquet sink one record batch at a time.
+
+    Each batch becomes its own row group, so only one batch of rows is held
+    in memory regardless of table size. When column_stats is given, each
+    batch's min/max/null counts are folded into it.
+
+    Returns:
+        Number of rows written
+    """
+    batch_kwargs = {"chunk_size": chunk_size} if chunk_size else {}
+    reader = table.to_pyarrow_batches(**batch_kwargs)
+    rows = 0
+    with pq.ParquetWriter(sink, reader.schema, compression=compression) as writer:
+        for batch in reader:
+            if batch.num_rows:
+                writer.write_batch(batch)
+                rows += batch.num_rows
+                if column_stats is not None:
+                    _update_column_stats(column_stats, batch)
+    return rows
 
 
 @dataclass
@@ -83,6 +168,8 @@ class WriteResult:
     data_files: List[str]
     metadata_file: Optional[str] = None
     checksums_file: Optional[str] = None
+    high_watermark: Optional[str] = None
+    column_stats: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to result dictionary."""
@@ -99,12 +186,13 @@ class WriteResult:
 
 
 def write_artifacts(
-    table: "ibis.Table",
+    table: Union["ibis.Table", Sequence["ibis.Table"]],
     target: str,
     entity_name: str,
     columns: List[Dict[str, Any]],
     run_date: str,
     *,
+    row_count: Optional[int] = None,
     extra_metadata: Optional[Dict[str, Any]] = None,
     storage_options: Optional[Dict[str, Any]] = None,
     write_metadata: bool = True,
@@ -112,6 +200,10 @@ def write_artifacts(
     checksum_extra: Optional[Dict[str, Any]] = None,
     partition_by: Optional[List[str]] = None,
     compression: str = "snappy",
+    chunk_size: Optional[int] = None,
+    catalog: Optional[Dict[str, Any]] = None,
+    checksum_algorithm: Optional[str] = None,
+    watermark_column: Optional[str] = None,
 ) -> WriteResult:
     """Write table with metadata and checksum artifacts.
 
@@ -119,11 +211,13 @@ def write_artifacts(
     with consistent artifact generation.
 
     Args:
-        table: Ibis table to write
+        table: Ibis table to write, or a sequence of tables written as
+            separate part files (<entity>-part-0000.parquet, ...) in target
         target: Target directory path (local or s3://...)
         entity_name: Name for the parquet file (e.g., "orders" -> orders.parquet)
         columns: Column metadata list from infer_column_types()
         run_date: Run date string (YYYY-MM-DD)
+        row_count: Pre-computed row count; when None the table is counted
         extra_metadata: Additional fields for _metadata.json extra dict
         storage_options: S3/ADLS options (endpoint_url, key, secret, etc.)
         write_metadata: Whether to write _metadata.json
@@ -131,15 +225,26 @@ def write_artifacts(
         checksum_extra: Additional fields for checksum manifest
         partition_by: Columns to partition by (optional)
         compression: Parquet compression codec
+        chunk_size: Rows per streamed batch / Parquet row group (None = default)
+        catalog: Catalog fields (load_pattern, watermark) for this partition;
+            when given, the entity root's _catalog.json records the write
+        checksum_algorithm: Hash algorithm for _checksums.json (default:
+            PIPELINE_CHECKSUM_ALGORITHM, then sha256)
+        watermark_column: Column whose maximum is recorded as the
+            partition's new_watermark (in _metadata.json, the catalog and
+            WriteResult.high_watermark)
+
+    Per-column min/max/null counts gathered while writing are recorded in
+    _metadata.json as column_stats.
 
     Returns:
         WriteResult with file paths and row count
     """
-    # Execute count before writing (Ibis is lazy)
-    count_result = table.count().execute()
-    row_count = int(
-        count_result.iloc[0] if hasattr(count_result, "iloc") else count_result
-    )
+    # Execute count before writing (Ibis is lazy), unless the caller
+    # already knows it from a materialized source
+    tables, parquet_filenames = _plan_parts(table, entity_name, partition_by)
+    if row_count is None:
+        row_count = sum(_count_rows(t) for t in tables)
 
     if row_count == 0:
         logger.warning("write_artifacts_no_rows", target=target)
@@ -149,26 +254,48 @@ def write_artifacts(
     scheme, _ = parse_uri(target)
     is_cloud = scheme in ("s3", "abfs")
 
-    parquet_filename = f"{entity_name}.parquet"
     data_files: List[str] = []
+    # Digests and column stats are gathered while writing. The checksum
+    # algorithm is resolved first so a missing hash package fails the
+    # write before any data is written
+    observed = _WritePass(
+        algorithm=(
+            resolve_checksum_algorithm(checksum_algorithm)
+            if write_checksums
+            else "sha256"
+        )
+    )
     now = utc_now_iso()
 
-    if is_cloud:
-        data_files = _write_cloud(
-            table=table,
-            target=target,
-            parquet_filename=parquet_filename,
-            storage_options=storage_options,
-            partition_by=partition_by,
-            compression=compression,
-        )
-    else:
-        data_files = _write_local(
-            table=table,
-            target=target,
-            parquet_filename=parquet_filename,
-            partition_by=partition_by,
-        )
+    for part, parquet_filename in zip(tables, parquet_filenames):
+        if is_cloud:
+            data_files += _write_cloud(
+                table=part,
+                target=target,
+                parquet_filename=parquet_filename,
+                storage_options=storage_options,
+                partition_by=partition_by,
+                compression=compression,
+                chunk_size=chunk_size,
+                observed=observed,
+            )
+        else:
+            data_files += _write_local(
+                table=part,
+                target=target,
+                parquet_filename=parquet_filename,
+                partition_by=partition_by,
+                compression=compression,
+                chunk_size=chunk_size,
+                observed=observed,
+            )
+
+    column_stats = {
+        name: {key: _stat_value(value) for key, value in entry.items()}
+        for name, entry in observed.column_stats.items()
+    }
+    high = column_stats.get(watermark_column or "", {}).get("max")
+    high_watermark = None if high is None else str(high)
 
     # Create storage backend for artifact writes
     storage_opts = _extract_storage_options(storage_options) if storage_options else {}
@@ -179,13 +306,18 @@ def write_artifacts(
 
     # Write metadata
     if write_metadata:
+        extra = dict(extra_metadata or {})
+        if watermark_column:
+            extra["new_watermark"] = high_watermark
+        if column_stats:
+            extra["column_stats"] = column_stats
         metadata = OutputMetadata(
             row_count=row_count,
             columns=columns,
             written_at=now,
             run_date=run_date,
-            data_files=[parquet_filename],
-            extra=extra_metadata or {},
+            data_files=observed.files,
+            extra=extra,
         )
         storage.write_text("_metadata.json", metadata.to_json())
         metadata_file = "_metadata.json"
@@ -194,31 +326,79 @@ def write_artifacts(
     # Write checksums
     if write_checksums:
         if is_cloud:
-            _write_checksums_cloud(
+            written = _write_checksums_cloud(
                 storage=storage,
-                parquet_filename=parquet_filename,
+                parquet_filenames=observed.files,
                 row_count=row_count,
                 extra_metadata=checksum_extra,
+                file_data=observed.digests,
+                algorithm=observed.algorithm,
             )
         else:
             write_checksum_manifest(
                 Path(target),
-                [Path(target) / parquet_filename],
+                [Path(target) / name for name in observed.files],
                 row_count=row_count,
                 extra_metadata=checksum_extra or {},
+                file_data=observed.digests,
+                algorithm=observed.algorithm,
             )
-        checksums_file = "_checksums.json"
-        logger.debug("artifact_checksums_written", target=target)
+            written = True
+        if written:
+            checksums_file = "_checksums.json"
+            logger.debug("artifact_checksums_written", target=target)
+
+    # Record the partition in the entity catalog
+    if catalog is not None:
+        update_catalog(
+            target,
+            row_count=row_count,
+            files=observed.files,
+            columns=columns,
+            load_pattern=catalog.get("load_pattern"),
+            watermark=catalog.get("watermark") or high_watermark,
+            storage_options=storage_opts,
+        )
 
     return WriteResult(
         row_count=row_count,
         target=target,
-        data_files=data_files if not is_cloud else [parquet_filename],
+        data_files=data_files if not is_cloud else observed.files,
         metadata_file=metadata_file,
         checksums_file=checksums_file,
+        high_watermark=high_watermark,
+        column_stats=column_stats,
     )
 
 
+def _plan_parts(
+    table: Union["ibis.Table", Sequence["ibis.Table"]],
+    entity_name: str,
+    partition_by: Optional[List[str]],
+) -> Tuple[List["ibis.Table"], List[str]]:
+    """Pair each table to write with its Parquet file name.
+
+    A single table is written as <entity>.parquet. A sequence of tables
+    (e.g., range-partitioned extraction) is written as numbered part files,
+    unless partition_by is set, in which case the parts are unioned and
+    the Hive-partitioned layout decides file names.
+    """
+    if not isinstance(table, (list, tuple)):
+        return [table], [f"{entity_name}.parquet"]
+
+    parts = list(table)
+    if partition_by or len(parts) < 2:
+        combined = parts[0].union(*parts[1:]) if len(parts) > 1 else parts[0]
+        return [combined], [f"{entity_name}.parquet"]
+    return parts, [f"{entity_name}-part-{i:04d}.parquet" for i in range(len(parts))]
+
+
+def _count_rows(table: "ibis.Table") -> int:
+    """Execute a row count (Ibis is lazy)."""
+    count_result = table.count().execute()
+    return int(count_result.iloc[0] if hasattr(count_result, "iloc") else count_result)
+
+
 def _write_cloud(
     table: "ibis.Table",
     target: str,
@@ -226,41 +406,47 @@ def _write_cloud(
     storage_options: Optional[Dict[str, Any]],
     partition_by: Optional[List[str]],
     compression: str,
+    chunk_size: Optional[int] = None,
+    observed: Optional[_WritePass] = None,
 ) -> List[str]:
-    """Write parquet to cloud storage (S3/ADLS)."""
-    import ibis
+    """Write parquet to cloud storage (S3/ADLS).
 
+    Non-partitioned files are hashed and profiled as they stream out into
+    observed.
+    """
+    observed = observed if observed is not None else _WritePass()
     storage_opts = _extract_storage_options(storage_options) if storage_options else {}
     storage = get_storage(target, **storage_opts)
     storage.makedirs("")
 
-    # Non-partitioned - write via boto3 for reliable S3 endpoint handling
+    # Non-partitioned - stream through the backend for reliable endpoint
+    # handling. Batches are uploaded in parts as they are encoded, so
+    # memory stays bounded by the part size rather than the file size
     if partition_by is None or not partition_by:
-        arrow_table = table.to_pyarrow()
-        buffer = io.BytesIO()
-        pq.write_table(arrow_table, buffer, compression=compression)
-        parquet_bytes = buffer.getvalue()
-
-        result = storage.write_bytes(parquet_filename, parquet_bytes)
-        if not result.success:
-            raise RuntimeError(f"Failed to write parquet to cloud: {result.error}")
+        try:
+            with storage.open_write(parquet_filename) as sink:
+                tee = HashingWriter(sink, observed.algorithm)
+                _write_parquet_batches(
+                    table, tee, compression, chunk_size, observed.column_stats
+                )
+        except Exception as e:
+            raise RuntimeError(f"Failed to write parquet to cloud: {e}") from e
+        observed.digests[parquet_filename] = tee.file_entry(parquet_filename)
+        observed.files.append(parquet_filename)
         return [f"{target.rstrip('/')}/{parquet_filename}"]
 
     # Partitioned writes need DuckDB with S3 configured
-    con = ibis.duckdb.connect()
-    _configure_duckdb_s3(con, storage_options)
-    arrow_table = table.to_pyarrow()
-    duck_table = con.create_table("_temp_write", arrow_table)
-    # Ibis 11.0.0 has a bug with list syntax for partition_by
-    # Single column: pass as string; multiple columns: pass as tuple
-    if isinstance(partition_by, list):
-        partition_cols = (
-            partition_by[0] if len(partition_by) == 1 else tuple(partition_by)
-        )
-    else:
-        partition_cols = partition_by  # type: ignore[unreachable]
-
-    return _duck_to_parquet(duck_table, target, partition_cols)
+    return _write_partitioned(
+        table,
+        target,
+        get_engine(storage_options or {}),
+        storage,
+        parquet_filename,
+        partition_by,
+        compression,
+        chunk_size,
+        observed,
+    )
 
 
 def _write_local(
@@ -268,48 +454,149 @@ def _write_local(
     target: str,
     parquet_filename: str,
     partition_by: Optional[List[str]],
+    compression: str = "snappy",
+    chunk_size: Optional[int] = None,
+    observed: Optional[_WritePass] = None,
 ) -> List[str]:
-    """Write parquet to local filesystem."""
+    """Write parquet to local filesystem.
+
+    Non-partitioned files are hashed and profiled as they are written into
+    observed.
+    """
+    observed = observed if observed is not None else _WritePass()
     output_dir = Path(target)
     output_dir.mkdir(parents=True, exist_ok=True)
     output_file = output_dir / parquet_filename
 
     if partition_by is None or not partition_by:
-        table.to_parquet(str(output_file))
+        with output_file.open("wb") as f:
+            tee = HashingWriter(f, observed.algorithm)
+            _write_parquet_batches(
+                table, tee, compression, chunk_size, observed.column_stats
+            )
+        observed.digests[parquet_filename] = tee.file_entry(parquet_filename)
+        observed.files.append(parquet_filename)
         return [str(output_file)]
 
-    # Ibis 11.0.0 has a bug with list syntax for partition_by
-    # Single column: pass as string; multiple columns: pass as tuple
-    if isinstance(partition_by, list):
-        partition_cols = (
-            partition_by[0] if len(partition_by) == 1 else tuple(partition_by)
+    return _write_partitioned(
+        table,
+        str(output_dir),
+        get_engine(),
+        get_storage(str(output_dir)),
+        parquet_filename,
+        partition_by,
+        compression,
+        chunk_size,
+        observed,
+    )
+
+
+def _write_partitioned(
+    table: "ibis.Table",
+    target: str,
+    con: Any,
+    storage: Any,
+    parquet_filename: str,
+    partition_by: List[str],
+    compression: str,
+    chunk_size: Optional[int],
+    observed: _WritePass,
+) -> List[str]:
+    """Write a Hive-partitioned dataset with DuckDB, streaming the table.
+
+    The table's record batches are handed to a DuckDB COPY as an Arrow
+    stream, so no more than a few batches are in memory at once, whichever
+    database the table is bound to; column stats are folded from the
+    batches on their way through. Row groups are capped at chunk_size.
+    Files are named after parquet_filename plus a token unique to this
+    write, which is how the written files are told apart from any already
+    under target.
+    """
+    batch_kwargs = {"chunk_size": chunk_size} if chunk_size else {}
+    source = table.to_pyarrow_batches(**batch_kwargs)
+
+    def observe() -> Iterator[pa.RecordBatch]:
+        for batch in source:
+            if batch.num_rows:
+                _update_column_stats(observed.column_stats, batch)
+            yield batch
+
+    reader = pa.RecordBatchReader.from_batches(source.schema, observe())
+
+    stem = parquet_filename.rsplit(".parquet", 1)[0]
+    token = uuid.uuid4().hex[:12]
+    options = [
+        "FORMAT PARQUET",
+        f"COMPRESSION {_sql_literal(compression)}",
+        f"PARTITION_BY ({', '.join(_sql_identifier(c) for c in partition_by)})",
+        f"FILENAME_PATTERN {_sql_literal(f'{stem}-{token}-{{i}}')}",
+        "OVERWRITE_OR_IGNORE true",
+    ]
+    if chunk_size:
+        options.append(f"ROW_GROUP_SIZE {int(chunk_size)}")
+
+    # A cursor of its own: the table's stream may be running on the
+    # calling thread's connection, and a new query there would end it
+    view = f"_write_stream_{token}"
+    cursor = con.con.cursor()
+    try:
+        cursor.register(view, reader)
+        cursor.execute(
+            f"COPY (SELECT * FROM {_sql_identifier(view)}) "
+            f"TO {_sql_literal(target.rstrip('/'))} ({', '.join(options)})"
         )
-    else:
-        partition_cols = partition_by  # type: ignore[unreachable]
-    return _table_to_parquet_local(table, output_dir, output_file, partition_cols)
+    except Exception as e:
+        raise RuntimeError(f"Failed to write partitioned parquet: {e}") from e
+    finally:
+        cursor.close()
+
+    written = sorted(
+        name
+        for name in (
+            storage.relative_path(info.path)
+            for info in storage.list_files("", recursive=True)
+        )
+        if token in name.rsplit("/", 1)[-1] and name.endswith(".parquet")
+    )
+    observed.files.extend(written)
+    return [storage.get_full_path(name) for name in written]
 
 
 def _write_checksums_cloud(
     storage: Any,
-    parquet_filename: str,
+    parquet_filenames: List[str],
     row_count: int,
     extra_metadata: Optional[Dict[str, Any]],
-) -> None:
-    """Write checksum manifest to cloud storage."""
+    file_data: Optional[Dict[str, Dict[str, Any]]] = None,
+    algorithm: str = "sha256",
+) -> bool:
+    """Write checksum manifest to cloud storage.
+
+    Files with an entry in file_data (hashed while writing) are not
+    downloaded again; others (e.g., Hive-partitioned files written by
+    DuckDB) are streamed back and hashed.
+
+    Returns:
+        True if the manifest was written
+    """
     try:
-        parquet_data = storage.read_bytes(parquet_filename)
-        file_checksum_data = [
-            {
-                "path": parquet_filename,
-                "size_bytes": len(parquet_data),
-                "sha256": compute_bytes_sha256(parquet_data),
-            }
-        ]
-        write_checksum_manifest_s3(
+        file_checksum_data = []
+        for parquet_filename in parquet_filenames:
+            if file_data and parquet_filename in file_data:
+                file_checksum_data.append(file_data[parquet_filename])
+                continue
+            with storage.open_read(parquet_filename) as body:
+                with open(os.devnull, "wb") as sink:
+                    tee = HashingWriter(sink, algorithm)
+                    shutil.copyfileobj(body, tee, _HASH_CHUNK_SIZE)
+            file_checksum_data.append(tee.file_entry(parquet_filename))
+        return write_checksum_manifest_s3(
             storage,
             file_checksum_data,
             row_count=row_count,
             extra_metadata=extra_metadata or {},
+            algorithm=algorithm,
         )
     except Exception as e:
-        logger.warning("checksum_write_failed: %s", str(e))
+        logger.warning("checksum_write_failed", error=str(e))
+        return False
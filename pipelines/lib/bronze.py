@@ -11,16 +11,25 @@ Bronze layer rules:
 
 from __future__ import annotations
 
+import io
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, Generator, IO, List, Optional
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Generator, IO, List, Optional, Tuple, Union
 
 import ibis  # type: ignore[import-untyped]
 import pandas as pd
+import pyarrow as pa
 
 from pipelines.lib.artifact_writer import write_artifacts
+from pipelines.lib.catalog import CatalogEntry, entity_root, read_catalog
 from pipelines.lib.connections import get_connection
+from pipelines.lib.engine import get_engine
 from pipelines.lib.env import (
     expand_env_vars,
     expand_options,
@@ -48,9 +57,17 @@ from pipelines.lib._path_utils import (
     storage_path_exists,
 )
 from pipelines.lib.observability import get_structlog_logger
+from pipelines.lib.parallel_parse import (
+    ByteRange,
+    concat_range_tables,
+    map_byte_ranges,
+    read_byte_range,
+    resolve_parse_workers,
+    split_byte_ranges,
+)
+from pipelines.lib.staging import StagedTable, spool_table, stage_table, staging_area
 from pipelines.lib.storage_config import (
     InputMode,
-    _configure_duckdb_s3,
     _extract_storage_options,
 )
 
@@ -106,6 +123,194 @@ class LoadPattern(Enum):
 DEFAULT_BRONZE_TARGET = "./bronze/system={system}/entity={entity}/dt={run_date}/"
 
 
+def _column_bounds(t: ibis.Table, column: str) -> Tuple[Any, Any]:
+    """Return (min, max) of a column in one aggregate query.
+
+    Returns (None, None) when the table is empty or the column is all NULL.
+    """
+    bounds = t.aggregate(lower=t[column].min(), upper=t[column].max()).execute()
+    lower, upper = bounds["lower"].iloc[0], bounds["upper"].iloc[0]
+    if pd.isna(lower) or pd.isna(upper):
+        return None, None
+    # Unwrap numpy scalars so range arithmetic stays in Python types
+    if hasattr(lower, "item") and not isinstance(lower, date):
+        lower, upper = lower.item(), upper.item()
+    return lower, upper
+
+
+def _split_range(lower: Any, upper: Any, num_partitions: int) -> List[Tuple[Any, Any]]:
+    """Split [lower, upper] into at most num_partitions contiguous ranges.
+
+    Supports integer, float, decimal, date and timestamp bounds. Integer
+    boundaries stay integral; duplicate boundaries (narrow ranges) collapse.
+    """
+    if isinstance(lower, bool) or not isinstance(lower, (int, float, Decimal, date)):
+        raise ValueError(
+            f"Range-partitioned extraction needs a numeric or date/time column, "
+            f"got {type(lower).__name__} values"
+        )
+    if lower == upper:
+        return [(lower, upper)]
+
+    span = upper - lower
+    if isinstance(lower, int):
+        boundaries = [lower + span * i // num_partitions for i in range(num_partitions)]
+    else:
+        boundaries = [lower + span * i / num_partitions for i in range(num_partitions)]
+    boundaries = list(dict.fromkeys(boundaries)) + [upper]
+    return list(zip(boundaries, boundaries[1:]))
+
+
+# Arrow JSON reader block size; a single JSONL record must fit in one block
+_JSON_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+def _flatten_struct_columns(table: pa.Table) -> pa.Table:
+    """Flatten nested struct columns into dotted names (like pd.json_normalize)."""
+    while any(pa.types.is_struct(f.type) for f in table.schema):
+        table = table.flatten()
+    return table
+
+
+def _records_to_arrow(records: List[Any]) -> Optional[pa.Table]:
+    """Convert parsed JSON objects to an Arrow table in one vectorized pass.
+
+    The schema is the union of keys across all records. Returns None when
+    the records are empty, not objects, or have conflicting value types.
+    """
+    try:
+        array = pa.array(records)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    if not records or not pa.types.is_struct(array.type):
+        return None
+    return pa.Table.from_struct_array(array)
+
+
+def _timestamps_as_strings(data_type: pa.DataType) -> pa.DataType:
+    """Replace timestamp types, including nested ones, with string."""
+    if pa.types.is_timestamp(data_type):
+        return pa.string()
+    if pa.types.is_struct(data_type):
+        return pa.struct(
+            [f.with_type(_timestamps_as_strings(f.type)) for f in data_type]
+        )
+    if pa.types.is_list(data_type):
+        field = data_type.value_field
+        return pa.list_(field.with_type(_timestamps_as_strings(field.type)))
+    return data_type
+
+
+def _string_fields(schema: pa.Schema) -> Dict[str, pa.Field]:
+    """Fields of schema holding timestamps, retyped to hold strings."""
+    fields = {}
+    for f in schema:
+        data_type = _timestamps_as_strings(f.type)
+        if data_type != f.type:
+            fields[f.name] = f.with_type(data_type)
+    return fields
+
+
+def _read_json_strings(
+    read: Callable[[Optional[pa.Schema]], pa.Table],
+    sample: Optional[pa.Schema] = None,
+) -> pa.Table:
+    """Parse JSON with Arrow, keeping date and time strings as strings.
+
+    Arrow's JSON reader infers ISO 8601 strings as timestamps, which would
+    change the source values. read(schema) parses the file, declaring the
+    fields in schema and inferring the rest. Fields inferred as timestamps
+    in sample (e.g., the file's first block) are declared as strings up
+    front; the file is parsed again only if other fields were inferred as
+    timestamps.
+
+    Arrow puts declared fields first, so the columns are reselected in the
+    order they appear in the data: sample's fields, then any seen later.
+    """
+    fields = _string_fields(sample) if sample is not None else {}
+    order: Dict[str, None] = dict.fromkeys(sample.names if sample is not None else [])
+    while True:
+        table = read(pa.schema(list(fields.values())) if fields else None)
+        # Undeclared fields keep the order they appear in; declared ones
+        # were already seen undeclared in sample or an earlier read
+        order.update(dict.fromkeys(n for n in table.column_names if n not in fields))
+        late = _string_fields(table.schema)
+        if not late:
+            names = list(order)
+            return table if table.column_names == names else table.select(names)
+        fields.update(late)
+
+
+def _data_path_error(data_path: str, top_level_keys: Optional[List[str]]) -> ValueError:
+    """Error for a JSON data_path that does not exist in the document."""
+    if top_level_keys is not None:
+        # Show available top-level keys to help user fix the path
+        available_str = ", ".join(f"'{k}'" for k in top_level_keys[:10])
+        return ValueError(
+            f"Path '{data_path}' not found in JSON structure. "
+            f"Available top-level keys: {available_str}"
+        )
+    return ValueError(
+        f"Path '{data_path}' not found in JSON structure. "
+        "Check your data_path configuration matches the JSON response structure."
+    )
+
+
+# read_csv options that behave the same when a file is parsed in byte ranges
+# (skiprows is applied to the first range only)
+_SPLITTABLE_CSV_OPTIONS = frozenset(
+    {
+        "engine",
+        "sep",
+        "names",
+        "dtype",
+        "na_values",
+        "keep_default_na",
+        "skiprows",
+        "comment",
+        "skip_blank_lines",
+    }
+)
+
+
+# Bytes read from the start of a delimited file to infer its header
+_HEADER_PROBE_BYTES = 1024 * 1024
+
+
+def _parse_delimited_range(
+    first_opts: Dict[str, Any], later_opts: Dict[str, Any], byte_range: ByteRange
+) -> pa.Table:
+    """Worker: parse one byte range of a delimited file with pandas."""
+    opts = first_opts if byte_range.start == 0 else later_opts
+    df = pd.read_csv(io.BytesIO(read_byte_range(byte_range)), **opts)
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _read_delimited_ranges(
+    ranges: List[ByteRange], pandas_opts: Dict[str, Any], workers: int
+) -> pa.Table:
+    """Parse a delimited file's byte ranges in a process pool.
+
+    The first range is parsed with the original options (header, skiprows);
+    later ranges reuse its column names and hold data rows only.
+    """
+    head = ranges[0]
+    probe = ByteRange(
+        head.path,
+        0,
+        min(head.end, _HEADER_PROBE_BYTES),
+        head.storage_options,
+    )
+    header = pd.read_csv(io.BytesIO(read_byte_range(probe)), nrows=0, **pandas_opts)
+    later_opts = {k: v for k, v in pandas_opts.items() if k != "skiprows"}
+    later_opts.update(header=None, names=list(header.columns))
+
+    tables = map_byte_ranges(
+        partial(_parse_delimited_range, pandas_opts, later_opts), ranges, workers
+    )
+    return concat_range_tables(tables)
+
+
 @dataclass
 class BronzeSource:
     """Declarative Bronze layer source definition.
@@ -185,7 +390,9 @@ class BronzeSource:
     partition_by: List[str] = field(default_factory=lambda: ["_load_date"])
 
     # Large data handling
-    chunk_size: Optional[int] = None  # Rows per chunk (None = load all at once)
+    chunk_size: Optional[int] = None  # Rows per batch / row group (None = default)
+    # Parallel database extraction is configured in options:
+    # num_partitions (> 1) and partition_column (defaults to watermark_column)
 
     # Periodic full refresh (scheduler-agnostic)
     # When set, automatically forces a full refresh every N days
@@ -407,36 +614,52 @@ class BronzeSource:
 
             # Connect to DuckDB
             with step(PipelineStep.BRONZE_CONNECT_SOURCE, self.source_type.value):
-                con = ibis.duckdb.connect()
-                # Configure S3 if target is object storage
-                if is_object_storage_path(target):
-                    _configure_duckdb_s3(con, self.options)
-
-            # Read from source
-            with step(PipelineStep.BRONZE_READ_SOURCE):
-                t = self._read_source(con, run_date, last_watermark)
-                row_count = t.count().execute()
-                tracer.detail(f"Read {row_count:,} records from source")
-
-            # Add Bronze technical metadata (the ONLY transforms allowed)
-            with step(PipelineStep.BRONZE_ADD_METADATA):
-                t = self._add_metadata(t, run_date)
-
-            # Write to target
-            with step(PipelineStep.BRONZE_WRITE_OUTPUT):
-                result = self._write(t, target, run_date, last_watermark)
-                tracer.detail(
-                    f"Wrote {result.get('row_count', 0):,} records to {target}"
+                # Shared engine, configured for S3 if target is object storage
+                con = get_engine(
+                    self.options if is_object_storage_path(target) else None
                 )
 
-            # Save new watermark for incremental
-            if self.watermark_column and result.get("row_count", 0) > 0:
-                with step(PipelineStep.BRONZE_SAVE_WATERMARK):
-                    new_watermark = self._get_max_watermark(t)
-                    if new_watermark:
-                        save_watermark(self.system, self.entity, str(new_watermark))
-                        result["new_watermark"] = str(new_watermark)
-                        tracer.detail(f"Saved watermark: {new_watermark}")
+            # Spool the source once to local staging; counts, writes and
+            # watermarks are all derived from this single materialization
+            with staging_area(self.entity) as staging_dir:
+                # Read from source
+                with step(PipelineStep.BRONZE_READ_SOURCE):
+                    staged_parts = self._stage_source(
+                        con, staging_dir, run_date, last_watermark
+                    )
+                    row_count = sum(part.row_count for part in staged_parts)
+                    tracer.detail(f"Read {row_count:,} records from source")
+
+                # Add Bronze technical metadata (the ONLY transforms allowed)
+                with step(PipelineStep.BRONZE_ADD_METADATA):
+                    extracted_at = utc_now_iso()
+                    parts = [
+                        self._add_metadata(part.table, run_date, extracted_at)
+                        for part in staged_parts
+                    ]
+                    t = parts[0].union(*parts[1:]) if len(parts) > 1 else parts[0]
+
+                # Write to target; the new watermark comes from the column
+                # stats gathered while writing
+                with step(PipelineStep.BRONZE_WRITE_OUTPUT):
+                    result = self._write(
+                        parts if len(parts) > 1 else t,
+                        target,
+                        run_date,
+                        last_watermark,
+                        row_count=row_count,
+                    )
+                    new_watermark = result.get("new_watermark")
+                    tracer.detail(
+                        f"Wrote {result.get('row_count', 0):,} records to {target}"
+                    )
+
+                # Save new watermark for incremental
+                if self.watermark_column and result.get("row_count", 0) > 0:
+                    with step(PipelineStep.BRONZE_SAVE_WATERMARK):
+                        if new_watermark:
+                            save_watermark(self.system, self.entity, str(new_watermark))
+                            tracer.detail(f"Saved watermark: {new_watermark}")
 
             # Record full refresh if it was triggered
             if is_full_refresh and result.get("row_count", 0) > 0:
@@ -458,6 +681,20 @@ class BronzeSource:
             },
         )
 
+    def catalog(self, run_date: str) -> Dict[str, CatalogEntry]:
+        """Partitions recorded in this entity's _catalog.json.
+
+        Args:
+            run_date: Any run date; used to resolve the target template
+
+        Returns:
+            Catalog entries keyed by partition date (empty if none recorded)
+        """
+        root = entity_root(self._resolve_target(run_date, None))
+        if root is None:
+            return {}
+        return read_catalog(root, _extract_storage_options(self.options))
+
     def _already_ran(self, target: str) -> bool:
         """Check if data already exists for this run."""
         return path_has_data(target)
@@ -539,6 +776,109 @@ class BronzeSource:
             "Check your source_type configuration."
         )
 
+    def _stage_source(
+        self,
+        con: ibis.BaseBackend,
+        staging_dir: Path,
+        run_date: str,
+        last_watermark: Optional[str],
+    ) -> List[StagedTable]:
+        """Spool the source to local Parquet, one file per extraction range."""
+        if self._uses_range_partitions():
+            staged = self._stage_database_ranges(con, staging_dir, last_watermark)
+            if staged:
+                return staged
+
+        source_table = self._read_source(con, run_date, last_watermark)
+        return [
+            stage_table(
+                source_table,
+                con,
+                staging_dir,
+                self.entity,
+                chunk_size=self.chunk_size,
+            )
+        ]
+
+    def _uses_range_partitions(self) -> bool:
+        """Whether database extraction is split into concurrent ranges."""
+        return (
+            self.source_type in self._DATABASE_TYPES
+            and int(self.options.get("num_partitions") or 1) > 1
+        )
+
+    def _stage_database_ranges(
+        self,
+        con: ibis.BaseBackend,
+        staging_dir: Path,
+        last_watermark: Optional[str],
+    ) -> List[StagedTable]:
+        """Fetch column ranges of a database source concurrently.
+
+        The partition column's min/max are read in one aggregate query and
+        split into num_partitions ranges. Each range is fetched over its own
+        pooled connection and spooled to its own staged Parquet part.
+
+        Returns an empty list when the source has nothing to split (no rows).
+        """
+        opts = self._get_expanded_options()
+        column = opts.get("partition_column") or self.watermark_column
+        if not column:
+            # Validated at construction, but options may have been changed
+            # since or expand to an empty value
+            raise ValueError(
+                f"{self.system}.{self.entity}: num_partitions > 1 requires "
+                "options.partition_column or watermark_column to split on"
+            )
+        num_partitions = int(opts["num_partitions"])
+
+        source = self._database_table(self._database_connection(opts), last_watermark)
+        lower, upper = _column_bounds(source, column)
+        if lower is None:
+            return []
+        ranges = _split_range(lower, upper, num_partitions)
+
+        # Connections are opened here, not in the workers: the pool itself is
+        # not thread-safe, but each connection is only used by one worker
+        range_tables = []
+        for i, (range_lower, range_upper) in enumerate(ranges):
+            db_con = self._database_connection(opts, suffix=f"_range{i}" if i else "")
+            t = self._database_table(db_con, last_watermark)
+            col = t[column]
+            upper_pred = (
+                col <= range_upper if i == len(ranges) - 1 else col < range_upper
+            )
+            predicate = (col >= range_lower) & upper_pred
+            if i == 0:
+                # NULLs fall outside every range; land them with the first
+                predicate = predicate | col.isnull()
+            range_tables.append(t.filter(predicate))
+
+        paths = [
+            staging_dir / f"{self.entity}-part-{i:04d}.parquet"
+            for i in range(len(range_tables))
+        ]
+        logger.info(
+            "bronze_range_extraction",
+            system=self.system,
+            entity=self.entity,
+            partition_column=column,
+            partitions=len(range_tables),
+        )
+        with ThreadPoolExecutor(max_workers=len(range_tables)) as pool:
+            row_counts = list(
+                pool.map(
+                    lambda args: spool_table(*args, chunk_size=self.chunk_size),
+                    zip(range_tables, paths),
+                )
+            )
+
+        return [
+            StagedTable(table=con.read_parquet(str(path)), path=path, row_count=rows)
+            for path, rows in zip(paths, row_counts)
+            if rows
+        ]
+
     def _get_expanded_options(self) -> Dict[str, Any]:
         """Get options with environment variables expanded."""
         return expand_options(self.options)
@@ -578,9 +918,19 @@ class BronzeSource:
     ) -> ibis.Table:
         """Read from database source using connection pooling."""
         opts = self._get_expanded_options()
+        return self._database_table(self._database_connection(opts), last_watermark)
+
+    def _database_connection(
+        self, opts: Dict[str, Any], suffix: str = ""
+    ) -> ibis.BaseBackend:
+        """Get the pooled connection for this source (suffix = extra connection)."""
         connection_name = opts.get("connection_name", f"{self.system}_{self.entity}")
-        db_con = get_connection(connection_name, self.source_type, opts)
+        return get_connection(f"{connection_name}{suffix}", self.source_type, opts)
 
+    def _database_table(
+        self, db_con: ibis.BaseBackend, last_watermark: Optional[str]
+    ) -> ibis.Table:
+        """Build the source query (table or custom SQL) with watermark filter."""
         query = self.options.get("query")
         if query:
             # Execute the query first, then apply watermark filter via Ibis
@@ -614,12 +964,14 @@ class BronzeSource:
         if record_type_position and record_types:
             from pipelines.lib.fixed_width import read_parent_child_fixed_width
 
-            output_mode = self.options.get("output_mode", "flatten")
-            # Pass file handle for S3 support
-            with self._open_file(source_path, "r") as f:
-                return read_parent_child_fixed_width(
-                    f, record_type_position, record_types, output_mode=output_mode
-                )
+            return read_parent_child_fixed_width(
+                source_path,
+                record_type_position,
+                record_types,
+                output_mode=self.options.get("output_mode", "flatten"),
+                parse_workers=self.options.get("parse_workers"),
+                storage_options=_extract_storage_options(self.options),
+            )
 
         # Original single-record-type logic
         csv_opts: Dict[str, Any] = dict(self.options.get("csv_options", {}))
@@ -645,6 +997,21 @@ class BronzeSource:
                 "See pipelines/examples/fixed_width.yaml for examples."
             )
 
+        # Plain column layouts use the columnar engine; other pandas
+        # read_fwf options keep the pandas reader
+        if columns and not csv_opts:
+            from pipelines.lib.fixed_width import read_fixed_width
+
+            return read_fixed_width(
+                source_path,
+                columns,
+                widths=widths,
+                colspecs=colspecs,
+                parse_workers=self.options.get("parse_workers"),
+                storage_options=_extract_storage_options(self.options),
+                infer_types=self.options.get("infer_types", True),
+            )
+
         pandas_opts: Dict[str, Any] = {}
         pandas_opts.update(csv_opts)
 
@@ -691,6 +1058,21 @@ class BronzeSource:
         elif "sep" not in pandas_opts:
             pandas_opts["sep"] = " "
 
+        # On request, large files are parsed in newline-aligned byte ranges
+        # across processes; quoted fields must not contain newlines
+        parse_workers = self.options.get("parse_workers")
+        if parse_workers not in (None, 1) and _SPLITTABLE_CSV_OPTIONS.issuperset(
+            pandas_opts
+        ):
+            ranges = split_byte_ranges(
+                source_path, _extract_storage_options(self.options)
+            )
+            workers = resolve_parse_workers(parse_workers, ranges)
+            if workers > 1:
+                return ibis.memtable(
+                    _read_delimited_ranges(ranges, pandas_opts, workers)
+                )
+
         with self._open_file(source_path, "r") as f:
             df = pd.read_csv(f, **pandas_opts)
         return ibis.memtable(df)
@@ -700,32 +1082,39 @@ class BronzeSource:
 
         Supports both local files and remote storage (S3, ADLS).
 
+        The document is parsed with Arrow's JSON reader and the records at
+        data_path are taken from it column-wise. Documents Arrow cannot
+        parse (e.g., values of conflicting types) fall back to json.load.
+
         Options:
             data_path: Dot-notation path to extract data (e.g., "response.data.items")
             flatten: If True, flatten nested structures (default: False)
         """
+        data_path = self.options.get("data_path")
+        try:
+            table = self._read_json_arrow(source_path, data_path)
+        except pa.ArrowInvalid as exc:
+            logger.warning(
+                "bronze_json_arrow_fallback", path=source_path, error=str(exc)
+            )
+            table = None
+        if table is not None:
+            if self.options.get("flatten", False):
+                table = _flatten_struct_columns(table)
+            return ibis.memtable(table)
+
         import json
 
         with self._open_file(source_path, "r") as f:
             data = json.load(f)
 
         # Navigate to nested data if data_path specified
-        data_path = self.options.get("data_path")
         if data_path:
             try:
                 data = extract_nested_value(data, data_path, raise_on_missing=True)
             except KeyError:
-                # Show available top-level keys to help user fix the path
-                if isinstance(data, dict):
-                    available = list(data.keys())[:10]  # Show first 10 keys
-                    available_str = ", ".join(f"'{k}'" for k in available)
-                    raise ValueError(
-                        f"Path '{data_path}' not found in JSON structure. "
-                        f"Available top-level keys: {available_str}"
-                    )
-                raise ValueError(
-                    f"Path '{data_path}' not found in JSON structure. "
-                    "Check your data_path configuration matches the JSON response structure."
+                raise _data_path_error(
+                    data_path, list(data) if isinstance(data, dict) else None
                 )
 
         # Ensure we have a list of records
@@ -737,25 +1126,113 @@ class BronzeSource:
                 "JSON source should contain an array of records or a single object."
             )
 
-        # Flatten nested structures if requested
-        if self.options.get("flatten", False):
-            data = [
-                pd.json_normalize(record).to_dict(orient="records")[0]
-                for record in data
-            ]
+        return self._records_table(data)
+
+    def _read_json_arrow(
+        self, source_path: str, data_path: Optional[str]
+    ) -> Optional[pa.Table]:
+        """Parse a JSON document with Arrow and return the records at data_path.
+
+        The document is wrapped as {"root": <document>}, so a top-level
+        array parses as a single row. Returns None when the value at
+        data_path is not an object or a non-empty array of objects.
+        """
+        import pyarrow.compute as pc
+        import pyarrow.json as pa_json
+
+        with self._open_file(source_path, "rb") as f:
+            payload = b'{"root": ' + f.read() + b"\n}\n"
+        read_options = pa_json.ReadOptions(block_size=len(payload) + 1)
+
+        def read(schema: Optional[pa.Schema]) -> pa.Table:
+            parse_options = pa_json.ParseOptions(
+                explicit_schema=schema,
+                newlines_in_values=True,
+                unexpected_field_behavior="infer",
+            )
+            return pa_json.read_json(
+                io.BytesIO(payload),
+                read_options=read_options,
+                parse_options=parse_options,
+            )
+
+        root = _read_json_strings(read).column("root").combine_chunks()
+        value = root
+        for key in data_path.split(".") if data_path else []:
+            if pa.types.is_struct(value.type) and value.type.get_field_index(key) >= 0:
+                value = value.field(key)
+            elif (
+                pa.types.is_list(value.type)
+                and key.isdigit()
+                and int(key) < len(pc.list_flatten(value))
+            ):
+                value = pc.list_element(value, int(key))
+            else:
+                raise _data_path_error(
+                    str(data_path),
+                    [f.name for f in root.type]
+                    if pa.types.is_struct(root.type)
+                    else None,
+                )
 
-        return ibis.memtable(data)
+        if pa.types.is_list(value.type):
+            records = pc.list_flatten(value)
+            if not len(records) or not pa.types.is_struct(records.type):
+                return None
+            return pa.Table.from_struct_array(records)
+        if pa.types.is_struct(value.type):
+            return pa.Table.from_struct_array(value)
+        raise ValueError(
+            f"Expected list or dict at data path, got {value.type}. "
+            "JSON source should contain an array of records or a single object."
+        )
 
     def _read_jsonl(self, _con: ibis.BaseBackend, source_path: str) -> ibis.Table:
         """Read JSON Lines (newline-delimited JSON) file.
 
         Supports both local files and remote storage (S3, ADLS).
 
-        Each line is a separate JSON object.
+        Each line is a separate JSON object. Parsing uses Arrow's native,
+        multi-threaded JSON reader, keeping date and time strings as
+        strings; files it cannot parse (e.g., a record larger than the read
+        block) fall back to per-line parsing.
 
         Options:
             flatten: If True, flatten nested structures (default: False)
         """
+        import pyarrow.json as pa_json
+
+        read_options = pa_json.ReadOptions(block_size=_JSON_BLOCK_SIZE)
+
+        def read(schema: Optional[pa.Schema]) -> pa.Table:
+            parse_options = pa_json.ParseOptions(
+                explicit_schema=schema, unexpected_field_behavior="infer"
+            )
+            with self._open_file(source_path, "rb") as f:
+                return pa_json.read_json(
+                    f, read_options=read_options, parse_options=parse_options
+                )
+
+        try:
+            # The first block shows which fields look like timestamps
+            with self._open_file(source_path, "rb") as f:
+                head = f.read(_JSON_BLOCK_SIZE)
+            head = head[: head.rfind(b"\n") + 1]
+            sample = (
+                pa_json.read_json(io.BytesIO(head), read_options=read_options).schema
+                if head.strip()
+                else None
+            )
+            table = _read_json_strings(read, sample)
+        except pa.ArrowInvalid as exc:
+            logger.warning(
+                "bronze_jsonl_arrow_fallback", path=source_path, error=str(exc)
+            )
+        else:
+            if self.options.get("flatten", False):
+                table = _flatten_struct_columns(table)
+            return ibis.memtable(table)
+
         import json
 
         records = []
@@ -764,14 +1241,22 @@ class BronzeSource:
                 line = line.strip()
                 if line:  # Skip empty lines
                     records.append(json.loads(line))
+        return self._records_table(records)
 
-        # Flatten nested structures if requested
-        if self.options.get("flatten", False):
-            records = [
-                pd.json_normalize(record).to_dict(orient="records")[0]
-                for record in records
-            ]
+    def _records_table(self, records: List[Any]) -> ibis.Table:
+        """Build a table from parsed JSON records, flattening if requested.
 
+        Records are converted to Arrow in one pass and nested structs are
+        flattened column-wise. Records Arrow cannot type consistently go
+        through pandas instead.
+        """
+        flatten = self.options.get("flatten", False)
+        table = _records_to_arrow(records)
+        if table is not None:
+            return ibis.memtable(_flatten_struct_columns(table) if flatten else table)
+
+        if flatten and records:
+            return ibis.memtable(pd.json_normalize(records))
         return ibis.memtable(records)
 
     def _read_excel(self, source_path: str) -> ibis.Table:
@@ -836,12 +1321,15 @@ class BronzeSource:
         else:
             raise ValueError(f"Unexpected API response type: {type(data)}")
 
-    def _add_metadata(self, t: ibis.Table, run_date: str) -> ibis.Table:
+    def _add_metadata(
+        self, t: ibis.Table, run_date: str, extracted_at: Optional[str] = None
+    ) -> ibis.Table:
         """Add Bronze technical metadata columns.
 
-        These are the ONLY additions allowed in Bronze.
+        These are the ONLY additions allowed in Bronze. Pass extracted_at to
+        stamp several extraction parts with the same timestamp.
         """
-        now = utc_now_iso()
+        now = extracted_at or utc_now_iso()
         return t.mutate(
             _load_date=ibis.literal(run_date),
             _extracted_at=ibis.literal(now),
@@ -851,14 +1339,27 @@ class BronzeSource:
 
     def _write(
         self,
-        t: ibis.Table,
+        t: Union[ibis.Table, List[ibis.Table]],
         target: str,
         run_date: str,
         last_watermark: Optional[str] = None,
+        *,
+        row_count: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Write to Bronze target with optional checksums and metadata."""
+        """Write to Bronze target with optional checksums and metadata.
+
+        When row_count is known (e.g., from staging), it is passed through so
+        the writer does not re-execute the table to count it. A list of tables
+        (range-partitioned extraction) is written as one Parquet part each.
+        The writer derives the new high watermark from the column stats it
+        gathers while writing; it is stored in _metadata.json and the entity
+        catalog, and returned as new_watermark. If the watermark column has
+        no max (all nulls, or a type without an ordering), no new_watermark
+        is returned and a warning is logged; the stored watermark stays put.
+        """
         # Infer column types for metadata (include SQL types for PolyBase DDL)
-        columns = infer_column_types(t, include_sql_types=True)
+        schema_table = t[0] if isinstance(t, list) else t
+        columns = infer_column_types(schema_table, include_sql_types=True)
 
         # Bronze-specific metadata fields
         bronze_extra = {
@@ -892,12 +1393,20 @@ class BronzeSource:
             entity_name=self.entity,
             columns=columns,
             run_date=run_date,
+            row_count=row_count,
             extra_metadata=bronze_extra,
             storage_options=self.options,
             write_metadata=self.write_metadata,
             write_checksums=self.write_checksums,
             checksum_extra=checksum_extra,
             partition_by=partition_by,
+            chunk_size=self.chunk_size,
+            catalog=(
+                {"load_pattern": self.load_pattern.value}
+                if self.write_metadata
+                else None
+            ),
+            watermark_column=self.watermark_column,
         )
 
         if write_result.row_count == 0:
@@ -928,20 +1437,15 @@ class BronzeSource:
             result["metadata_file"] = write_result.metadata_file
         if write_result.checksums_file:
             result["checksums_file"] = write_result.checksums_file
+        if write_result.high_watermark is not None:
+            result["new_watermark"] = write_result.high_watermark
+        elif self.watermark_column:
+            logger.warning(
+                "bronze_watermark_not_advanced",
+                system=self.system,
+                entity=self.entity,
+                watermark_column=self.watermark_column,
+                reason="no max value in the written column stats",
+            )
 
         return result
-
-    def _get_max_watermark(self, t: ibis.Table) -> Optional[str]:
-        """Get the maximum value of the watermark column."""
-        if not self.watermark_column or self.watermark_column not in t.columns:
-            return None
-
-        try:
-            max_val = t.select(t[self.watermark_column].max()).execute()
-            # Handle different return types from Ibis
-            if hasattr(max_val, "iloc"):
-                return str(max_val.iloc[0, 0]) if not max_val.empty else None
-            return str(max_val) if max_val is not None else None
-        except Exception as e:
-            logger.warning("bronze_watermark_failed", error=str(e))
-            return None
@@ -0,0 +1,282 @@
+"""Entity-level partition catalog.
+
+Each Bronze entity root keeps a ``_catalog.json`` next to its ``dt=``
+partitions, updated by write_artifacts on every write:
+
+    bronze/system=retail/entity=orders/
+        _catalog.json                                 # index of all entries
+        _catalog/2025-01-15.20250116T020000123456Z.json  # one per write
+        dt=2025-01-14/...
+        dt=2025-01-15/...
+
+Every write first records its own entry file, named by partition date and
+write time, and then rewrites the index. Writers in separate processes
+(parallel backfills) can overwrite each other's index update, but never
+each other's entry files, so readers reconcile the index with one listing
+of ``_catalog/`` and read only the entries it is missing or has stale.
+
+The catalog records, per partition, what a reader would otherwise find by
+opening that partition's ``_metadata.json``: the load pattern, row count,
+data files, high watermark and a hash of the schema. Silver boundary
+discovery and destination watermarks read it once instead of issuing one
+request per partition, and fall back to per-partition metadata for
+partitions written before the catalog existed.
+
+Usage:
+    from pipelines.lib.catalog import read_catalog
+
+    entries = read_catalog("s3://bucket/bronze/system=retail/entity=orders/")
+    latest = entries[max(entries)] if entries else None
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from pipelines.lib.env import utc_now_iso
+from pipelines.lib.observability import get_structlog_logger
+from pipelines.lib.storage import get_storage
+
+logger = get_structlog_logger(__name__)
+
+__all__ = [
+    "CATALOG_FILENAME",
+    "CatalogEntry",
+    "CatalogError",
+    "entity_root",
+    "partition_date",
+    "read_catalog",
+    "schema_hash",
+    "update_catalog",
+]
+
+CATALOG_FILENAME = "_catalog.json"
+CATALOG_ENTRIES_DIR = "_catalog"
+CATALOG_VERSION = 1
+
+_DT_SEGMENT = re.compile(r"[/\\]dt=(\d{4}-?\d{2}-?\d{2})[/\\]?$")
+# Entry file names: <dt>.<write time>.json
+_ENTRY_NAME = re.compile(r"^(\d{4}-\d{2}-\d{2})\.(\d{8}T\d{12}Z)\.json$")
+_STAMP_FORMAT = "%Y%m%dT%H%M%S%fZ"
+
+# Serializes read-modify-write of catalogs from threads in this process
+_lock = threading.Lock()
+
+
+class CatalogError(Exception):
+    """Raised when an entity catalog exists but cannot be read or parsed."""
+
+
+@dataclass
+class CatalogEntry:
+    """One partition's entry in the entity catalog.
+
+    Attributes:
+        dt: Partition date (YYYY-MM-DD)
+        row_count: Rows in the partition
+        files: Data file names within the partition
+        load_pattern: Bronze load pattern that wrote the partition
+        watermark: Highest watermark value in the partition, if tracked
+        schema_hash: Hash of the column names and types (see schema_hash)
+        written_at: When the partition was written (ISO 8601)
+    """
+
+    dt: str
+    row_count: int
+    files: List[str] = field(default_factory=list)
+    load_pattern: Optional[str] = None
+    watermark: Optional[str] = None
+    schema_hash: Optional[str] = None
+    written_at: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CatalogEntry":
+        """Create from a catalog dict, ignoring unknown keys."""
+        known = set(cls.__dataclass_fields__)
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+def schema_hash(columns: List[Dict[str, Any]]) -> str:
+    """Hash column names and types from infer_column_types().
+
+    Partitions with the same hash have the same schema, so schema drift
+    shows up as a change of hash between catalog entries.
+    """
+    signature = [[c["name"], c.get("type")] for c in columns]
+    return hashlib.sha256(json.dumps(signature).encode("utf-8")).hexdigest()[:16]
+
+
+def entity_root(target: str) -> Optional[str]:
+    """Return the entity root above a ``dt=`` partition path.
+
+    Returns None when the path does not end in a dt= partition, in which
+    case there is no entity root to keep a catalog in.
+    """
+    match = _DT_SEGMENT.search(target)
+    if not match:
+        return None
+    return target[: match.start() + 1]
+
+
+def partition_date(target: str) -> Optional[str]:
+    """Return the YYYY-MM-DD date of a ``dt=`` partition path, if any."""
+    match = _DT_SEGMENT.search(target)
+    if not match:
+        return None
+    raw = match.group(1)
+    return f"{raw[:4]}-{raw[4:6]}-{raw[6:]}" if "-" not in raw else raw
+
+
+def _written_at(entry: CatalogEntry) -> datetime:
+    if not entry.written_at:
+        return datetime.min.replace(tzinfo=timezone.utc)
+    return datetime.fromisoformat(entry.written_at)
+
+
+def _read_json(storage: Any, path: str) -> Dict[str, Any]:
+    try:
+        data = json.loads(storage.read_text(path))
+    except Exception as e:
+        raise CatalogError(f"Cannot read catalog file {path}: {e}") from e
+    if not isinstance(data, dict):
+        raise CatalogError(f"Catalog file {path} is not a JSON object")
+    return data
+
+
+def read_catalog(
+    root: str, storage_options: Optional[Dict[str, Any]] = None
+) -> Dict[str, CatalogEntry]:
+    """Read an entity catalog.
+
+    Args:
+        root: Entity root containing the dt= partitions
+        storage_options: Storage backend options (endpoint_url, key, ...)
+
+    Returns:
+        Entries keyed by partition date; empty if there is no catalog
+
+    Raises:
+        CatalogError: If the index or an entry file is unreadable or corrupt
+    """
+    storage = get_storage(root, **(storage_options or {}))
+    entries: Dict[str, CatalogEntry] = {}
+    if storage.exists(CATALOG_FILENAME):
+        data = _read_json(storage, CATALOG_FILENAME)
+        try:
+            entries = {
+                dt: CatalogEntry.from_dict(entry)
+                for dt, entry in data.get("partitions", {}).items()
+            }
+        except (AttributeError, TypeError) as e:
+            raise CatalogError(f"Corrupt catalog {CATALOG_FILENAME}: {e}") from e
+
+    # Entries written since the index was last rewritten, or whose index
+    # update was lost to a concurrent writer
+    newest: Dict[str, tuple[datetime, str]] = {}
+    for info in storage.list_files(CATALOG_ENTRIES_DIR):
+        name = info.path.replace("\\", "/").rsplit("/", 1)[-1]
+        match = _ENTRY_NAME.match(name)
+        if not match:
+            continue
+        dt, stamp = match.groups()
+        written = datetime.strptime(stamp, _STAMP_FORMAT).replace(tzinfo=timezone.utc)
+        if dt not in newest or written > newest[dt][0]:
+            newest[dt] = (written, name)
+
+    for dt, (written, name) in newest.items():
+        if dt in entries and _written_at(entries[dt]) >= written:
+            continue
+        data = _read_json(storage, f"{CATALOG_ENTRIES_DIR}/{name}")
+        entries[dt] = CatalogEntry.from_dict(data)
+    return entries
+
+
+def update_catalog(
+    target: str,
+    *,
+    row_count: int,
+    files: List[str],
+    columns: List[Dict[str, Any]],
+    load_pattern: Optional[str] = None,
+    watermark: Optional[str] = None,
+    storage_options: Optional[Dict[str, Any]] = None,
+) -> Optional[CatalogEntry]:
+    """Record a freshly written partition in its entity catalog.
+
+    Args:
+        target: The dt= partition that was written
+        row_count: Rows written
+        files: Data file names written to the partition
+        columns: Column metadata from infer_column_types()
+        load_pattern: Bronze load pattern
+        watermark: Highest watermark value written, if tracked
+        storage_options: Storage backend options (endpoint_url, key, ...)
+
+    Returns:
+        The recorded entry, or None if target is not a dt= partition
+    """
+    root = entity_root(target)
+    dt = partition_date(target)
+    if root is None or dt is None:
+        return None
+
+    now = datetime.now(timezone.utc)
+    entry = CatalogEntry(
+        dt=dt,
+        row_count=row_count,
+        files=list(files),
+        load_pattern=load_pattern,
+        watermark=watermark,
+        schema_hash=schema_hash(columns),
+        written_at=now.isoformat(),
+    )
+    storage = get_storage(root, **(storage_options or {}))
+
+    # The entry file is the durable record; the index only speeds up reads
+    entry_name = f"{dt}.{now.strftime(_STAMP_FORMAT)}.json"
+    result = storage.write_text(
+        f"{CATALOG_ENTRIES_DIR}/{entry_name}", json.dumps(entry.to_dict(), indent=2)
+    )
+    if not result.success:
+        logger.warning("catalog_write_failed", root=root, error=result.error)
+        return None
+
+    with _lock:
+        try:
+            entries = read_catalog(root, storage_options)
+        except CatalogError as e:
+            # Never overwrite a catalog we could not read; readers still
+            # find this partition through its entry file
+            logger.warning("catalog_index_unreadable", root=root, error=str(e))
+            return entry
+        document = {
+            "version": CATALOG_VERSION,
+            "updated_at": utc_now_iso(),
+            "partitions": {key: entries[key].to_dict() for key in sorted(entries)},
+        }
+        result = storage.write_text(CATALOG_FILENAME, json.dumps(document, indent=2))
+
+    if not result.success:
+        logger.warning("catalog_write_failed", root=root, error=result.error)
+    else:
+        logger.debug("catalog_updated", root=root, dt=dt, partitions=len(entries))
+    _prune_entries(storage, dt, keep=entry_name)
+    return entry
+
+
+def _prune_entries(storage: Any, dt: str, keep: str) -> None:
+    """Delete entry files of dt older than keep, the one just written."""
+    for info in storage.list_files(CATALOG_ENTRIES_DIR, pattern=f"{dt}.*.json"):
+        name = info.path.replace("\\", "/").rsplit("/", 1)[-1]
+        if _ENTRY_NAME.match(name) and name < keep:
+            storage.delete(f"{CATALOG_ENTRIES_DIR}/{name}")
@@ -1,20 +1,40 @@
 """Checksum utilities for data integrity verification.
 
-Provides SHA256 hashing and checksum manifest generation for
+Provides file hashing and checksum manifest generation for
 pipeline outputs to enable data integrity verification.
+
+Manifests record the hash algorithm they were written with. SHA256 is the
+default; faster algorithms can be chosen with the checksum_algorithm
+argument or PIPELINE_CHECKSUM_ALGORITHM:
+
+    sha256    cryptographic (default, hashlib)
+    blake2b   cryptographic, faster than SHA256 on 64-bit CPUs (hashlib)
+    blake3    cryptographic tree hash, multi-threaded on large files
+              (pip install blake3)
+    xxh3_64   non-cryptographic, several GB/s per core (pip install xxhash)
+    xxh128    non-cryptographic, 128-bit xxh3 (pip install xxhash)
+
+Manifests without an algorithm field are SHA256 manifests.
 """
 
 from __future__ import annotations
 
 import hashlib
+import importlib
+import io
 import json
 import logging
+import mmap
+import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
+from pipelines.lib._path_utils import is_object_storage_path
 from pipelines.lib.env import utc_now_iso
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 if TYPE_CHECKING:
     from pipelines.lib.storage.base import StorageBackend
@@ -25,8 +45,14 @@ __all__ = [
     "ChecksumManifest",
     "ChecksumVerificationResult",
     "ChecksumValidationError",
+    "HashingWriter",
+    "VerificationCache",
+    "CHECKSUM_ALGORITHMS",
+    "compute_file_hash",
     "compute_file_sha256",
+    "compute_bytes_hash",
     "compute_bytes_sha256",
+    "resolve_checksum_algorithm",
     "write_checksum_manifest",
     "write_checksum_manifest_s3",
     "verify_checksum_manifest",
@@ -34,6 +60,29 @@ __all__ = [
 ]
 
 
+DEFAULT_CHECKSUM_ALGORITHM = "sha256"
+
+# Supported manifest algorithms and the package providing each
+CHECKSUM_ALGORITHMS: Dict[str, str] = {
+    "sha256": "hashlib",
+    "blake2b": "hashlib",
+    "blake3": "blake3",
+    "xxh3_64": "xxhash",
+    "xxh128": "xxhash",
+}
+
+# Local files at least this large are hashed through mmap
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+# Verification threads (override with PIPELINE_CHECKSUM_WORKERS)
+DEFAULT_VERIFY_WORKERS = 8
+
+CHECKSUM_CACHE_FILENAME = "_checksum_cache.json"
+MAX_CACHE_ENTRIES = 100_000
+
+_CHUNK_SIZE = 1024 * 1024
+
+
 class ChecksumValidationError(Exception):
     """Raised when checksum validation fails and validation_mode is 'strict'."""
 
@@ -56,6 +105,7 @@ class ChecksumManifest:
     history_mode: Optional[str] = None
     row_count: int = 0
     extra: Dict[str, Any] = field(default_factory=dict)
+    algorithm: str = DEFAULT_CHECKSUM_ALGORITHM
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -75,6 +125,7 @@ class ChecksumManifest:
             history_mode=data.get("history_mode"),
             row_count=data.get("row_count", 0),
             extra=data.get("extra", {}),
+            algorithm=data.get("algorithm", DEFAULT_CHECKSUM_ALGORITHM),
         )
 
     @classmethod
@@ -107,22 +158,119 @@ class ChecksumVerificationResult:
         return ", ".join(parts)
 
 
-def compute_file_sha256(path: Path) -> str:
-    """Compute SHA256 hash of a file.
+def _new_hasher(algorithm: str, *, large: bool = False) -> Any:
+    """Create a hasher (update() / hexdigest()) for a manifest algorithm.
+
+    Raises:
+        ValueError: If the algorithm is not supported
+        ImportError: If the algorithm's package is not installed
+    """
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    if algorithm == "blake2b":
+        return hashlib.blake2b()
+    package = CHECKSUM_ALGORITHMS.get(algorithm)
+    if package is None:
+        raise ValueError(
+            f"Unsupported checksum algorithm '{algorithm}'. "
+            f"Choose from: {', '.join(CHECKSUM_ALGORITHMS)}"
+        )
+    try:
+        module = importlib.import_module(package)
+    except ImportError:
+        raise ImportError(
+            f"Checksum algorithm '{algorithm}' requires {package}. "
+            f"Install with: pip install {package}"
+        ) from None
+    if algorithm == "blake3":
+        # A tree hash: large inputs are split across all cores
+        return module.blake3(max_threads=module.blake3.AUTO if large else 1)
+    return getattr(module, "xxh3_128" if algorithm == "xxh128" else algorithm)()
+
+
+def resolve_checksum_algorithm(algorithm: Optional[str] = None) -> str:
+    """Pick the manifest algorithm and check that it can be used.
+
+    Args:
+        algorithm: Requested algorithm; defaults to PIPELINE_CHECKSUM_ALGORITHM,
+            then sha256
+
+    Returns:
+        The algorithm name
+
+    Raises:
+        ValueError: If the algorithm is not supported
+        ImportError: If the algorithm's package is not installed
+    """
+    name = (
+        algorithm
+        or os.environ.get("PIPELINE_CHECKSUM_ALGORITHM")
+        or DEFAULT_CHECKSUM_ALGORITHM
+    ).lower()
+    _new_hasher(name)
+    return name
+
 
-    Reads file in 1MB chunks to handle large files efficiently.
+def compute_file_hash(path: Path, algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> str:
+    """Compute the hash of a file.
+
+    Reads small files in 1MB chunks and maps files of MMAP_THRESHOLD bytes
+    or more into memory, avoiding a copy per chunk.
 
     Args:
         path: File path to hash
+        algorithm: Hash algorithm (see CHECKSUM_ALGORITHMS)
 
     Returns:
         Hexadecimal digest string
     """
-    hasher = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+            hasher = _new_hasher(algorithm, large=True)
+            # The hashers release the GIL while hashing a large buffer, so
+            # mapped files hash in parallel across verification threads
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+        else:
+            hasher = _new_hasher(algorithm)
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+    return str(hasher.hexdigest())
+
+
+def compute_file_sha256(path: Path) -> str:
+    """Compute SHA256 hash of a file.
+
+    Args:
+        path: File path to hash
+
+    Returns:
+        Hexadecimal digest string
+    """
+    return compute_file_hash(path, "sha256")
+
+
+def _compute_stream_hash(stream: IO[bytes], algorithm: str) -> str:
+    """Compute the hash of a binary stream, reading it in 1MB chunks."""
+    hasher = _new_hasher(algorithm)
+    for chunk in iter(lambda: stream.read(_CHUNK_SIZE), b""):
+        hasher.update(chunk)
+    return str(hasher.hexdigest())
+
+
+def compute_bytes_hash(data: bytes, algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> str:
+    """Compute the hash of bytes.
+
+    Args:
+        data: Bytes to hash
+        algorithm: Hash algorithm (see CHECKSUM_ALGORITHMS)
+
+    Returns:
+        Hexadecimal digest string
+    """
+    hasher = _new_hasher(algorithm, large=len(data) >= MMAP_THRESHOLD)
+    hasher.update(data)
+    return str(hasher.hexdigest())
 
 
 def compute_bytes_sha256(data: bytes) -> str:
@@ -137,6 +285,132 @@ def compute_bytes_sha256(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
 
+class HashingWriter(io.RawIOBase):
+    """Binary stream that hashes bytes on their way to another stream.
+
+    Wrap the sink a file is written to, and the digest and size are known
+    when writing finishes, without reading the file back.
+
+    Example:
+        >>> with open("orders.parquet", "wb") as f:
+        ...     tee = HashingWriter(f)
+        ...     pq.write_table(table, tee)
+        >>> tee.file_entry("orders.parquet")
+        {'path': 'orders.parquet', 'size_bytes': 1234, 'sha256': '...'}
+    """
+
+    def __init__(self, sink: Any, algorithm: str = DEFAULT_CHECKSUM_ALGORITHM) -> None:
+        super().__init__()
+        self._sink = sink
+        self.algorithm = algorithm
+        self._hasher = _new_hasher(algorithm)
+        self.size_bytes = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.size_bytes
+
+    def write(self, data: Any) -> int:
+        chunk = memoryview(data).cast("B")
+        self._sink.write(chunk)
+        self._hasher.update(chunk)
+        self.size_bytes += len(chunk)
+        return len(chunk)
+
+    def flush(self) -> None:
+        self._sink.flush()
+
+    def close(self) -> None:
+        # The sink belongs to the caller; writers that close their stream
+        # (e.g., a ParquetWriter) must not close it
+        pass
+
+    @property
+    def digest(self) -> str:
+        """Hexadecimal digest of the bytes written so far."""
+        return str(self._hasher.hexdigest())
+
+    def file_entry(self, path: str) -> Dict[str, Any]:
+        """Checksum manifest entry for the bytes written so far.
+
+        The digest is stored under the algorithm name, as in manifests.
+        """
+        return {
+            "path": path,
+            "size_bytes": self.size_bytes,
+            self.algorithm: self.digest,
+        }
+
+
+class VerificationCache:
+    """Digests of files already verified, so unchanged files are not rehashed.
+
+    Entries are keyed by path, size and version (modification time for
+    local files, ETag for objects), so any rewrite of a file misses the
+    cache. The cache is a JSON file in the pipeline state directory
+    (PIPELINE_STATE_DIR) and keeps the most recent MAX_CACHE_ENTRIES.
+
+    Example:
+        >>> cache = VerificationCache()
+        >>> verify_checksum_manifest(Path("./bronze/dt=2025-01-15/"), cache=cache)
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        if path is None:
+            from pipelines.lib.state import _get_state_dir
+
+            path = _get_state_dir() / CHECKSUM_CACHE_FILENAME
+        self.path = path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: Dict[str, str] = {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                self._entries = {str(k): str(v) for k, v in data.items()}
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            pass
+
+    @staticmethod
+    def key(
+        path: str,
+        size: int,
+        version: Any,
+        algorithm: str = DEFAULT_CHECKSUM_ALGORITHM,
+    ) -> str:
+        """Cache key for one version of a file hashed with algorithm."""
+        return f"{algorithm}:{path}|{size}|{version}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached digest for key, if any."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: str, digest: str) -> None:
+        """Record the digest computed for key."""
+        with self._lock:
+            # Re-insert so the newest entries survive trimming
+            self._entries.pop(key, None)
+            self._entries[key] = digest
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed; failures are logged, not raised."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = list(self._entries.items())[-MAX_CACHE_ENTRIES:]
+            self._entries = dict(entries)
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(dict(entries)), encoding="utf-8")
+        except OSError as e:
+            logger.warning("Failed to save checksum cache %s: %s", self.path, e)
+
+
 def write_checksum_manifest(
     out_dir: Path,
     files: List[Path],
@@ -145,6 +419,8 @@ def write_checksum_manifest(
     history_mode: Optional[str] = None,
     row_count: int = 0,
     extra_metadata: Optional[Dict[str, Any]] = None,
+    file_data: Optional[Dict[str, Dict[str, Any]]] = None,
+    algorithm: str = DEFAULT_CHECKSUM_ALGORITHM,
 ) -> Path:
     """Write a checksum manifest for data files.
 
@@ -158,6 +434,10 @@ def write_checksum_manifest(
         history_mode: History mode (current_only/full_history)
         row_count: Total row count across files
         extra_metadata: Optional additional metadata to include
+        file_data: Entries already computed while writing (see
+            HashingWriter), keyed by path relative to out_dir; these files
+            are not re-read
+        algorithm: Hash algorithm (see CHECKSUM_ALGORITHMS)
 
     Returns:
         Path to the created manifest file
@@ -175,15 +455,23 @@ def write_checksum_manifest(
 
     file_entries = []
     for file_path in files:
+        # Files in subdirectories (Hive partitions) keep their relative path
+        try:
+            name = file_path.relative_to(out_dir).as_posix()
+        except ValueError:
+            name = file_path.name
+        if file_data and name in file_data:
+            file_entries.append(file_data[name])
+            continue
         if not file_path.exists():
             logger.warning("File not found for checksum: %s", file_path)
             continue
 
         file_entries.append(
             {
-                "path": file_path.name,
+                "path": name,
                 "size_bytes": file_path.stat().st_size,
-                "sha256": compute_file_sha256(file_path),
+                algorithm: compute_file_hash(file_path, algorithm),
             }
         )
 
@@ -194,6 +482,7 @@ def write_checksum_manifest(
         history_mode=history_mode,
         row_count=row_count,
         extra=extra_metadata or {},
+        algorithm=algorithm,
     )
 
     manifest_path = out_dir / "_checksums.json"
@@ -213,20 +502,23 @@ def write_checksum_manifest_s3(
     history_mode: Optional[str] = None,
     row_count: int = 0,
     extra_metadata: Optional[Dict[str, Any]] = None,
+    algorithm: str = DEFAULT_CHECKSUM_ALGORITHM,
 ) -> bool:
     """Write a checksum manifest to S3/cloud storage.
 
     This function writes checksums for files in cloud storage where we can't
     use Path objects. The caller must provide pre-computed file data including
-    the SHA256 hashes and sizes.
+    the hashes and sizes.
 
     Args:
         storage: Storage backend to write to (S3, ADLS, etc.)
-        file_data: List of dicts with {"path": filename, "size_bytes": int, "sha256": str}
+        file_data: List of dicts with {"path": filename, "size_bytes": int,
+            <algorithm>: str}
         entity_kind: Entity kind (state/event/bronze) for metadata
         history_mode: History mode (current_only/full_history)
         row_count: Total row count across files
         extra_metadata: Optional additional metadata to include
+        algorithm: Hash algorithm the file_data digests were computed with
 
     Returns:
         True if manifest was written successfully
@@ -247,6 +539,7 @@ def write_checksum_manifest_s3(
         history_mode=history_mode,
         row_count=row_count,
         extra=extra_metadata or {},
+        algorithm=algorithm,
     )
 
     try:
@@ -266,15 +559,99 @@ def write_checksum_manifest_s3(
         return False
 
 
+# (cache path, size, version) of a file, or None if it is missing
+_FileStat = Optional[Tuple[str, int, Any]]
+
+
+class _LocalFiles:
+    """Manifest and data files in a local directory."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def read_manifest(self, name: str) -> Optional[str]:
+        path = self.directory / name
+        return path.read_text(encoding="utf-8") if path.exists() else None
+
+    def stat(self, name: str) -> _FileStat:
+        path = self.directory / name
+        if not path.is_file():
+            return None
+        st = path.stat()
+        return str(path.resolve()), st.st_size, st.st_mtime_ns
+
+    def hash(self, name: str, algorithm: str) -> str:
+        return compute_file_hash(self.directory / name, algorithm)
+
+
+class _StorageFiles:
+    """Manifest and data files under an object storage prefix."""
+
+    def __init__(self, root: str, storage_options: Dict[str, Any]) -> None:
+        from pipelines.lib.storage import get_storage
+
+        self.root = root.rstrip("/") + "/"
+        self.storage = get_storage(self.root, **storage_options)
+        self._listing: Optional[Dict[str, Any]] = None
+
+    def read_manifest(self, name: str) -> Optional[str]:
+        if not self.storage.exists(name):
+            return None
+        return self.storage.read_text(name)
+
+    def stat(self, name: str) -> _FileStat:
+        if self._listing is None:
+            # One listing answers size and ETag for every file, including
+            # those in Hive partition subdirectories
+            self._listing = {
+                self.storage.relative_path(info.path): info
+                for info in self.storage.list_files("", recursive=True)
+            }
+        info = self._listing.get(name)
+        if info is None:
+            return None
+        version = info.checksum or (
+            info.modified.isoformat() if info.modified else None
+        )
+        return self.root + name, info.size, version
+
+    def hash(self, name: str, algorithm: str) -> str:
+        with self.storage.open_read(name) as body:
+            return _compute_stream_hash(body, algorithm)
+
+
+def _verify_workers(max_workers: Optional[int]) -> int:
+    if max_workers is None:
+        max_workers = int(
+            os.environ.get("PIPELINE_CHECKSUM_WORKERS", DEFAULT_VERIFY_WORKERS)
+        )
+    return max(1, max_workers)
+
+
 def verify_checksum_manifest(
-    directory: Path,
+    directory: Union[Path, str],
     manifest_name: str = "_checksums.json",
+    *,
+    storage_options: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+    cache: Optional[VerificationCache] = None,
 ) -> ChecksumVerificationResult:
     """Verify files against recorded checksums.
 
+    Files are hashed concurrently on a thread pool, with the algorithm the
+    manifest records; object storage bodies are streamed rather than
+    downloaded whole. Files whose size already differs from the manifest
+    are reported without being hashed.
+
     Args:
-        directory: Directory containing files and manifest
+        directory: Directory containing files and manifest (local path,
+            or an s3:// / abfss:// prefix)
         manifest_name: Name of the manifest file
+        storage_options: Storage backend options for object storage
+        max_workers: Hashing threads (default: PIPELINE_CHECKSUM_WORKERS
+            or DEFAULT_VERIFY_WORKERS)
+        cache: Digests of previously verified files; unchanged files are
+            not rehashed and new digests are saved to it
 
     Returns:
         ChecksumVerificationResult with verification details
@@ -286,50 +663,79 @@ def verify_checksum_manifest(
     """
     start_time = time.perf_counter()
 
-    manifest_path = directory / manifest_name
-    if not manifest_path.exists():
-        return ChecksumVerificationResult(
-            valid=False,
-            missing_files=[manifest_name],
-            verification_time_ms=0.0,
-        )
+    files: Union[_LocalFiles, _StorageFiles]
+    if isinstance(directory, str) and is_object_storage_path(directory):
+        files = _StorageFiles(directory, storage_options or {})
+    else:
+        files = _LocalFiles(Path(directory))
 
     try:
-        manifest = ChecksumManifest.from_file(manifest_path)
-    except (json.JSONDecodeError, OSError) as exc:
+        manifest_text = files.read_manifest(manifest_name)
+        if manifest_text is None:
+            return ChecksumVerificationResult(
+                valid=False,
+                missing_files=[manifest_name],
+                verification_time_ms=0.0,
+            )
+        manifest = ChecksumManifest.from_dict(json.loads(manifest_text))
+        algorithm = manifest.algorithm
+        _new_hasher(algorithm)
+    except Exception as exc:
         logger.warning("Failed to read checksum manifest: %s", exc)
         return ChecksumVerificationResult(
             valid=False,
             verification_time_ms=(time.perf_counter() - start_time) * 1000,
         )
 
+    entries = [entry for entry in manifest.files if entry.get("path")]
+    stats = {entry["path"]: files.stat(entry["path"]) for entry in entries}
+
+    def actual_hash(name: str) -> str:
+        path, size, version = stats[name]  # type: ignore[misc]
+        key = VerificationCache.key(path, size, version, algorithm)
+        if cache is not None and version is not None:
+            cached = cache.get(key)
+            if cached:
+                return cached
+        digest = files.hash(name, algorithm)
+        if cache is not None and version is not None:
+            cache.put(key, digest)
+        return digest
+
+    to_hash = [
+        entry["path"]
+        for entry in entries
+        if stats[entry["path"]] is not None
+        and stats[entry["path"]][1] == entry.get("size_bytes")  # type: ignore[index]
+    ]
+    with ThreadPoolExecutor(
+        max_workers=min(_verify_workers(max_workers), max(1, len(to_hash))),
+        thread_name_prefix="checksum",
+    ) as pool:
+        actual = dict(zip(to_hash, pool.map(actual_hash, to_hash)))
+    if cache is not None:
+        cache.save()
+
     verified_files: List[str] = []
     missing_files: List[str] = []
     mismatched_files: List[str] = []
 
-    for entry in manifest.files:
-        rel_name = entry.get("path")
-        if not rel_name:
-            continue
-
-        target = directory / rel_name
-        if not target.exists():
+    for entry in entries:
+        rel_name = entry["path"]
+        if stats[rel_name] is None:
             missing_files.append(rel_name)
             continue
 
-        expected_size = entry.get("size_bytes")
-        expected_hash = entry.get("sha256")
+        expected_hash = entry.get(algorithm)
+        actual_digest = actual.get(rel_name)
 
-        actual_size = target.stat().st_size
-        actual_hash = compute_file_sha256(target)
-
-        if actual_size != expected_size or actual_hash != expected_hash:
+        if actual_digest is None or actual_digest != expected_hash:
             mismatched_files.append(rel_name)
             logger.debug(
                 "Checksum mismatch for %s: expected %s, got %s",
                 rel_name,
                 expected_hash[:16] + "..." if expected_hash else "None",
-                actual_hash[:16] + "...",
+                actual_digest[:16] + "..." if actual_digest else "size mismatch",
             )
         else:
             verified_files.append(rel_name)
@@ -363,9 +769,11 @@ def verify_checksum_manifest(
 
 
 def validate_bronze_checksums(
-    bronze_path: Path,
+    bronze_path: Union[Path, str],
     *,
     validation_mode: str = "warn",
+    storage_options: Optional[Dict[str, Any]] = None,
+    cache: Optional[VerificationCache] = None,
 ) -> ChecksumVerificationResult:
     """Validate Bronze data checksums before Silver processing.
 
@@ -376,11 +784,14 @@ def validate_bronze_checksums(
     3. All checksums match the expected values
 
     Args:
-        bronze_path: Path to Bronze data directory
+        bronze_path: Path to Bronze data directory (local path, or an
+            s3:// / abfss:// prefix)
         validation_mode: How to handle validation failures:
             - "skip": Don't verify checksums (return valid result)
             - "warn": Log warning but continue (default)
             - "strict": Raise ChecksumValidationError on failure
+        storage_options: Storage backend options for object storage
+        cache: Verification cache, so unchanged files are not rehashed
 
     Returns:
         ChecksumVerificationResult with validation details
@@ -402,7 +813,12 @@ def validate_bronze_checksums(
         logger.debug("Checksum validation skipped for %s", bronze_path)
         return ChecksumVerificationResult(valid=True)
 
-    if not bronze_path.exists():
+    # Object storage has no directories; a missing prefix shows up as a
+    # missing manifest instead
+    is_local = not (
+        isinstance(bronze_path, str) and is_object_storage_path(bronze_path)
+    )
+    if is_local and not Path(bronze_path).exists():
         if validation_mode == "strict":
             raise ChecksumValidationError(
                 f"Bronze data directory does not exist: {bronze_path}"
@@ -413,7 +829,9 @@ def validate_bronze_checksums(
             missing_files=[str(bronze_path)],
         )
 
-    result = verify_checksum_manifest(bronze_path)
+    result = verify_checksum_manifest(
+        bronze_path, storage_options=storage_options, cache=cache
+    )
 
     if not result.valid:
         msg = f"Bronze checksum validation failed for {bronze_path}"
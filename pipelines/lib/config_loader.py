@@ -46,11 +46,14 @@ from pipelines.lib.bronze import (
     WatermarkSource,
 )
 from pipelines.lib.deprecation import warn_deprecated_fields
+from pipelines.lib.engine import EngineSettings, configure_engine
 from pipelines.lib.env import load_env_file
+from pipelines.lib.pipeline import describe_catalog
 from pipelines.lib.silver import (
     DeleteMode,
     EntityKind,
     HistoryMode,
+    MergeMode,
     MODEL_SPECS,
     SilverEntity,
     SilverModel,
@@ -422,6 +425,7 @@ __all__ = [
     "load_pipeline",
     "load_bronze_from_yaml",
     "load_silver_from_yaml",
+    "load_engine_from_yaml",
     "load_logging_from_yaml",
     "validate_yaml_config",
     "YAMLConfigError",
@@ -499,6 +503,7 @@ ENTITY_KIND_MAP = _enum_to_map(EntityKind)
 DELETE_MODE_MAP = _enum_to_map(DeleteMode)
 SILVER_MODEL_MAP = _enum_to_map(SilverModel)
 INPUT_MODE_MAP = _enum_to_map(InputMode)
+MERGE_MODE_MAP = _enum_to_map(MergeMode)
 WATERMARK_SOURCE_MAP = _enum_to_map(WatermarkSource)
 
 # Maps with aliases (base auto-generated + explicit aliases)
@@ -662,6 +667,39 @@ def load_logging_from_yaml(
         raise YAMLConfigError(f"Invalid logging configuration: {e}")
 
 
+def load_engine_from_yaml(
+    config: Dict[str, Any],
+    config_dir: Optional[Path] = None,
+) -> EngineSettings:
+    """Create DuckDB EngineSettings from YAML configuration.
+
+    Args:
+        config: Dictionary from parsed YAML (the 'duckdb' section)
+        config_dir: Directory containing the YAML file (for relative path resolution)
+
+    Returns:
+        Validated EngineSettings (apply with configure_engine)
+
+    Example YAML:
+        duckdb:
+          threads: 8
+          memory_limit: 16GB
+          temp_directory: ./.duckdb_spill   # Spill location for out-of-core work
+          preserve_insertion_order: false
+    """
+    config_dir = config_dir or Path.cwd()
+    config = dict(config or {})
+
+    temp_directory = config.get("temp_directory")
+    if temp_directory:
+        config["temp_directory"] = _resolve_path(str(temp_directory), config_dir)
+
+    try:
+        return EngineSettings.from_dict(config)
+    except (TypeError, ValueError) as e:
+        raise YAMLConfigError(f"Invalid duckdb configuration: {e}")
+
+
 def _resolve_path(path: str, config_dir: Path) -> str:
     """Resolve relative paths based on config file location.
 
@@ -1127,6 +1165,11 @@ def load_silver_from_yaml(
         raise YAMLConfigError("delete_mode is required")
     delete_mode = cast(DeleteMode, delete_mode_enum)
 
+    merge_mode = cast(
+        MergeMode,
+        _convert_enum(config, "merge_mode", MERGE_MODE_MAP, MergeMode.FULL),
+    )
+
     # Resolve paths
     source_path = config.get("source_path", "")
     if source_path:
@@ -1178,6 +1221,7 @@ def load_silver_from_yaml(
         history_mode=history_mode,
         input_mode=input_mode,
         delete_mode=delete_mode,
+        merge_mode=merge_mode,
         cdc_options=cdc_options,
         partition_by=partition_by,
         output_formats=output_formats,
@@ -1269,6 +1313,11 @@ def load_pipeline(
     if "logging" in config:
         logging_config = load_logging_from_yaml(config["logging"], config_dir)
 
+    # Apply DuckDB engine settings (optional, process-wide)
+    if "duckdb" in config:
+        engine_settings = load_engine_from_yaml(config["duckdb"], config_dir)
+        configure_engine(**engine_settings.to_config())
+
     # Parse bronze section
     bronze = None
     if "bronze" in config:
@@ -1544,8 +1593,13 @@ class PipelineFromYAML:
 
         return issues
 
-    def explain(self) -> str:
-        """Return a human-readable explanation of what this pipeline does."""
+    def explain(self, run_date: Optional[str] = None) -> str:
+        """Return a human-readable explanation of what this pipeline does.
+
+        Args:
+            run_date: When given, also summarize the Bronze partitions
+                already recorded in the entity catalog
+        """
         lines = [
             f"Pipeline: {self.name}",
             f"Config:   {self.config_path}",
@@ -1566,9 +1620,11 @@ class PipelineFromYAML:
                     f"  Target Path:  {self.bronze.target_path}",
                     f"  Load Pattern: {self.bronze.load_pattern.value}",
                     f"  Input Mode:   {input_mode_str}",
-                    "",
                 ]
             )
+            if run_date:
+                lines.extend(describe_catalog(self.bronze, run_date))
+            lines.append("")
 
         if self.silver:
             lines.extend(
@@ -19,7 +19,9 @@ __all__ = [
     "dedupe_exact",
     "dedupe_latest",
     "filter_incremental",
+    "merge_history",
     "rank_by_keys",
+    "union_by_name",
     "union_dedupe",
 ]
 
@@ -133,6 +135,94 @@ def build_history(
     )
 
 
+def _conform(t: ibis.Table, schema: ibis.Schema) -> ibis.Table:
+    """Select t's columns in schema order and types, null-filling missing ones."""
+    exprs = []
+    for name, dtype in schema.items():
+        if name not in t.columns:
+            exprs.append(ibis.null(dtype).name(name))
+        elif t[name].type() != dtype:
+            exprs.append(t[name].cast(dtype).name(name))
+        else:
+            exprs.append(t[name])
+    return t.select(*exprs)
+
+
+def union_by_name(first: ibis.Table, second: ibis.Table) -> ibis.Table:
+    """Union two tables whose columns may differ in order, type or presence.
+
+    Columns are matched by name: second's types win, and columns missing on
+    either side are filled with nulls.
+
+    Args:
+        first: Table whose rows come first (e.g., the previous output)
+        second: Table whose schema wins (e.g., the new records)
+
+    Returns:
+        The union of both tables, typed by second's schema
+    """
+    second_schema = second.schema()
+    first_schema = first.schema()
+    schema = ibis.schema(
+        list(second_schema.items())
+        + [(n, t) for n, t in first_schema.items() if n not in second_schema]
+    )
+    return _conform(first, schema).union(_conform(second, schema))
+
+
+def merge_history(
+    history: ibis.Table,
+    changes: ibis.Table,
+    keys: List[str],
+    ts_col: str,
+    *,
+    effective_from_name: str = "effective_from",
+    effective_to_name: str = "effective_to",
+    is_current_name: str = "is_current",
+) -> ibis.Table:
+    """Apply new changes to an existing SCD Type 2 history.
+
+    Only keys that appear in changes are re-historized: their existing
+    versions are combined with the changes and passed through
+    build_history, which closes the previously open version and adds the
+    new ones (late-arriving changes are slotted into place). Rows for all
+    other keys pass through untouched, so the window never runs over the
+    whole history.
+
+    Args:
+        history: Existing output of build_history
+        changes: New records (without SCD2 columns)
+        keys: List of columns that form the natural key
+        ts_col: Timestamp column indicating when the change occurred
+        effective_from_name: Name of the effective_from column
+        effective_to_name: Name of the effective_to column
+        is_current_name: Name of the is_current flag column
+
+    Returns:
+        The full history with the changes applied
+
+    Example:
+        >>> history = con.read_parquet("silver/products/dt=2025-01-14/*.parquet")
+        >>> changes = con.read_parquet("bronze/products/dt=2025-01-15/*.parquet")
+        >>> merged = merge_history(history, changes, ["product_id"], "updated_at")
+    """
+    history_columns = [effective_from_name, effective_to_name, is_current_name]
+    changed_keys = changes.select(*keys).distinct()
+
+    untouched = history.anti_join(changed_keys, keys)
+    affected = history.semi_join(changed_keys, keys).drop(*history_columns)
+
+    rebuilt = build_history(
+        union_by_name(affected, changes),
+        keys,
+        ts_col,
+        effective_from_name=effective_from_name,
+        effective_to_name=effective_to_name,
+        is_current_name=is_current_name,
+    )
+    return _conform(untouched, rebuilt.schema()).union(rebuilt)
+
+
 def dedupe_exact(t: ibis.Table) -> ibis.Table:
     """Remove exact duplicate rows.
 
@@ -20,11 +20,6 @@ logger = get_structlog_logger(__name__)
 #   - severity: "warning" or "info" (info for soft deprecations)
 DEPRECATED_FIELDS: Dict[str, Dict[str, Any]] = {
     # Bronze deprecated fields (not implemented or to be removed)
-    "bronze.chunk_size": {
-        "message": "chunk_size is not implemented and will be removed in a future version",
-        "replacement": None,
-        "severity": "warning",
-    },
     "bronze.full_refresh_days": {
         "message": "full_refresh_days is not implemented and will be removed in a future version",
         "replacement": None,
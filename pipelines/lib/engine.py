@@ -0,0 +1,303 @@
+"""Shared DuckDB execution engine.
+
+Bronze, Silver, watermark scans and the artifact writer all execute their
+Ibis expressions on DuckDB. Rather than each step opening a fresh
+connection (and re-loading httpfs and the S3 settings every time), they
+ask this module for one.
+
+One in-memory DuckDB database is kept per distinct S3 configuration,
+created with the tuned settings below and configured for S3 exactly once.
+Each thread gets its own cursor on that database, since a DuckDB
+connection must not be used from several threads at once; the cursor is
+released when its thread exits. Cursors share
+the database's buffer pool, so ``memory_limit`` bounds the whole process
+and larger-than-memory work spills to ``temp_directory``.
+
+Settings are read from the environment and may be overridden by the
+``duckdb:`` section of a pipeline YAML:
+
+    duckdb:
+      threads: 8
+      memory_limit: 16GB
+      temp_directory: /mnt/scratch/duckdb
+      preserve_insertion_order: false
+      enable_object_cache: true
+
+Usage:
+    from pipelines.lib.engine import get_engine
+
+    con = get_engine()                    # local files only
+    con = get_engine(storage_options)     # configured for S3/MinIO
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields, replace
+from pathlib import Path
+from typing import Any, Dict, Generator, Optional, Tuple
+
+import ibis  # type: ignore[import-untyped]
+
+from pipelines.lib.observability import get_structlog_logger
+from pipelines.lib.storage_config import (
+    _configure_duckdb_s3,
+    _duckdb_s3_settings,
+)
+
+logger = get_structlog_logger(__name__)
+
+__all__ = [
+    "EngineSettings",
+    "close_all_engines",
+    "configure_engine",
+    "get_engine",
+    "get_engine_settings",
+    "materialized",
+]
+
+# Environment variables for each engine setting
+ENGINE_ENV_VARS: Dict[str, str] = {
+    "threads": "PIPELINE_DUCKDB_THREADS",
+    "memory_limit": "PIPELINE_DUCKDB_MEMORY_LIMIT",
+    "temp_directory": "PIPELINE_DUCKDB_TEMP_DIRECTORY",
+    "preserve_insertion_order": "PIPELINE_DUCKDB_PRESERVE_INSERTION_ORDER",
+    "enable_object_cache": "PIPELINE_DUCKDB_OBJECT_CACHE",
+}
+
+
+@dataclass(frozen=True)
+class EngineSettings:
+    """DuckDB tuning settings; None leaves DuckDB's default in place.
+
+    Attributes:
+        threads: Worker threads per query
+        memory_limit: Buffer pool limit for the process (e.g., "8GB")
+        temp_directory: Where operators spill when memory_limit is reached
+        preserve_insertion_order: Set False to let large scans and writes
+            reorder rows, which reduces memory use
+        enable_object_cache: Cache Parquet metadata between queries
+    """
+
+    threads: Optional[int] = None
+    memory_limit: Optional[str] = None
+    temp_directory: Optional[str] = None
+    preserve_insertion_order: Optional[bool] = None
+    enable_object_cache: Optional[bool] = None
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "EngineSettings":
+        """Build settings from a YAML ``duckdb:`` section or env values."""
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(config) - known)
+        if unknown:
+            raise ValueError(
+                f"Unknown duckdb setting(s): {', '.join(unknown)}. "
+                f"Valid settings: {', '.join(sorted(known))}"
+            )
+
+        values: Dict[str, Any] = {}
+        for name, value in config.items():
+            if value is None or value == "":
+                continue
+            if name == "threads":
+                value = int(value)
+                if value < 1:
+                    raise ValueError("duckdb threads must be at least 1")
+            elif name in ("preserve_insertion_order", "enable_object_cache"):
+                if isinstance(value, str):
+                    value = value.lower() in ("true", "1", "yes")
+                else:
+                    value = bool(value)
+            else:
+                value = str(value)
+            values[name] = value
+        return cls(**values)
+
+    @classmethod
+    def from_env(cls) -> "EngineSettings":
+        """Read settings from the PIPELINE_DUCKDB_* environment variables."""
+        return cls.from_dict(
+            {
+                name: os.environ[env_var]
+                for name, env_var in ENGINE_ENV_VARS.items()
+                if os.environ.get(env_var)
+            }
+        )
+
+    def merge(self, overrides: "EngineSettings") -> "EngineSettings":
+        """Return these settings with any non-None overrides applied."""
+        return replace(
+            self, **{k: v for k, v in asdict(overrides).items() if v is not None}
+        )
+
+    def to_config(self) -> Dict[str, Any]:
+        """DuckDB configuration dict (only the settings that are set)."""
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+
+# Settings applied through configure_engine (e.g., from pipeline YAML);
+# these take precedence over the environment
+_overrides = EngineSettings()
+
+# One root database per S3 configuration, and one cursor per thread on it.
+# Cursors live in thread-local storage so they are released with their
+# thread; _generation invalidates them when close_all_engines runs.
+_lock = threading.Lock()
+_databases: Dict[Tuple[str, ...], Any] = {}
+_local = threading.local()
+_generation = 0
+
+
+def _thread_cursors() -> Dict[Tuple[str, ...], Any]:
+    """The calling thread's cursors, keyed by S3 configuration."""
+    if getattr(_local, "generation", None) != _generation:
+        _local.cursors = {}
+        _local.generation = _generation
+    cursors: Dict[Tuple[str, ...], Any] = _local.cursors
+    return cursors
+
+
+def get_engine_settings() -> EngineSettings:
+    """Effective engine settings (environment, then configure_engine)."""
+    return EngineSettings.from_env().merge(_overrides)
+
+
+def _apply_settings(con: Any, settings: EngineSettings) -> None:
+    for name, value in settings.to_config().items():
+        if isinstance(value, bool):
+            literal = str(value).lower()
+        elif isinstance(value, int):
+            literal = str(value)
+        else:
+            literal = "'" + str(value).replace("'", "''") + "'"
+        con.raw_sql(f"SET {name} = {literal}")
+
+
+def configure_engine(**settings: Any) -> EngineSettings:
+    """Override engine settings for this process.
+
+    Accepts the EngineSettings fields as keyword arguments; values given
+    here win over the PIPELINE_DUCKDB_* environment variables. Databases
+    that are already open are updated in place.
+
+    Returns:
+        The effective settings after the change
+    """
+    global _overrides
+
+    requested = EngineSettings.from_dict(settings)
+    with _lock:
+        _overrides = _overrides.merge(requested)
+        effective = EngineSettings.from_env().merge(_overrides)
+        if effective.temp_directory:
+            Path(effective.temp_directory).mkdir(parents=True, exist_ok=True)
+        for root in _databases.values():
+            _apply_settings(root, requested)
+
+    logger.debug("duckdb_engine_configured", **effective.to_config())
+    return effective
+
+
+def _s3_key(storage_options: Optional[Dict[str, Any]]) -> Tuple[str, ...]:
+    if storage_options is None:
+        return ()
+    return tuple(_duckdb_s3_settings(storage_options))
+
+
+def get_engine(storage_options: Optional[Dict[str, Any]] = None) -> ibis.BaseBackend:
+    """Get the calling thread's DuckDB connection.
+
+    Args:
+        storage_options: Pass the pipeline's storage options when reading or
+            writing object storage; the connection is then configured for
+            S3/MinIO. None returns a connection without S3 settings.
+
+    Returns:
+        An Ibis DuckDB backend, reused for later calls from the same thread
+        with the same S3 configuration
+    """
+    key = _s3_key(storage_options)
+
+    with _lock:
+        cursors = _thread_cursors()
+        con = cursors.get(key)
+        if con is not None:
+            return con
+
+        root = _databases.get(key)
+        if root is None:
+            settings = get_engine_settings()
+            if settings.temp_directory:
+                Path(settings.temp_directory).mkdir(parents=True, exist_ok=True)
+            root = ibis.duckdb.connect(**settings.to_config())
+            if key:
+                _configure_duckdb_s3(root, storage_options)
+            _databases[key] = root
+            logger.debug(
+                "duckdb_engine_created",
+                s3=bool(key),
+                **settings.to_config(),
+            )
+
+        con = ibis.duckdb.from_connection(root.con.cursor())
+        cursors[key] = con
+        return con
+
+
+@contextmanager
+def materialized(
+    con: ibis.BaseBackend, table: Any, name: str
+) -> Generator[ibis.Table, None, None]:
+    """Execute an expression once into a temp table for the block's duration.
+
+    Use when a plan (e.g., a window dedupe) would otherwise be re-executed
+    by several consumers such as counts, writes and secondary outputs. The
+    temp table is private to the connection's cursor and may spill to
+    temp_directory; it is dropped when the block exits.
+
+    Args:
+        con: Connection from get_engine that the table expression is bound to
+        table: Expression to execute, or an in-memory (e.g., Arrow) table
+        name: Temp table name; replaced if it already exists
+
+    Yields:
+        The materialized table
+    """
+    # Drop with raw SQL: create_table(overwrite=True) depends on sqlglot
+    # emitting DROP statements that not every supported version gets right
+    quoted = '"' + name.replace('"', '""') + '"'
+    con.raw_sql(f"DROP TABLE IF EXISTS {quoted}")
+    try:
+        yield con.create_table(name, table, temp=True)
+    finally:
+        con.raw_sql(f"DROP TABLE IF EXISTS {quoted}")
+
+
+def close_all_engines() -> None:
+    """Close every cached connection and database.
+
+    Called automatically at interpreter exit; call it explicitly to release
+    memory and spill files in long-lived processes. The next get_engine
+    call opens fresh databases. Cursors held by other threads are dropped
+    on those threads' next get_engine call, or when they exit.
+    """
+    global _generation
+
+    with _lock:
+        cursors = list(_thread_cursors().values())
+        roots = list(_databases.values())
+        _databases.clear()
+        _generation += 1
+
+    for con in cursors + roots:
+        try:
+            con.disconnect()
+        except Exception as e:
+            logger.debug("duckdb_engine_close_failed", error=str(e))
+
+
+atexit.register(close_all_engines)
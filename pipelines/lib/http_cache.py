@@ -0,0 +1,232 @@
+"""On-disk cache of API responses for HTTP conditional requests.
+
+Reference endpoints often return the same payload day after day. With the
+response cache enabled, ApiSource keeps each page body together with its
+ETag and Last-Modified validators, sends If-None-Match / If-Modified-Since
+on the next run, and reuses the cached body when the server answers
+304 Not Modified, so an unchanged page costs one empty round trip.
+
+Entries are keyed by URL, query parameters, request headers (which carry
+bearer tokens and API keys) and basic-auth credentials, so sources calling
+one endpoint as different callers never share validators or bodies. Each
+entry is stored as two files:
+
+    <cache dir>/<key>.json   # url, validators, body size
+    <cache dir>/<key>.body   # raw response body
+
+Responses fetched during a run are staged and only become visible when
+the run commits, so a failed Bronze write never leaves behind validators
+for data that was not written. The cache is bounded by total body size;
+the least recently used entries are evicted first (body mtimes are
+touched on every hit).
+
+Usage:
+    from pipelines.lib.http_cache import ResponseCache
+
+    cache = ResponseCache(Path("/var/cache/pipelines/api"))
+    key = cache.key("https://api.example.com/v1/items", {"page": 1}, headers)
+    cached = cache.get(key)
+    headers = cached.conditional_headers() if cached else {}
+    ...
+    cache.stage(key, response)
+    cache.commit()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import httpx
+
+from pipelines.lib.observability import get_structlog_logger
+
+logger = get_structlog_logger(__name__)
+
+__all__ = ["CachedResponse", "ResponseCache"]
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_BODY_SUFFIX = ".body"
+_META_SUFFIX = ".json"
+_STAGED_SUFFIX = ".staged"
+
+# Headers that vary per request without changing the response's identity
+_VOLATILE_HEADERS = frozenset(
+    {"if-none-match", "if-modified-since", "date", "x-request-id", "traceparent"}
+)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Validators and body location of one cached response."""
+
+    path: Path
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers asking the server to answer 304 if nothing changed."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def read(self) -> bytes:
+        """Return the cached body; raises OSError if it was evicted."""
+        return self.path.read_bytes()
+
+
+class ResponseCache:
+    """LRU cache of response bodies and validators in a local directory.
+
+    Safe to share between the threads of one run; separate runs may share
+    a directory, with a concurrent eviction at worst causing a cache miss.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._staged: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def key(
+        url: str,
+        params: Mapping[str, Any],
+        headers: Optional[Mapping[str, str]] = None,
+        auth: Optional[Tuple[str, str]] = None,
+    ) -> str:
+        """Cache key for a GET of url as one caller.
+
+        Headers (except validators and per-request ones such as Date) and
+        basic-auth credentials are part of the key; only its hash is
+        stored, never the credentials.
+        """
+        identity = json.dumps(
+            [
+                url,
+                sorted((str(k), str(v)) for k, v in params.items()),
+                sorted(
+                    (k.lower(), str(v))
+                    for k, v in (headers or {}).items()
+                    if k.lower() not in _VOLATILE_HEADERS
+                ),
+                list(auth) if auth else None,
+            ]
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the committed entry for key and mark it recently used."""
+        body = self.directory / f"{key}{_BODY_SUFFIX}"
+        try:
+            meta = json.loads((self.directory / f"{key}{_META_SUFFIX}").read_text())
+            os.utime(body)
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(
+            path=body,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+
+    def stage(self, key: str, response: httpx.Response) -> bool:
+        """Stage a 200 response for commit; returns False if not cacheable.
+
+        Only responses carrying an ETag or Last-Modified validator can be
+        revalidated, so others are not kept.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified) or "no-store" in response.headers.get(
+            "Cache-Control", ""
+        ):
+            return False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        body = response.content
+        self._write_atomic(self.directory / f"{key}{_STAGED_SUFFIX}", body)
+        with self._lock:
+            self._staged[key] = {
+                "url": str(response.request.url),
+                "etag": etag,
+                "last_modified": last_modified,
+                "size": len(body),
+            }
+        return True
+
+    def commit(self) -> None:
+        """Publish every staged response, then evict down to max_bytes."""
+        with self._lock:
+            staged, self._staged = self._staged, {}
+        for key, meta in staged.items():
+            try:
+                os.replace(
+                    self.directory / f"{key}{_STAGED_SUFFIX}",
+                    self.directory / f"{key}{_BODY_SUFFIX}",
+                )
+            except OSError as e:
+                logger.debug("response_cache_commit_failed", key=key, error=str(e))
+                continue
+            self._write_atomic(
+                self.directory / f"{key}{_META_SUFFIX}",
+                json.dumps(meta).encode("utf-8"),
+            )
+        if staged:
+            logger.debug("response_cache_committed", entries=len(staged))
+        self.evict()
+
+    def discard(self) -> None:
+        """Drop staged responses without publishing them."""
+        with self._lock:
+            staged, self._staged = self._staged, {}
+        for key in staged:
+            (self.directory / f"{key}{_STAGED_SUFFIX}").unlink(missing_ok=True)
+
+    def evict(self) -> int:
+        """Remove least recently used entries until within max_bytes.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        for body in self.directory.glob(f"*{_BODY_SUFFIX}"):
+            try:
+                stat = body.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, body))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, body in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            body.with_suffix(_META_SUFFIX).unlink(missing_ok=True)
+            body.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        if removed:
+            logger.debug("response_cache_evicted", entries=removed, bytes=total)
+        return removed
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
@@ -19,6 +19,7 @@ from pipelines.lib.env import utc_now_iso
 
 if TYPE_CHECKING:
     import ibis  # type: ignore[import-untyped]
+    import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,7 @@ __all__ = [
     "maybe_dry_run",
     "maybe_skip_if_exists",
     "read_bronze",
+    "records_to_arrow",
     "write_partitioned",
     "write_silver",
     "write_silver_with_artifacts",
@@ -151,12 +153,12 @@ def read_bronze(
     Returns:
         ReadResult with table and metadata
     """
-    import ibis
+    from pipelines.lib.engine import get_engine
 
     resolved_path = path.format(run_date=run_date) if run_date else path
 
-    # Connect and read
-    con = ibis.duckdb.connect()
+    # Read on the shared engine
+    con = get_engine()
 
     if resolved_path.endswith(".csv"):
         t = con.read_csv(resolved_path)
@@ -519,26 +521,89 @@ def _infer_column_types_from_ibis(
     return columns
 
 
+def records_to_arrow(records: List[Dict[str, Any]]) -> "pa.Table":
+    """Convert a list of records (dicts) to an Arrow table.
+
+    Columns are the union of keys across all records in first-seen order,
+    and each column's type is inferred from all of its values (unlike
+    pa.Table.from_pylist, which only uses the first record's keys).
+
+    Raises:
+        pyarrow.ArrowInvalid: If a column mixes incompatible value types
+    """
+    import pyarrow as pa
+
+    if not records:
+        return pa.table({})
+    batch = pa.RecordBatch.from_struct_array(pa.array(records))
+    return pa.Table.from_batches([batch])
+
+
+# Python type names reported for records, by Arrow type predicate
+_ARROW_PYTHON_TYPE_NAMES = [
+    ("is_boolean", "bool"),
+    ("is_integer", "int"),
+    ("is_floating", "float"),
+    ("is_decimal", "Decimal"),
+    ("is_string", "str"),
+    ("is_large_string", "str"),
+    ("is_binary", "bytes"),
+    ("is_timestamp", "datetime"),
+    ("is_date", "date"),
+    ("is_time", "time"),
+    ("is_struct", "dict"),
+    ("is_list", "list"),
+]
+
+
+def _python_type_name(arrow_type: Any) -> str:
+    import pyarrow as pa
+
+    for predicate, name in _ARROW_PYTHON_TYPE_NAMES:
+        if getattr(pa.types, predicate)(arrow_type):
+            return name
+    # All-null columns carry no type information
+    return "string"
+
+
 def _infer_column_types_from_records(
     records: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
     """Infer column types from a list of records (dicts).
 
-    Column order is preserved based on first appearance across records,
-    rather than being sorted alphabetically.
+    Types come from Arrow type inference over all values, reported as
+    Python type names ("int", "str", ...). Column order is preserved based
+    on first appearance across records, rather than being sorted
+    alphabetically.
     """
+    import pyarrow as pa
+
     if not records:
         return []
 
+    try:
+        schema = records_to_arrow(records).schema
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # A column mixes types Arrow cannot unify; sample values instead
+        return _infer_column_types_from_samples(records)
+
+    return [
+        {"name": field.name, "type": _python_type_name(field.type), "nullable": True}
+        for field in schema
+    ]
+
+
+def _infer_column_types_from_samples(
+    records: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """Infer column types from the first non-null value of each key."""
     # Collect all keys while preserving insertion order (first-seen order)
-    # Using dict.fromkeys() to dedupe while preserving order
     all_keys: Dict[str, None] = {}
     for record in records:
         for key in record.keys():
             if key not in all_keys:
                 all_keys[key] = None
 
-    # Infer types from first non-null value
     columns = []
     for key in all_keys:
         sample_value = None
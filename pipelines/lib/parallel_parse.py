@@ -0,0 +1,245 @@
+"""Multi-process parsing of large line-oriented files.
+
+Large fixed-width and delimited files are split into byte ranges whose
+boundaries fall just after a newline, so every range holds whole lines.
+Each range is read and parsed by a worker process, and the resulting Arrow
+tables are returned in file order for the caller to combine.
+
+Works for local paths and remote storage (S3, ADLS) via fsspec; workers
+read only their own byte range.
+
+Records must not contain embedded newlines (e.g., quoted multi-line CSV
+fields), since ranges are cut at any newline. Parsing in ranges is
+therefore opt-in: callers pass the parse_workers option through, and only
+an explicit worker count or "auto" splits a file.
+
+Workers are started with the forkserver method (spawn where it is not
+available), so they never inherit the parent's threads, locks or open
+connections.
+
+Usage:
+    from pipelines.lib.parallel_parse import (
+        map_byte_ranges,
+        resolve_parse_workers,
+        split_byte_ranges,
+    )
+
+    ranges = split_byte_ranges("big.txt")
+    workers = resolve_parse_workers(options.get("parse_workers"), ranges)
+    if workers > 1:
+        tables = map_byte_ranges(parse_range, ranges, workers)
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar, Union
+
+import pyarrow as pa
+
+from pipelines.lib._path_utils import is_object_storage_path
+from pipelines.lib.observability import get_structlog_logger
+
+logger = get_structlog_logger(__name__)
+
+__all__ = [
+    "ByteRange",
+    "concat_range_tables",
+    "count_lines_before",
+    "map_byte_ranges",
+    "read_byte_range",
+    "resolve_parse_workers",
+    "split_byte_ranges",
+]
+
+T = TypeVar("T")
+
+# Target size of one unit of work; ranges are cut at the next newline
+RANGE_BYTES = 64 * 1024 * 1024
+
+# Below this size, process start-up costs more than it saves
+MIN_PARALLEL_BYTES = 256 * 1024 * 1024
+
+# How far to read when looking for the newline that ends a range
+_PROBE_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    """A newline-aligned slice [start, end) of a file.
+
+    Attributes:
+        path: Local path or remote URL (s3://, abfss://, ...)
+        start: First byte of the range (start of a line)
+        end: One past the last byte (just after a newline, or end of file)
+        storage_options: fsspec options for remote paths
+    """
+
+    path: str
+    start: int
+    end: int
+    storage_options: Dict[str, Any] = field(default_factory=dict, compare=False)
+
+
+def _open_binary(path: str, storage_options: Optional[Dict[str, Any]] = None) -> Any:
+    if is_object_storage_path(path):
+        import fsspec  # type: ignore[import-untyped]
+
+        return fsspec.open(path, mode="rb", **(storage_options or {})).open()
+    return open(path, "rb")
+
+
+def _file_size(path: str, storage_options: Optional[Dict[str, Any]] = None) -> int:
+    if is_object_storage_path(path):
+        import fsspec
+
+        fs, fs_path = fsspec.core.url_to_fs(path, **(storage_options or {}))
+        return int(fs.size(fs_path))
+    return os.path.getsize(path)
+
+
+def read_byte_range(byte_range: ByteRange) -> bytes:
+    """Read the bytes of a range (local or remote)."""
+    with _open_binary(byte_range.path, byte_range.storage_options) as f:
+        f.seek(byte_range.start)
+        data: bytes = f.read(byte_range.end - byte_range.start)
+    return data
+
+
+def split_byte_ranges(
+    path: str,
+    storage_options: Optional[Dict[str, Any]] = None,
+    range_bytes: Optional[int] = None,
+) -> List[ByteRange]:
+    """Split a file into newline-aligned byte ranges of about range_bytes.
+
+    Args:
+        path: Local path or remote URL
+        storage_options: fsspec options for remote paths
+        range_bytes: Target range size (default RANGE_BYTES)
+
+    Returns:
+        Ranges covering the whole file, in order (empty for an empty file)
+    """
+    range_bytes = range_bytes or RANGE_BYTES
+    storage_options = dict(storage_options or {})
+    size = _file_size(path, storage_options)
+
+    boundaries = [0]
+    with _open_binary(path, storage_options) as f:
+        while boundaries[-1] + range_bytes < size:
+            pos = boundaries[-1] + range_bytes
+            f.seek(pos)
+            # Advance to just past the next newline
+            while pos < size:
+                probe = f.read(_PROBE_BYTES)
+                if not probe:
+                    pos = size
+                    break
+                newline = probe.find(b"\n")
+                if newline != -1:
+                    pos += newline + 1
+                    break
+                pos += len(probe)
+            if pos >= size:
+                break
+            boundaries.append(pos)
+    boundaries.append(size)
+
+    return [
+        ByteRange(path, start, end, storage_options)
+        for start, end in zip(boundaries, boundaries[1:])
+        if end > start
+    ]
+
+
+def resolve_parse_workers(
+    requested: Optional[Union[int, str]], ranges: Sequence[ByteRange]
+) -> int:
+    """Decide how many worker processes to parse with.
+
+    Args:
+        requested: options.parse_workers - None (the default) parses
+            in-process, "auto" uses all CPUs for files of at least
+            MIN_PARALLEL_BYTES, and an int asks for that many workers
+        ranges: Ranges of the file to parse
+
+    Returns:
+        Number of workers (1 means parse in-process)
+    """
+    if requested is None or not ranges:
+        return 1
+    if requested == "auto":
+        size = ranges[-1].end - ranges[0].start
+        if size < MIN_PARALLEL_BYTES:
+            return 1
+        requested = os.cpu_count() or 1
+    return max(1, min(int(requested), len(ranges)))
+
+
+def concat_range_tables(tables: Sequence[pa.Table]) -> pa.Table:
+    """Concatenate per-range tables whose inferred types may differ.
+
+    Compatible types are promoted (e.g., int64 + float64). Columns whose
+    types cannot be reconciled across ranges are landed as strings.
+    """
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pass
+
+    names = tables[0].column_names
+    conflicting = {
+        name
+        for name in names
+        if len({t.schema.field(name).type for t in tables if name in t.column_names})
+        > 1
+    }
+    logger.warning("parallel_parse_types_conflict", columns=sorted(conflicting))
+    recast = [
+        t.cast(
+            pa.schema(
+                pa.field(f.name, pa.string()) if f.name in conflicting else f
+                for f in t.schema
+            )
+        )
+        for t in tables
+    ]
+    return pa.concat_tables(recast, promote_options="permissive")
+
+
+def map_byte_ranges(
+    fn: Callable[[ByteRange], T], ranges: Sequence[ByteRange], workers: int
+) -> List[T]:
+    """Apply fn to each range in a process pool, returning results in order.
+
+    fn must be picklable (a module-level function or functools.partial).
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+    logger.info(
+        "parallel_parse_started",
+        path=ranges[0].path if ranges else None,
+        ranges=len(ranges),
+        workers=workers,
+    )
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        return list(pool.map(fn, ranges))
+
+
+def count_lines_before(byte_range: ByteRange) -> int:
+    """Count the lines in the file before a range (for error messages)."""
+    lines, remaining = 0, byte_range.start
+    with _open_binary(byte_range.path, byte_range.storage_options) as f:
+        while remaining > 0:
+            chunk = f.read(min(RANGE_BYTES, remaining))
+            if not chunk:
+                break
+            lines += chunk.count(b"\n")
+            remaining -= len(chunk)
+    return lines
@@ -33,7 +33,9 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from pipelines.lib.catalog import CatalogError
 
 if TYPE_CHECKING:
     from pipelines.lib.bronze import BronzeSource
@@ -41,7 +43,30 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["Pipeline"]
+__all__ = ["Pipeline", "describe_catalog"]
+
+
+def describe_catalog(bronze: "BronzeSource", run_date: str) -> List[str]:
+    """Summarize a Bronze entity's catalog for --explain output."""
+    try:
+        entries = bronze.catalog(run_date)
+    except CatalogError as e:
+        return [f"  Catalog:      (unreadable: {e})"]
+    if not entries:
+        return ["  Catalog:      (no partitions recorded)"]
+
+    latest = entries[max(entries)]
+    lines = [
+        f"  Partitions:   {len(entries)} recorded, "
+        f"{sum(e.row_count for e in entries.values()):,} rows",
+        f"  Latest:       dt={latest.dt} ({latest.load_pattern}, "
+        f"{latest.row_count:,} rows)",
+    ]
+    if latest.watermark is not None:
+        lines.append(f"  High Mark:    {latest.watermark}")
+    if len({e.schema_hash for e in entries.values()}) > 1:
+        lines.append("  Schema:       changed across partitions")
+    return lines
 
 
 @dataclass
@@ -276,9 +301,13 @@ class Pipeline:
 
         return result
 
-    def explain(self) -> str:
+    def explain(self, run_date: Optional[str] = None) -> str:
         """Return a human-readable explanation of the pipeline configuration.
 
+        Args:
+            run_date: When given, also summarize the Bronze partitions
+                already recorded in the entity catalog
+
         Returns:
             Multi-line string describing what the pipeline does
         """
@@ -302,6 +331,8 @@ class Pipeline:
             )
             if self.bronze.watermark_column:
                 lines.append(f"  Watermark:    {self.bronze.watermark_column}")
+            if run_date:
+                lines.extend(describe_catalog(self.bronze, run_date))
 
         if self.silver is not None:
             lines.extend(
@@ -13,21 +13,31 @@ Silver layer rules:
 
 from __future__ import annotations
 
+import os
+import re
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 import ibis  # type: ignore[import-untyped]
 
 from pipelines.lib.artifact_writer import write_artifacts
 from pipelines.lib.storage_config import (
     InputMode,
-    _configure_duckdb_s3,
     _extract_storage_options,
 )
+from pipelines.lib.catalog import CatalogError, read_catalog
+from pipelines.lib.engine import get_engine, materialized
 from pipelines.lib.env import utc_now_iso
-from pipelines.lib.curate import apply_cdc, build_history, dedupe_latest
+from pipelines.lib.curate import (
+    apply_cdc,
+    build_history,
+    dedupe_latest,
+    merge_history,
+    union_by_name,
+)
 from pipelines.lib.io import infer_column_types, maybe_dry_run
 from pipelines.lib._path_utils import (
     is_object_storage_path,
@@ -46,6 +56,7 @@ __all__ = [
     "EntityKind",
     "HistoryMode",
     "InputMode",
+    "MergeMode",
     "ModelSpec",
     "MODEL_SPECS",
     "SilverEntity",
@@ -68,6 +79,19 @@ class HistoryMode(Enum):
     FULL_HISTORY = "full_history"  # SCD Type 2 - keep all versions
 
 
+class MergeMode(Enum):
+    """How each run arrives at the Silver output (append_log input only).
+
+    - FULL: Re-read every Bronze partition (since the last full snapshot)
+      and curate from scratch.
+    - INCREMENTAL: Start from the previous Silver output and merge in only
+      the Bronze partitions newer than its run date.
+    """
+
+    FULL = "full"  # Recompute from all Bronze partitions
+    INCREMENTAL = "incremental"  # Previous Silver output + new partitions
+
+
 class SilverModel(Enum):
     """Pre-built Silver transformation patterns.
 
@@ -271,6 +295,27 @@ SILVER_MODEL_PRESETS: dict[str, dict[str, str]] = {
 # Uses domain=/subject= to distinguish from Bronze's system=/entity=
 DEFAULT_SILVER_TARGET = "./silver/domain={domain}/subject={subject}/dt={run_date}/"
 
+# Date partition segment (dt=YYYY-MM-DD or dt=YYYYMMDD) in a path
+_DT_PARTITION = re.compile(r"dt=(\d{4}-?\d{2}-?\d{2})")
+_DT_VALUE = re.compile(r"\d{4}-?\d{2}-?\d{2}")
+
+# Columns added by _add_metadata, replaced on every run
+_SILVER_METADATA_COLUMNS = ("_silver_curated_at", "_silver_run_date")
+
+# Temp table holding the curated result for the duration of a run
+_CURATED_TABLE = "_silver_curated"
+
+
+def _partition_date(path: str) -> Optional[str]:
+    """The dt= partition date of a path as YYYY-MM-DD, if any."""
+    match = _DT_PARTITION.search(path)
+    if not match:
+        return None
+    dt_raw = match.group(1)
+    if len(dt_raw) == 8 and "-" not in dt_raw:
+        return f"{dt_raw[:4]}-{dt_raw[4:6]}-{dt_raw[6:]}"
+    return dt_raw
+
 
 @dataclass
 class SilverEntity:
@@ -336,6 +381,7 @@ class SilverEntity:
         None  # How to interpret Bronze partitions (auto-wired from Bronze)
     )
     delete_mode: DeleteMode = DeleteMode.IGNORE  # How to handle CDC deletes
+    merge_mode: MergeMode = MergeMode.FULL  # Full recompute or incremental merge
 
     # CDC options (auto-wired from Bronze when load_pattern=cdc)
     cdc_options: Optional[Dict[str, str]] = None
@@ -553,9 +599,25 @@ class SilverEntity:
             # Sort partitions chronologically (lexicographic works for ISO dates)
             sorted_partitions = sorted(partitions)
 
+            # The entity catalog answers for every partition it records in
+            # one read; older partitions fall back to their own metadata
+            try:
+                catalog = read_catalog(
+                    base_dir, _extract_storage_options(self.storage_options)
+                )
+            except CatalogError as e:
+                logger.warning("silver_catalog_unreadable", error=str(e))
+                catalog = {}
+
+            def partition_metadata(partition: str) -> Optional[Dict[str, Any]]:
+                entry = catalog.get(partition)
+                if entry is not None:
+                    return entry.to_dict()
+                return self._read_partition_metadata(base_dir, partition)
+
             # Read metadata from LATEST partition to determine input_mode
             latest_partition = sorted_partitions[-1]
-            latest_metadata = self._read_partition_metadata(base_dir, latest_partition)
+            latest_metadata = partition_metadata(latest_partition)
 
             if not latest_metadata:
                 return (None, None)
@@ -591,7 +653,7 @@ class SilverEntity:
             boundary_date = None
 
             for partition in reversed(sorted_partitions):
-                metadata = self._read_partition_metadata(base_dir, partition)
+                metadata = partition_metadata(partition)
                 if not metadata:
                     continue
 
@@ -628,51 +690,28 @@ class SilverEntity:
     def _list_partitions(self, base_dir: str) -> List[str]:
         """List all dt=YYYY-MM-DD partitions in the base directory.
 
+        Uses the storage backend's delimiter listing, so the cost grows with
+        the number of partitions rather than the number of files in them.
+
         Returns list of partition date strings (e.g., ['2025-01-06', '2025-01-07']).
         """
-        import re
+        from pipelines.lib.storage import get_storage
 
         partitions = []
-        dt_pattern = re.compile(r"dt=(\d{4}-?\d{2}-?\d{2})")
 
         try:
-            if is_s3_path(base_dir):
-                from pipelines.lib.storage import S3Storage
-
-                bucket, prefix = parse_s3_uri(base_dir)
-                storage_opts = _extract_storage_options(self.storage_options)
-                storage = S3Storage(f"s3://{bucket}/", **storage_opts)
-
-                items = storage.list_files(prefix, recursive=True)
-                seen = set()
-                for item in items:
-                    match = dt_pattern.search(item.path)
-                    if match:
-                        dt_raw = match.group(1)
-                        # Normalize to YYYY-MM-DD format
-                        dt_norm = (
-                            f"{dt_raw[:4]}-{dt_raw[4:6]}-{dt_raw[6:]}"
-                            if len(dt_raw) == 8 and "-" not in dt_raw
-                            else dt_raw
-                        )
-                        if dt_norm not in seen:
-                            seen.add(dt_norm)
-                            partitions.append(dt_norm)
-            else:
-                # Local path
-                base = Path(base_dir)
-                if base.exists():
-                    for entry in base.iterdir():
-                        if entry.is_dir():
-                            match = dt_pattern.search(entry.name)
-                            if match:
-                                dt_raw = match.group(1)
-                                dt_norm = (
-                                    f"{dt_raw[:4]}-{dt_raw[4:6]}-{dt_raw[6:]}"
-                                    if len(dt_raw) == 8 and "-" not in dt_raw
-                                    else dt_raw
-                                )
-                                partitions.append(dt_norm)
+            storage = get_storage(
+                base_dir, **_extract_storage_options(self.storage_options)
+            )
+            for dt_raw in storage.list_partitions("", key="dt"):
+                if not _DT_VALUE.fullmatch(dt_raw):
+                    continue
+                # Normalize to YYYY-MM-DD format
+                partitions.append(
+                    f"{dt_raw[:4]}-{dt_raw[4:6]}-{dt_raw[6:]}"
+                    if len(dt_raw) == 8 and "-" not in dt_raw
+                    else dt_raw
+                )
         except Exception as e:
             logger.debug("silver_list_partitions_failed", error=str(e))
 
@@ -771,7 +810,7 @@ class SilverEntity:
             else self.subject or "silver"
         )
 
-        with step(PipelineStep.SILVER_START, subject_label):
+        with step(PipelineStep.SILVER_START, subject_label), ExitStack() as stack:
             # Validate paths at runtime (they may have been set by Pipeline)
             if not self.source_path:
                 raise ValueError(
@@ -822,19 +861,23 @@ class SilverEntity:
 
             # Read from Bronze
             with step(PipelineStep.SILVER_READ_BRONZE):
-                con = ibis.duckdb.connect()
+                # Shared engine, configured for S3 (including MinIO/custom
+                # endpoints) if source or target is cloud storage
+                uses_cloud = is_object_storage_path(source) or is_object_storage_path(
+                    target
+                )
+                con = get_engine(self.storage_options if uses_cloud else None)
 
-                # Configure S3 if source or target is cloud storage
-                if is_object_storage_path(source) or is_object_storage_path(target):
-                    _configure_duckdb_s3(
-                        con, self.storage_options
-                    )  # Pass storage_options for MinIO/custom endpoints
+                # Incremental merge starts from the previous Silver output and
+                # reads only the Bronze partitions written since
+                previous = self._read_previous_output(con, target, run_date)
+                since = previous[1] if previous else None
 
-                t = self._read_source(con, source)
-                row_count = t.count().execute()
+                source_t = self._read_source(con, source, since=since)
+                row_count = source_t.count().execute() if source_t is not None else 0
                 tracer.detail(f"Read {row_count:,} records from Bronze")
 
-            if row_count == 0:
+            if row_count == 0 and previous is None:
                 logger.warning("silver_no_source_rows", source=source)
                 return {
                     "row_count": 0,
@@ -844,22 +887,35 @@ class SilverEntity:
 
             # Select columns (if specified)
             with step(PipelineStep.SILVER_SELECT_COLUMNS):
-                t = self._select_columns(t)
-                tracer.detail(f"Selected {len(t.columns)} columns")
+                if source_t is not None:
+                    source_t = self._select_columns(source_t)
+                    tracer.detail(f"Selected {len(source_t.columns)} columns")
 
             # Apply curation based on entity kind and history mode
             with step(PipelineStep.SILVER_DEDUPLICATE):
-                t = self._curate(t)
-                curated_count = t.count().execute()
+                if previous is not None:
+                    t = self._curate_incremental(previous[0], source_t)
+                    tracer.detail(
+                        f"Merged {row_count:,} new records into Silver as of {since}"
+                    )
+                else:
+                    t = self._curate(cast(ibis.Table, source_t))
+
+                # Run the dedupe/history plan once; the count, the write and
+                # any secondary outputs all read the materialized result
+                curated = stack.enter_context(materialized(con, t, _CURATED_TABLE))
+                curated_count = int(curated.count().execute())
                 tracer.detail(f"Curated to {curated_count:,} records")
 
             # Add Silver metadata
             with step(PipelineStep.SILVER_ADD_METADATA):
-                t = self._add_metadata(t, run_date)
+                t = self._add_metadata(curated, run_date)
 
             # Write output
             with step(PipelineStep.SILVER_WRITE_OUTPUT):
-                result = self._write(t, target, run_date, source)
+                result = self._write(
+                    t, target, run_date, source, row_count=curated_count
+                )
                 tracer.detail(
                     f"Wrote {result.get('row_count', 0):,} records to {target}"
                 )
@@ -895,10 +951,18 @@ class SilverEntity:
         if self.validate_source == "skip":
             return None
 
-        from pipelines.lib.checksum import validate_bronze_checksums
+        from pipelines.lib.checksum import VerificationCache, validate_bronze_checksums
 
+        source_dir: Union[Path, str]
+        if is_object_storage_path(source):
+            # Keep URIs as strings; Path would collapse the "//" in s3://
+            base = source.split("*")[0].split("?")[0]
+            has_glob = base != source
+            if has_glob or "." in base.rstrip("/").rsplit("/", 1)[-1]:
+                base = base.rsplit("/", 1)[0]
+            source_dir = base.rstrip("/") + "/"
         # For glob patterns, extract the directory path
-        if "*" in source or "?" in source:
+        elif "*" in source or "?" in source:
             # Get the base directory before any wildcards
             parts = source.split("*")[0].split("?")[0]
             # If path ends with separator, use it directly; otherwise get parent
@@ -914,14 +978,11 @@ class SilverEntity:
             if source_dir.is_file():
                 source_dir = source_dir.parent
 
-        # Only validate if it's a local path
-        if is_object_storage_path(str(source_dir)):
-            logger.debug("silver_skip_checksum_validation", reason="cloud_source")
-            return None
-
         result = validate_bronze_checksums(
             source_dir,
             validation_mode=self.validate_source,
+            storage_options=_extract_storage_options(self.storage_options),
+            cache=VerificationCache(),
         )
 
         return {
@@ -1043,7 +1104,13 @@ class SilverEntity:
 
         return filtered or files
 
-    def _read_source(self, con: ibis.BaseBackend, source: str) -> ibis.Table:
+    def _read_source(
+        self,
+        con: ibis.BaseBackend,
+        source: str,
+        *,
+        since: Optional[str] = None,
+    ) -> Optional[ibis.Table]:
         """Read from Bronze source.
 
         Handles glob patterns (e.g., *.parquet) by expanding them first.
@@ -1051,6 +1118,12 @@ class SilverEntity:
 
         When a partition boundary was discovered (full_snapshot found), only
         files from partitions >= the boundary date are included.
+
+        Args:
+            con: DuckDB connection
+            source: Resolved source path
+            since: For incremental merges, only read APPEND_LOG partitions
+                after this date; returns None when there are none
         """
         # Use effective_input_mode (may be discovered from metadata) or fall back to self.input_mode
         effective_mode = getattr(self, "_effective_input_mode", None) or self.input_mode
@@ -1085,11 +1158,100 @@ class SilverEntity:
         if partition_boundary and effective_mode == InputMode.APPEND_LOG:
             files = self._filter_partitions_by_boundary(files, partition_boundary)
 
+        if since and effective_mode == InputMode.APPEND_LOG:
+            files = [f for f in files if (_partition_date(f) or "") > since]
+            logger.info("silver_incremental_partitions", since=since, files=len(files))
+            if not files:
+                return None
+
         # Read as CSV or parquet based on extension
         if len(files) == 1 and files[0].endswith(".csv"):
             return con.read_csv(files[0])
         return con.read_parquet(files if len(files) > 1 else files[0])
 
+    def _incremental_merge_blocker(self) -> Optional[str]:
+        """Why an incremental merge cannot be used (None if it can)."""
+        effective_mode = getattr(self, "_effective_input_mode", None) or self.input_mode
+        if effective_mode != InputMode.APPEND_LOG:
+            return "input_mode is not append_log"
+        if self.entity_kind != EntityKind.STATE:
+            return "only state entities are merged incrementally"
+        if not self.unique_columns or not self.last_updated_column:
+            return "unique_columns and last_updated_column are required"
+        if self.cdc_options:
+            return "CDC delete handling needs the full change log"
+        if self.partition_by:
+            return "partitioned Silver output"
+        return None
+
+    def _read_previous_output(
+        self, con: ibis.BaseBackend, target: str, run_date: str
+    ) -> Optional[Tuple[ibis.Table, str]]:
+        """Find the Silver output an incremental merge can start from.
+
+        Looks for the latest dt= partition of the Silver target before
+        run_date whose metadata matches this entity's keys and history mode.
+
+        Returns:
+            (previous Silver table, its run date), or None to recompute
+            from all Bronze partitions
+        """
+        if self.merge_mode != MergeMode.INCREMENTAL:
+            return None
+
+        match = _DT_PARTITION.search(target)
+        blocker = self._incremental_merge_blocker() or (
+            None if match else "target_path has no dt= partition"
+        )
+        if blocker or match is None:
+            logger.warning("silver_incremental_merge_unavailable", reason=blocker)
+            return None
+
+        base_dir = target[: match.start()].rstrip("/\\")
+        earlier = sorted(p for p in self._list_partitions(base_dir) if p < run_date)
+        if not earlier:
+            logger.info("silver_incremental_no_previous_output", target=base_dir)
+            return None
+
+        partition = earlier[-1]
+        metadata = self._read_partition_metadata(base_dir, partition)
+        if not metadata or (
+            metadata.get("history_mode") != self.history_mode.value
+            or metadata.get("unique_columns") != self.unique_columns
+            or metadata.get("last_updated_column") != self.last_updated_column
+        ):
+            logger.warning(
+                "silver_incremental_previous_output_mismatch",
+                partition=partition,
+                reason="missing metadata or different keys/history mode",
+            )
+            return None
+
+        since = str(metadata.get("run_date") or partition)
+
+        # A newer full snapshot replaces the state entirely
+        boundary = getattr(self, "_partition_boundary", None)
+        if boundary and boundary > since:
+            logger.info(
+                "silver_incremental_snapshot_boundary", boundary=boundary, since=since
+            )
+            return None
+
+        separator = "/" if is_object_storage_path(base_dir) else os.sep
+        files = self._expand_glob(
+            separator.join([base_dir, f"dt={partition}", "*.parquet"])
+        )
+        if not files:
+            return None
+
+        logger.info("silver_incremental_merge", previous=partition, since=since)
+        # The dt= directory is Silver's own partition; don't let DuckDB's
+        # hive detection overwrite a dt column carried in the data itself
+        previous = con.read_parquet(
+            files if len(files) > 1 else files[0], hive_partitioning=False
+        )
+        return previous, since
+
     def _expand_to_all_partitions(self, source: str) -> str:
         """Expand a single-partition source path to read all partitions.
 
@@ -1204,6 +1366,28 @@ class SilverEntity:
         else:
             return self._curate_event(t)
 
+    def _curate_incremental(
+        self, previous: ibis.Table, new: Optional[ibis.Table]
+    ) -> ibis.Table:
+        """Curate new Bronze rows on top of the previous Silver output.
+
+        SCD1 re-runs dedupe_latest over the previous state plus the new rows;
+        SCD2 re-historizes only the keys that changed (see merge_history).
+        """
+        previous = previous.drop(
+            *[c for c in _SILVER_METADATA_COLUMNS if c in previous.columns]
+        )
+        if new is None:
+            return previous
+
+        # _incremental_merge_blocker guarantees both are set
+        keys = self.unique_columns or []
+        ts_col = self.last_updated_column or ""
+
+        if self.history_mode == HistoryMode.FULL_HISTORY:
+            return merge_history(previous, new, keys, ts_col)
+        return dedupe_latest(union_by_name(previous, new), keys, ts_col)
+
     def _curate_state(self, t: ibis.Table) -> ibis.Table:
         """Curate a STATE entity (slowly changing dimension).
 
@@ -1269,8 +1453,14 @@ class SilverEntity:
         target: str,
         run_date: str,
         source: str,
+        *,
+        row_count: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Write to Silver target with metadata and checksums."""
+        """Write to Silver target with metadata and checksums.
+
+        When row_count is known (the curated table is materialized before
+        writing), it is passed through so the writer does not count again.
+        """
         # Determine subject name for filename
         subject_name = (
             self.subject if self.subject else self._infer_subject_name(target)
@@ -1284,6 +1474,7 @@ class SilverEntity:
             "entity_kind": self.entity_kind.value,
             "history_mode": self.history_mode.value,
             "delete_mode": self.delete_mode.value,
+            "merge_mode": self.merge_mode.value,
             "unique_columns": self.unique_columns,
             "last_updated_column": self.last_updated_column,
             "source_path": source,
@@ -1305,6 +1496,7 @@ class SilverEntity:
             entity_name=subject_name,
             columns=columns,
             run_date=run_date,
+            row_count=row_count,
             extra_metadata=silver_extra,
             storage_options=self.storage_options,
             write_metadata=True,
@@ -0,0 +1,176 @@
+"""Local staging area for Bronze extractions.
+
+Source expressions (database queries, remote files, API payloads) are
+spooled exactly once to a local Parquet file. Row counts, watermarks,
+column types and the final Bronze write are then derived from that
+single materialization instead of re-executing the source query.
+
+Usage:
+    from pipelines.lib.staging import stage_table, staging_area
+
+    with staging_area("orders") as staging_dir:
+        staged = stage_table(t, con, staging_dir, "orders")
+        print(staged.row_count)
+        write(staged.table)
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional, TYPE_CHECKING
+
+import pyarrow.parquet as pq
+
+from pipelines.lib.observability import get_structlog_logger
+
+if TYPE_CHECKING:
+    import ibis  # type: ignore[import-untyped]
+    import pyarrow as pa
+
+logger = get_structlog_logger(__name__)
+
+__all__ = [
+    "StagedTable",
+    "get_staging_root",
+    "spool_batches",
+    "spool_table",
+    "stage_table",
+    "staging_area",
+]
+
+# Environment variable to override where staging files are spooled
+STAGING_DIR_ENV_VAR = "PIPELINE_STAGING_DIR"
+
+
+@dataclass
+class StagedTable:
+    """A source table spooled to local Parquet.
+
+    Attributes:
+        table: Ibis table reading the staged Parquet file
+        path: Local path of the staged Parquet file
+        row_count: Number of rows written (from the spool, no extra query)
+    """
+
+    table: "ibis.Table"
+    path: Path
+    row_count: int
+
+
+def get_staging_root() -> Path:
+    """Return the root directory for staging files.
+
+    Uses PIPELINE_STAGING_DIR when set, otherwise the system temp directory.
+    """
+    root = os.environ.get(STAGING_DIR_ENV_VAR)
+    return Path(root) if root else Path(tempfile.gettempdir())
+
+
+@contextmanager
+def staging_area(name: str) -> Iterator[Path]:
+    """Create a private staging directory that is removed on exit.
+
+    Args:
+        name: Label included in the directory name (e.g., entity name)
+
+    Yields:
+        Path to an empty, private staging directory
+    """
+    root = get_staging_root()
+    root.mkdir(parents=True, exist_ok=True)
+    staging_dir = Path(tempfile.mkdtemp(prefix=f"staging_{name}_", dir=str(root)))
+    try:
+        yield staging_dir
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def spool_table(
+    t: "ibis.Table",
+    path: Path,
+    *,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """Stream a table expression into a local Parquet file.
+
+    Unlike stage_table, the result is not registered with a connection,
+    so this is safe to call from worker threads that each hold their own
+    source connection.
+
+    Args:
+        t: Ibis table expression to materialize (any backend)
+        path: Local Parquet file to write
+        chunk_size: Rows per Arrow batch (None = backend default)
+
+    Returns:
+        Number of rows written
+    """
+    batch_kwargs = {"chunk_size": chunk_size} if chunk_size else {}
+    return spool_batches(
+        t.to_pyarrow_batches(**batch_kwargs), path, chunk_size=chunk_size
+    )
+
+
+def spool_batches(
+    reader: "pa.RecordBatchReader",
+    path: Path,
+    *,
+    chunk_size: Optional[int] = None,
+) -> int:
+    """Stream Arrow record batches into a local Parquet file.
+
+    Args:
+        reader: Batches to write; empty batches are skipped
+        path: Local Parquet file to write
+        chunk_size: Maximum rows per row group (None = one per batch)
+
+    Returns:
+        Number of rows written
+    """
+    row_count = 0
+    with pq.ParquetWriter(str(path), reader.schema) as writer:
+        for batch in reader:
+            if batch.num_rows:
+                writer.write_batch(batch, row_group_size=chunk_size)
+                row_count += batch.num_rows
+    return row_count
+
+
+def stage_table(
+    t: "ibis.Table",
+    con: "ibis.BaseBackend",
+    staging_dir: Path,
+    name: str,
+    *,
+    chunk_size: Optional[int] = None,
+) -> StagedTable:
+    """Execute a table expression once and spool the result to local Parquet.
+
+    The expression is streamed as Arrow record batches, so the source is
+    queried exactly once and the result never needs to fit in memory.
+    Each batch is written as its own Parquet row group.
+
+    Args:
+        t: Ibis table expression to materialize (any backend)
+        con: Local DuckDB connection used to read the staged file
+        staging_dir: Directory to write the staged file into
+        name: Base name for the staged file
+        chunk_size: Rows per Arrow batch (None = backend default)
+
+    Returns:
+        StagedTable reading the local Parquet file
+    """
+    path = staging_dir / f"{name}.parquet"
+    row_count = spool_table(t, path, chunk_size=chunk_size)
+
+    logger.debug("staging_table_spooled", path=str(path), row_count=row_count)
+    return StagedTable(
+        table=con.read_parquet(str(path)),
+        path=path,
+        row_count=row_count,
+    )
@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import os
+import threading
+import uuid
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Optional, TYPE_CHECKING
-
+from typing import Any, Dict, Iterator, Optional, TYPE_CHECKING
+
+from pipelines.lib.catalog import (
+    CatalogEntry,
+    CatalogError,
+    partition_date,
+    read_catalog,
+)
 from pipelines.lib._path_utils import is_s3_path
 from pipelines.lib.env import parse_iso_datetime, utc_now_iso
 
@@ -97,6 +107,66 @@ class LateDataResult:
         )
 
 
+def _late_cutoff(watermark: str, max_lateness: Optional[timedelta]) -> str:
+    """Return the timestamp before which rows are late.
+
+    With max_lateness the cutoff is watermark - max_lateness, giving
+    late-arriving rows a grace period; otherwise it is the watermark.
+    """
+    if max_lateness is None:
+        return watermark
+    try:
+        cutoff = (parse_iso_datetime(watermark) - max_lateness).isoformat()
+    except (ValueError, TypeError) as e:
+        logger.warning(
+            "Could not parse watermark '%s' for max_lateness calculation: %s. "
+            "Using watermark directly.",
+            watermark,
+            e,
+        )
+        return watermark
+    logger.debug(
+        "Using max_lateness=%s: cutoff=%s (watermark=%s)",
+        max_lateness,
+        cutoff,
+        watermark,
+    )
+    return cutoff
+
+
+def _is_late(t: "ibis.Table", timestamp_column: str, cutoff: str) -> Any:
+    # Rows with a null timestamp cannot be placed, so they are never late
+    return (t[timestamp_column] < cutoff).fill_null(False)
+
+
+def _late_data_stats(
+    t: "ibis.Table", timestamp_column: str, cutoff: str
+) -> LateDataResult:
+    """Count and bound the late rows with a single aggregate query."""
+    late = _is_late(t, timestamp_column, cutoff)
+    column = t[timestamp_column]
+    row = (
+        t.aggregate(
+            total=t.count(),
+            late=t.count(where=late),
+            oldest=column.min(where=late),
+            newest=column.max(where=late),
+        )
+        .execute()
+        .iloc[0]
+    )
+
+    late_count = int(row["late"])
+    if late_count == 0:
+        return LateDataResult(late_count=0, total_count=int(row["total"]))
+    return LateDataResult(
+        late_count=late_count,
+        total_count=int(row["total"]),
+        oldest_late=row["oldest"],
+        newest_late=row["newest"],
+    )
+
+
 def detect_late_data(
     t: "ibis.Table",
     timestamp_column: str,
@@ -106,6 +176,9 @@ def detect_late_data(
 ) -> LateDataResult:
     """Detect rows older than the watermark (or watermark - max_lateness).
 
+    The total, late count and oldest/newest late timestamps come from one
+    aggregate, so detection costs a single scan of the table.
+
     Args:
         t: Ibis table to check
         timestamp_column: Column containing timestamps
@@ -117,54 +190,8 @@ def detect_late_data(
     Returns:
         LateDataResult with counts and timestamps of late records
     """
-    total = t.count().execute()
-
-    # Determine the cutoff timestamp
-    # If max_lateness is specified, we allow records up to that much before the watermark
-    if max_lateness is not None:
-        try:
-            # Parse watermark as datetime to apply max_lateness
-            watermark_dt = parse_iso_datetime(watermark)
-            cutoff_dt = watermark_dt - max_lateness
-            cutoff = cutoff_dt.isoformat()
-            logger.debug(
-                "Using max_lateness=%s: cutoff=%s (watermark=%s)",
-                max_lateness,
-                cutoff,
-                watermark,
-            )
-        except (ValueError, TypeError) as e:
-            logger.warning(
-                "Could not parse watermark '%s' for max_lateness calculation: %s. "
-                "Using watermark directly.",
-                watermark,
-                e,
-            )
-            cutoff = watermark
-    else:
-        cutoff = watermark
-
-    late_filter = t[timestamp_column] < cutoff
-    late_records = t.filter(late_filter)
-    late_count = late_records.count().execute()
-
-    if late_count == 0:
-        return LateDataResult(late_count=0, total_count=total)
-
-    agg = late_records.aggregate(
-        oldest=late_records[timestamp_column].min(),
-        newest=late_records[timestamp_column].max(),
-    ).execute()
-
-    oldest = agg["oldest"].iloc[0] if not agg.empty else None
-    newest = agg["newest"].iloc[0] if not agg.empty else None
-
-    return LateDataResult(
-        late_count=late_count,
-        total_count=total,
-        oldest_late=oldest,
-        newest_late=newest,
-    )
+    cutoff = _late_cutoff(watermark, max_lateness)
+    return _late_data_stats(t, timestamp_column, cutoff)
 
 
 def filter_late_data(
@@ -172,6 +199,9 @@ def filter_late_data(
     timestamp_column: str,
     watermark: str,
     config: LateDataConfig,
+    *,
+    staging_dir: Optional[Path] = None,
+    storage_options: Optional[Dict[str, Any]] = None,
 ) -> "ibis.Table":
     """Filter or reject late rows based on configuration.
 
@@ -180,46 +210,47 @@ def filter_late_data(
         timestamp_column: Column containing timestamps
         watermark: Current watermark value
         config: Late data handling configuration
+        staging_dir: QUARANTINE only - local directory (e.g., from
+            staging_area) to spool the on-time rows into; None uses a
+            process-wide staging area holding only the latest spool
+        storage_options: QUARANTINE only - storage credentials and
+            configuration for quarantine_path
 
     Returns:
         Filtered table (late records removed if mode is IGNORE or QUARANTINE)
 
-    The max_lateness setting from config is now honored:
+    The max_lateness setting from config is honored:
     - Records are only considered "late" if older than (watermark - max_lateness)
     - This provides a grace period for late-arriving data
-    """
-    result = detect_late_data(
-        t,
-        timestamp_column,
-        watermark,
-        max_lateness=config.max_lateness,
-    )
 
-    if not result.has_late_data:
-        return t
+    Each mode scans the table at most once: IGNORE returns a lazy filter,
+    WARN and REJECT run one aggregate, and QUARANTINE streams the late rows
+    to quarantine_path (any storage backend) while spooling the on-time
+    rows to local Parquet. No mode collects the batch in memory.
 
-    # Calculate the effective cutoff for filtering
-    if config.max_lateness is not None:
-        try:
-            watermark_dt = parse_iso_datetime(watermark)
-            cutoff_dt = watermark_dt - config.max_lateness
-            cutoff = cutoff_dt.isoformat()
-        except (ValueError, TypeError):
-            cutoff = watermark
-    else:
-        cutoff = watermark
+    When QUARANTINE finds late rows, the returned table reads the spooled
+    on-time rows through the shared DuckDB engine (get_engine), not t's
+    backend; execute it on its own or through that engine. Without a
+    staging_dir the spool is replaced by the next such call, so consume
+    the result first. When there are no late rows, t itself is returned.
+    """
+    cutoff = _late_cutoff(watermark, config.max_lateness)
 
     if config.mode == LateDataMode.IGNORE:
-        return t.filter(t[timestamp_column] >= cutoff)
+        return t.filter(~_is_late(t, timestamp_column, cutoff))
 
-    if config.mode == LateDataMode.WARN:
-        logger.warning(
-            "Late data detected: %d records before cutoff %s (watermark=%s, max_lateness=%s)",
-            result.late_count,
+    if config.mode == LateDataMode.QUARANTINE:
+        return _split_late_records(
+            t,
+            timestamp_column,
             cutoff,
-            watermark,
-            config.max_lateness,
+            config.quarantine_path,
+            staging_dir,
+            storage_options,
         )
+
+    result = _late_data_stats(t, timestamp_column, cutoff)
+    if not result.has_late_data:
         return t
 
     if config.mode == LateDataMode.REJECT:
@@ -227,55 +258,139 @@ def filter_late_data(
             f"Late data rejected: {result.late_count} records before cutoff {cutoff}"
         )
 
-    # config.mode == LateDataMode.QUARANTINE (or unknown future mode)
     logger.warning(
-        "Quarantining %d late records (before cutoff %s)",
+        "Late data detected: %d records before cutoff %s (watermark=%s, max_lateness=%s)",
         result.late_count,
         cutoff,
+        watermark,
+        config.max_lateness,
     )
-    # Write late records to quarantine path if configured
-    if config.quarantine_path:
-        _write_quarantine_records(t, timestamp_column, cutoff, config.quarantine_path)
-    return t.filter(t[timestamp_column] >= cutoff)
+    return t
+
+
+_LATE_FLAG = "_late_record"
+
+# Default spool area for on-time rows, removed at interpreter exit. It
+# holds only the latest spool: each call replaces the previous file.
+_late_staging = ExitStack()
+_late_staging_dir: Optional[Path] = None
+_late_spool: Optional[Path] = None
+_late_staging_lock = threading.Lock()
+
+
+def _next_default_late_spool() -> Path:
+    """Path for the next default spool, deleting the previous one."""
+    global _late_staging_dir, _late_spool
+
+    from pipelines.lib.staging import staging_area
 
+    with _late_staging_lock:
+        if _late_spool is not None:
+            _late_spool.unlink(missing_ok=True)
+        if _late_staging_dir is None or not _late_staging_dir.exists():
+            _late_staging_dir = _late_staging.enter_context(staging_area("late_data"))
+        _late_spool = _late_staging_dir / f"on_time_{uuid.uuid4().hex}.parquet"
+        return _late_spool
 
-def _write_quarantine_records(
+
+atexit.register(_late_staging.close)
+
+
+def _split_late_records(
     t: "ibis.Table",
     timestamp_column: str,
     cutoff: str,
-    quarantine_path: str,
-) -> None:
-    """Write late records to quarantine location.
+    quarantine_path: Optional[str],
+    staging_dir: Optional[Path],
+    storage_options: Optional[Dict[str, Any]] = None,
+) -> "ibis.Table":
+    """Separate on-time rows from late rows without collecting either.
+
+    The table is scanned once. Late rows are streamed to a Parquet file
+    under quarantine_path (local or cloud); on-time rows are spooled to
+    local Parquet in staging_dir and returned as a table on the shared
+    DuckDB engine reading that file, so consume it before the directory
+    is removed. If no row was late the spool is deleted and t returned.
 
     Args:
         t: Full table
         timestamp_column: Column containing timestamps
         cutoff: Cutoff timestamp - records before this are quarantined
-        quarantine_path: Path to write quarantined records
+        quarantine_path: Directory for quarantined records, or None to
+            drop them
+        staging_dir: Local directory for the spooled on-time rows, or None
+            for the process-wide late-data staging area, whose previous
+            spool is deleted first
+        storage_options: Storage credentials and configuration for
+            quarantine_path
+
+    Returns:
+        Table of the on-time rows
+
+    Raises:
+        IOError: If the quarantine file could not be stored
     """
-    try:
-        late_records = t.filter(t[timestamp_column] < cutoff)
-        late_count = late_records.count().execute()
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
 
-        if late_count == 0:
-            return
+    from pipelines.lib.engine import get_engine
+    from pipelines.lib.staging import spool_batches
+    from pipelines.lib.storage import get_storage
 
-        # Create quarantine directory
-        quarantine_dir = Path(quarantine_path)
-        quarantine_dir.mkdir(parents=True, exist_ok=True)
+    late = _is_late(t, timestamp_column, cutoff)
+    output_file = (
+        f"late_records_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.parquet"
+    )
 
-        # Write with timestamp to avoid overwriting
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        output_file = quarantine_dir / f"late_records_{timestamp}.parquet"
+    late_count = 0
+    with ExitStack() as stack:
+        writer: Optional[pq.ParquetWriter] = None
+
+        def quarantine(batch: pa.RecordBatch) -> None:
+            nonlocal late_count, writer
+            late_count += batch.num_rows
+            if quarantine_path and writer is None:
+                # Opened on the first late batch, so clean runs write nothing
+                storage = get_storage(quarantine_path, **(storage_options or {}))
+                sink = stack.enter_context(storage.open_write(output_file))
+                writer = stack.enter_context(pq.ParquetWriter(sink, batch.schema))
+            if writer is not None:
+                writer.write_batch(batch)
+
+        reader = t.mutate(**{_LATE_FLAG: late}).to_pyarrow_batches()
+        schema = reader.schema.remove(reader.schema.get_field_index(_LATE_FLAG))
+
+        def split() -> Iterator[pa.RecordBatch]:
+            for batch in reader:
+                flag = batch.column(_LATE_FLAG)
+                batch = batch.drop_columns([_LATE_FLAG])
+                late_rows = batch.filter(flag)
+                if late_rows.num_rows:
+                    quarantine(late_rows)
+                yield batch.filter(pc.invert(flag))
+
+        if staging_dir is None:
+            path = _next_default_late_spool()
+        else:
+            path = staging_dir / f"on_time_{uuid.uuid4().hex}.parquet"
+        spool_batches(pa.RecordBatchReader.from_batches(schema, split()), path)
 
-        late_records.to_parquet(str(output_file))
+    if not late_count:
+        path.unlink(missing_ok=True)
+        return t
+
+    logger.warning(
+        "Quarantining %d late records (before cutoff %s)", late_count, cutoff
+    )
+    if quarantine_path:
         logger.info(
-            "Wrote %d late records to quarantine: %s",
+            "Wrote %d late records to quarantine: %s/%s",
             late_count,
+            quarantine_path.rstrip("/"),
             output_file,
         )
-    except Exception as e:
-        logger.error("Failed to write quarantine records: %s", e)
+    return get_engine().read_parquet(str(path))
 
 
 def get_late_records(
@@ -566,15 +681,20 @@ def _find_latest_partition(
     base_path: str,
     partition_prefix: str = "dt=",
     storage_options: Optional[Dict[str, Any]] = None,
+    known_latest: Optional[str] = None,
 ) -> Optional[str]:
     """Find the latest partition directory by lexicographic sort of dt= values.
 
-    Uses get_storage() to work with any backend (local, S3, ADLS).
+    Uses get_storage() to work with any backend (local, S3, ADLS). With
+    known_latest, only partitions after it are listed (S3 StartAfter), so
+    the lookup skips the listing pages of older partitions.
 
     Args:
         base_path: Base path to search for partitions
         partition_prefix: Prefix for partition directories (default: "dt=")
         storage_options: Storage credentials and configuration
+        known_latest: A partition value known to exist (e.g., the newest
+            in the entity catalog); returned if nothing newer is listed
 
     Returns:
         Full path to latest partition, or None if no partitions exist
@@ -583,52 +703,27 @@ def _find_latest_partition(
 
     try:
         scheme, _ = parse_uri(base_path)
-        partition_values = []
 
-        if scheme == "local":
-            # For local storage, use Path directly to list directories
-            base = Path(base_path)
-            if not base.exists():
-                logger.debug("Base path does not exist: %s", base_path)
-                return None
-
-            for entry in base.iterdir():
-                if entry.is_dir() and entry.name.startswith(partition_prefix):
-                    value = entry.name[len(partition_prefix) :]
-                    partition_values.append(value)
-        else:
-            # For cloud storage (S3, ADLS), use storage backend
-            # List files recursively and extract partition directories from paths
-            storage = get_storage(base_path, **(storage_options or {}))
-            items = storage.list_files(path="", recursive=True)
-
-            # Extract unique partition directories from file paths
-            seen_partitions = set()
-            for file_info in items:
-                # Path like "dt=2025-01-15/data.parquet" or "dt=2025-01-15/_metadata.json"
-                parts = file_info.path.replace("\\", "/").split("/")
-                for part in parts:
-                    if (
-                        part.startswith(partition_prefix)
-                        and part not in seen_partitions
-                    ):
-                        value = part[len(partition_prefix) :]
-                        partition_values.append(value)
-                        seen_partitions.add(part)
-
-        if not partition_values:
+        # Delimiter/directory listing: one entry per partition, not per file
+        storage = get_storage(base_path, **(storage_options or {}))
+        partition_values = storage.list_partitions(
+            "", key=partition_prefix.rstrip("="), start_after=known_latest
+        )
+
+        if not partition_values and known_latest is None:
             logger.debug("No partitions found at %s", base_path)
             return None
 
         # Sort and get latest (lexicographic sort works for ISO dates)
-        latest_value = sorted(partition_values)[-1]
+        latest_value = (
+            sorted(partition_values)[-1] if partition_values else known_latest
+        )
         latest_partition = f"{partition_prefix}{latest_value}"
 
         # Return full path
         if scheme == "local":
             full_path = str(Path(base_path) / latest_partition)
         else:
-            storage = get_storage(base_path, **(storage_options or {}))
             full_path = storage.get_full_path(latest_partition)
 
         logger.debug("Found latest partition: %s", full_path)
@@ -657,15 +752,12 @@ def _scan_parquet_for_watermark(
         Maximum watermark value as string, or None
     """
     try:
-        import ibis
-
-        # Configure DuckDB for cloud storage if needed
-        con = ibis.duckdb.connect()
+        from pipelines.lib.engine import get_engine
 
-        if is_s3_path(partition_path):
-            from pipelines.lib.storage_config import _configure_duckdb_s3
-
-            _configure_duckdb_s3(con, storage_options or {})
+        # Shared engine, configured for cloud storage if needed
+        con = get_engine(
+            (storage_options or {}) if is_s3_path(partition_path) else None
+        )
 
         # Find parquet files in the partition
         parquet_pattern = f"{partition_path.rstrip('/')}/*.parquet"
@@ -686,6 +778,33 @@ def _scan_parquet_for_watermark(
         return None
 
 
+def _catalog_latest(
+    base_path: str,
+    catalog: Dict[str, CatalogEntry],
+    storage_options: Optional[Dict[str, Any]] = None,
+) -> Optional[str]:
+    """Newest catalogued partition date whose data is still in place.
+
+    One existence check of the partition's first data file guards against
+    partitions deleted since they were catalogued; None means the caller
+    should list every partition.
+    """
+    from pipelines.lib.storage import get_storage
+
+    if not catalog:
+        return None
+    entry = catalog[max(catalog)]
+    if not entry.files:
+        return None
+    try:
+        storage = get_storage(base_path, **(storage_options or {}))
+        if storage.exists(f"dt={entry.dt}/{entry.files[0]}"):
+            return entry.dt
+    except Exception as e:
+        logger.debug("Cannot check catalogued partition dt=%s: %s", entry.dt, e)
+    return None
+
+
 def get_watermark_from_destination(
     target_path: str,
     watermark_column: Optional[str] = None,
@@ -696,9 +815,11 @@ def get_watermark_from_destination(
     Works with any storage backend via get_storage().
 
     Fallback chain:
-    1. Read _metadata.json from latest dt= partition
-    2. If metadata missing, scan parquet for MAX(watermark_column)
-    3. Return None if no data exists
+    1. Read the latest partition's high watermark from the entity catalog
+    2. Read new_watermark (or last_watermark) from the latest dt=
+       partition's _metadata.json
+    3. If metadata missing, scan parquet for MAX(watermark_column)
+    4. Return None if no data exists
 
     Args:
         target_path: Bronze target path (base path without dt= partition)
@@ -720,28 +841,55 @@ def get_watermark_from_destination(
                 base_path = base_path[: base_path.rfind(sep) + 1]
                 break
 
-    # Find the latest partition
+    catalog = {}
+    try:
+        catalog = read_catalog(base_path, storage_options)
+    except CatalogError as e:
+        logger.warning("Ignoring unreadable entity catalog at %s: %s", base_path, e)
+
+    # Find the latest partition, listing only those newer than the catalog's
     latest_partition = _find_latest_partition(
-        base_path, partition_prefix="dt=", storage_options=storage_options
+        base_path,
+        partition_prefix="dt=",
+        storage_options=storage_options,
+        known_latest=_catalog_latest(base_path, catalog, storage_options),
     )
 
     if latest_partition is None:
         logger.debug("No partitions found, returning None for watermark")
         return None
 
+    # The entity catalog records each partition's high watermark. Only trust
+    # it for the latest partition: a newer partition written without
+    # artifacts (or by a concurrent run) has no entry yet
+    latest_entry = catalog.get(partition_date(latest_partition) or "")
+    if latest_entry is not None and latest_entry.watermark is not None:
+        logger.info(
+            "Found watermark from entity catalog: %s (partition: dt=%s)",
+            latest_entry.watermark,
+            latest_entry.dt,
+        )
+        return latest_entry.watermark
+
     # Try to read _metadata.json from the latest partition
     try:
         storage = get_storage(latest_partition, **(storage_options or {}))
         metadata_content = storage.read_text("_metadata.json")
         metadata = json.loads(metadata_content)
 
-        # Extract watermark from metadata
-        # It can be in extra.last_watermark or directly as last_watermark
+        # Extract watermark from metadata. new_watermark is the high mark
+        # of the partition's own data; partitions written before it was
+        # recorded only have the last_watermark they were extracted from.
+        # Either can be in extra or at the top level
         watermark = None
-        if "extra" in metadata and "last_watermark" in metadata["extra"]:
-            watermark = metadata["extra"]["last_watermark"]
-        elif "last_watermark" in metadata:
-            watermark = metadata["last_watermark"]
+        extra = metadata.get("extra", {})
+        for key in ("new_watermark", "last_watermark"):
+            if extra.get(key) is not None:
+                watermark = extra[key]
+            elif metadata.get(key) is not None:
+                watermark = metadata[key]
+            if watermark is not None:
+                break
 
         if watermark is not None:
             logger.info(
@@ -25,6 +25,7 @@ from pipelines.lib.storage.base import StorageBackend, StorageResult, FileInfo
 from pipelines.lib.storage.local import LocalStorage
 from pipelines.lib.storage.s3 import S3Storage
 from pipelines.lib.storage.adls import ADLSStorage
+from pipelines.lib.storage.clients import close_all_storage_clients
 from pipelines.lib.storage.fsspec_backend import FsspecStorage, get_fsspec_filesystem
 
 __all__ = [
@@ -35,6 +36,7 @@ __all__ = [
     "S3Storage",
     "ADLSStorage",
     "FsspecStorage",
+    "close_all_storage_clients",
     "get_storage",
     "get_fsspec_filesystem",
     "parse_uri",
@@ -72,7 +74,9 @@ def get_storage(path: str, **options) -> StorageBackend:
     """Get the appropriate storage backend for a path.
 
     Automatically detects the storage type from the path prefix and
-    returns the corresponding backend instance.
+    returns the corresponding backend instance. Backends are cheap to
+    create: S3 and ADLS backends with the same endpoint and credentials
+    share one cached client (see pipelines.lib.storage.clients).
 
     Args:
         path: Storage path (local path or cloud URI)
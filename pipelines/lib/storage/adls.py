@@ -5,16 +5,20 @@ from __future__ import annotations
 import fnmatch
 import logging
 import os
-from typing import Any, List, Optional
+from contextlib import contextmanager
+from typing import IO, Any, Iterator, List, Optional
 
 from pipelines.lib.storage.base import (
     FileInfo,
     StorageBackend,
     StorageResult,
     extract_filename,
+    filter_partitions,
     is_glob_pattern,
     join_storage_path,
+    partition_value,
 )
+from pipelines.lib.storage.clients import get_storage_client
 from pipelines.lib.storage_config import get_config_value
 
 logger = logging.getLogger(__name__)
@@ -156,10 +160,16 @@ class ADLSStorage(StorageBackend):
             if anon_access:
                 fs_options["anon"] = True
 
-            self._fs = adlfs.AzureBlobFileSystem(**fs_options)
+            # Shared with every backend using the same account and credentials
+            self._fs = get_storage_client(
+                "adls", fs_options, lambda: adlfs.AzureBlobFileSystem(**fs_options)
+            )
 
         return self._fs
 
+    def _listing_root(self) -> str:
+        return self._get_adls_path("")
+
     def _get_adls_path(self, path: str) -> str:
         """Get the full ADLS path (container/prefix/path)."""
         if path.startswith(("abfss://", "wasbs://", "az://")):
@@ -231,6 +241,7 @@ class ADLSStorage(StorageBackend):
                                 path=key,
                                 size=info.get("size", 0),
                                 modified=info.get("last_modified"),
+                                checksum=info.get("etag"),
                             )
                         )
             else:
@@ -244,6 +255,7 @@ class ADLSStorage(StorageBackend):
                                 path=info.get("name", ""),
                                 size=info.get("size", 0),
                                 modified=info.get("last_modified"),
+                                checksum=info.get("etag"),
                             )
                         )
 
@@ -253,6 +265,57 @@ class ADLSStorage(StorageBackend):
             logger.warning("Error listing %s: %s", adls_path, e)
             return []
 
+    def list_partitions(
+        self,
+        prefix: str = "",
+        key: str = "dt",
+        *,
+        start_after: Optional[str] = None,
+    ) -> List[str]:
+        """List partition values from a single directory listing."""
+        adls_path = self._get_adls_path(prefix)
+        try:
+            items = self.fs.ls(adls_path, detail=True)
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.warning("Error listing partitions %s: %s", adls_path, e)
+            return []
+
+        values = []
+        for info in items:
+            if isinstance(info, dict) and info.get("type") == "directory":
+                value = partition_value(str(info.get("name", "")), key)
+                if value is not None:
+                    values.append(value)
+        return filter_partitions(values, start_after)
+
+    @contextmanager
+    def open_write(self, path: str) -> Iterator[IO[bytes]]:
+        """Stream to ADLS in blocks of upload_settings() part size.
+
+        adlfs stages each block as it is written and commits the block list on
+        close, so memory stays bounded by the block size. Blocks are staged
+        one at a time; upload_concurrency applies to S3 only.
+        """
+        part_size, _ = self.upload_settings()
+        f = self.fs.open(self._get_adls_path(path), "wb", block_size=part_size)
+        try:
+            yield f
+        except BaseException:
+            # Closing would commit the partial object; discard it instead
+            discard = getattr(f, "discard", None)
+            if callable(discard):
+                discard()
+            raise
+        f.close()
+
+    @contextmanager
+    def open_read(self, path: str) -> Iterator[IO[bytes]]:
+        """Stream a file from ADLS in blocks."""
+        with self.fs.open(self._get_adls_path(path), "rb") as f:
+            yield f
+
     def read_bytes(self, path: str) -> bytes:
         """Read file contents as bytes."""
         adls_path = self._get_adls_path(path)
@@ -5,11 +5,15 @@ Defines the interface that all storage backends must implement.
 
 from __future__ import annotations
 
+import io
 import logging
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pipelines.lib.storage_config import get_config_value
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +26,15 @@ __all__ = [
     "extract_file_size",
     "extract_modified_time",
     "extract_filename",
+    "filter_partitions",
+    "partition_value",
 ]
 
 
+# Streaming upload defaults (overridable per backend or via environment)
+DEFAULT_UPLOAD_PART_SIZE_MB = 16
+DEFAULT_UPLOAD_CONCURRENCY = 4
+
 # =============================================================================
 # Storage Path Utilities
 # =============================================================================
@@ -118,6 +128,25 @@ def extract_filename(path: str) -> str:
     return path.replace("\\", "/").split("/")[-1]
 
 
+def partition_value(name: str, key: str) -> Optional[str]:
+    """Return the value of a ``key=value`` path segment, or None.
+
+    Example:
+        >>> partition_value("dt=2025-01-15/", "dt")
+        '2025-01-15'
+    """
+    name = name.replace("\\", "/").rstrip("/").rsplit("/", 1)[-1]
+    marker = f"{key}="
+    if not name.startswith(marker) or len(name) == len(marker):
+        return None
+    return name[len(marker) :]
+
+
+def filter_partitions(values: Iterable[str], start_after: Optional[str]) -> List[str]:
+    """Sort distinct partition values, keeping those after start_after."""
+    return sorted(v for v in set(values) if start_after is None or v > start_after)
+
+
 @dataclass
 class FileInfo:
     """Information about a file in storage."""
@@ -299,6 +328,116 @@ class StorageBackend(ABC):
         data = self.read_bytes(src)
         return self.write_bytes(dst, data)
 
+    @contextmanager
+    def open_read(self, path: str) -> Iterator[IO[bytes]]:
+        """Open a binary stream over the file at path.
+
+        Lets readers (e.g., checksum verification) consume large files in
+        chunks. The default implementation reads the whole file with
+        read_bytes; backends override it to stream the body.
+
+        Args:
+            path: Path to read (relative to base_path or absolute)
+        """
+        yield io.BytesIO(self.read_bytes(path))
+
+    @contextmanager
+    def open_write(self, path: str) -> Iterator[IO[bytes]]:
+        """Open a binary stream whose contents are stored at path on exit.
+
+        Lets writers (e.g., a Parquet writer) stream into storage. The
+        default implementation buffers in memory and calls write_bytes;
+        object-store backends override it to upload parts while the
+        stream is written, so memory stays bounded by the part size.
+        Nothing is stored if the block raises.
+
+        Args:
+            path: Path to write (relative to base_path or absolute)
+
+        Raises:
+            IOError: If the data could not be stored
+        """
+        buffer = io.BytesIO()
+        yield buffer
+        result = self.write_bytes(path, buffer.getvalue())
+        if not result.success:
+            raise IOError(f"Failed to write {path}: {result.error}")
+
+    def upload_settings(self) -> Tuple[int, int]:
+        """Part size (bytes) and part concurrency for streaming uploads.
+
+        Read from the ``upload_part_size_mb`` and ``upload_concurrency``
+        options, or the PIPELINE_UPLOAD_PART_SIZE_MB and
+        PIPELINE_UPLOAD_CONCURRENCY environment variables. Only the S3
+        backend uploads parts in parallel; ADLS and fsspec backends use
+        the part size alone.
+        """
+        part_size_mb = int(
+            get_config_value(
+                self.options,
+                "upload_part_size_mb",
+                "PIPELINE_UPLOAD_PART_SIZE_MB",
+                str(DEFAULT_UPLOAD_PART_SIZE_MB),
+            )
+        )
+        concurrency = int(
+            get_config_value(
+                self.options,
+                "upload_concurrency",
+                "PIPELINE_UPLOAD_CONCURRENCY",
+                str(DEFAULT_UPLOAD_CONCURRENCY),
+            )
+        )
+        return max(1, part_size_mb) * 1024 * 1024, max(1, concurrency)
+
+    def list_partitions(
+        self,
+        prefix: str = "",
+        key: str = "dt",
+        *,
+        start_after: Optional[str] = None,
+    ) -> List[str]:
+        """List the values of Hive-style ``key=value`` partitions under prefix.
+
+        Only the partition directories directly under prefix are considered,
+        so backends can answer from a directory listing instead of walking
+        every file. The default implementation lists files recursively;
+        backends override it with a delimiter/directory listing.
+
+        Args:
+            prefix: Path containing the partitions (relative to base_path)
+            key: Partition key, e.g. "dt" for dt=2025-01-15/
+            start_after: Only return values greater than this one
+
+        Returns:
+            Sorted distinct partition values (e.g., ['2025-01-14', '2025-01-15'])
+        """
+        values = set()
+        for info in self.list_files(prefix, recursive=True):
+            for segment in info.path.replace("\\", "/").split("/"):
+                value = partition_value(segment, key)
+                if value is not None:
+                    values.add(value)
+                    break
+        return filter_partitions(values, start_after)
+
+    def relative_path(self, path: str) -> str:
+        """Return a path from list_files relative to base_path.
+
+        Backends list files by their native path (bucket key, container
+        path); the relative form can be passed back to this backend's
+        read and stat methods.
+        """
+        path = path.replace("\\", "/")
+        root = self._listing_root().split("://", 1)[-1].rstrip("/")
+        if root and path.startswith(root + "/"):
+            return path[len(root) + 1 :]
+        return path
+
+    def _listing_root(self) -> str:
+        """Native path of base_path as it appears in list_files results."""
+        return ""
+
     def get_full_path(self, path: str) -> str:
         """Get the full path including base_path.
 
@@ -0,0 +1,88 @@
+"""Process-wide cache of storage clients.
+
+A pipeline run touches object storage from many places (partition listing,
+metadata reads, glob expansion, artifact writes, PolyBase DDL). Each
+S3Storage or ADLSStorage used to build its own boto3 client or adlfs
+filesystem, paying for client construction, a fresh connection pool and
+TLS handshakes every time. Backends now share clients through this cache.
+
+Clients are keyed by kind (e.g., "s3") and by every option that shapes
+them: endpoint, region, credentials, signature version, addressing style
+and SSL verification. The bucket and prefix stay on the backend, so one
+client serves every bucket on the same endpoint. boto3 clients and adlfs
+filesystems are thread-safe, so a cached client is shared by all threads.
+
+Usage:
+    from pipelines.lib.storage.clients import close_all_storage_clients
+
+    close_all_storage_clients()  # release connection pools
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+from pipelines.lib.observability import get_structlog_logger
+
+logger = get_structlog_logger(__name__)
+
+__all__ = ["close_all_storage_clients", "get_storage_client"]
+
+_lock = threading.Lock()
+_clients: Dict[Tuple[Any, ...], Any] = {}
+
+
+def _cache_key(kind: str, options: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (kind,) + tuple(sorted((k, repr(v)) for k, v in options.items()))
+
+
+def get_storage_client(
+    kind: str, options: Dict[str, Any], factory: Callable[[], Any]
+) -> Any:
+    """Return the cached client for these options, creating it once.
+
+    Args:
+        kind: Client kind, e.g. "s3" or "adls"
+        options: Everything the client is built from; equal options share
+            a client
+        factory: Builds the client on a cache miss
+
+    Returns:
+        The shared client
+    """
+    key = _cache_key(kind, options)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            # Created under the lock: boto3's default session is not
+            # thread-safe, and concurrent misses would build duplicates
+            client = factory()
+            _clients[key] = client
+            logger.debug("storage_client_created", kind=kind, cached=len(_clients))
+        return client
+
+
+def close_all_storage_clients() -> None:
+    """Close every cached client and empty the cache.
+
+    Called automatically at interpreter exit; call it explicitly to release
+    connection pools in long-lived processes or after credentials rotate.
+    The next backend operation creates a fresh client.
+    """
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+
+    for client in clients:
+        close = getattr(client, "close", None)
+        if not callable(close):
+            continue
+        try:
+            close()
+        except Exception as e:
+            logger.debug("storage_client_close_failed", error=str(e))
+
+
+atexit.register(close_all_storage_clients)
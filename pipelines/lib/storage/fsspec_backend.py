@@ -12,7 +12,8 @@ from __future__ import annotations
 import fnmatch
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator, List, Optional
 
 import fsspec  # type: ignore[import-untyped]
 from fsspec.spec import AbstractFileSystem  # type: ignore[import-untyped]
@@ -24,8 +25,10 @@ from pipelines.lib.storage.base import (
     extract_file_size,
     extract_filename,
     extract_modified_time,
+    filter_partitions,
     is_glob_pattern,
     join_storage_path,
+    partition_value,
 )
 
 logger = logging.getLogger(__name__)
@@ -145,6 +148,9 @@ class FsspecStorage(StorageBackend):
             self._fs = fsspec.filesystem(self._protocol, **self.options)
         return self._fs
 
+    def _listing_root(self) -> str:
+        return self._normalize_path("")
+
     def _normalize_path(self, path: str) -> str:
         """Normalize a path, handling both relative and absolute paths.
 
@@ -252,6 +258,7 @@ class FsspecStorage(StorageBackend):
                         path=name,
                         size=size,
                         modified=modified_dt,
+                        checksum=info.get("ETag") or info.get("etag"),
                     )
                 )
 
@@ -261,6 +268,57 @@ class FsspecStorage(StorageBackend):
             logger.warning("Error listing %s: %s", full_path, e)
             return []
 
+    def list_partitions(
+        self,
+        prefix: str = "",
+        key: str = "dt",
+        *,
+        start_after: Optional[str] = None,
+    ) -> List[str]:
+        """List partition values from a single directory listing."""
+        full_path = self._normalize_path(prefix)
+        try:
+            items = self.fs.ls(full_path, detail=True)
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.warning("Error listing partitions %s: %s", full_path, e)
+            return []
+
+        values = []
+        for info in items:
+            if isinstance(info, dict) and info.get("type") == "directory":
+                value = partition_value(str(info.get("name", "")), key)
+                if value is not None:
+                    values.append(value)
+        return filter_partitions(values, start_after)
+
+    @contextmanager
+    def open_write(self, path: str) -> Iterator[IO[bytes]]:
+        """Stream to the filesystem in blocks of upload_settings() part size.
+
+        Object-store filesystems (s3fs, gcsfs, adlfs) upload each block as it
+        fills, so memory stays bounded by the block size. Blocks are uploaded
+        one at a time; upload_concurrency applies to S3Storage only.
+        """
+        part_size, _ = self.upload_settings()
+        f = self.fs.open(self._normalize_path(path), "wb", block_size=part_size)
+        try:
+            yield f
+        except BaseException:
+            # Closing would commit the partial object; discard it instead
+            discard = getattr(f, "discard", None)
+            if callable(discard):
+                discard()
+            raise
+        f.close()
+
+    @contextmanager
+    def open_read(self, path: str) -> Iterator[IO[bytes]]:
+        """Stream a file from the filesystem in blocks."""
+        with self.fs.open(self._normalize_path(path), "rb") as f:
+            yield f
+
     def read_bytes(self, path: str) -> bytes:
         """Read file contents as bytes."""
         full_path = self._normalize_path(path)
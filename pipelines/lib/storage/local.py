@@ -5,11 +5,18 @@ from __future__ import annotations
 import fnmatch
 import logging
 import shutil
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import IO, Iterator, List, Optional
 
-from pipelines.lib.storage.base import FileInfo, StorageBackend, StorageResult
+from pipelines.lib.storage.base import (
+    FileInfo,
+    StorageBackend,
+    StorageResult,
+    filter_partitions,
+    partition_value,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -87,6 +94,30 @@ class LocalStorage(StorageBackend):
 
         return sorted(files, key=lambda f: f.path)
 
+    def list_partitions(
+        self,
+        prefix: str = "",
+        key: str = "dt",
+        *,
+        start_after: Optional[str] = None,
+    ) -> List[str]:
+        """List partition values from the directories under prefix."""
+        resolved = self._resolve_path(prefix)
+        if not resolved.is_dir():
+            return []
+        values = [
+            value
+            for entry in resolved.iterdir()
+            if entry.is_dir() and (value := partition_value(entry.name, key))
+        ]
+        return filter_partitions(values, start_after)
+
+    @contextmanager
+    def open_read(self, path: str) -> Iterator[IO[bytes]]:
+        """Open a local file for reading."""
+        with self._resolve_path(path).open("rb") as f:
+            yield f
+
     def read_bytes(self, path: str) -> bytes:
         """Read file contents as bytes."""
         resolved = self._resolve_path(path)
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import fnmatch
-from typing import Any, List, Optional
+import io
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator, List, Optional, cast
 
 import boto3
 from botocore.config import Config
@@ -13,9 +17,12 @@ from pipelines.lib.storage.base import (
     FileInfo,
     StorageBackend,
     StorageResult,
+    filter_partitions,
     is_glob_pattern,
     join_storage_path,
+    partition_value,
 )
+from pipelines.lib.storage.clients import get_storage_client
 from pipelines.lib.storage_config import get_bool_config_value, get_config_value
 
 from pipelines.lib.observability import get_structlog_logger
@@ -24,6 +31,120 @@ logger = get_structlog_logger(__name__)
 
 __all__ = ["S3Storage"]
 
+# S3 rejects multipart parts smaller than this (except the last one)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class _MultipartWriter(io.RawIOBase):
+    """Write-only stream that uploads to S3 as a multipart upload.
+
+    Bytes are buffered until a part is full, then uploaded on a thread
+    pool while writing continues. At most ``concurrency`` parts are in
+    flight; write() blocks when that limit is reached, so memory stays
+    around (concurrency + 1) * part_size whatever the object size. Objects
+    smaller than one part are sent with a single put_object instead.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        key: str,
+        part_size: int,
+        concurrency: int,
+    ) -> None:
+        super().__init__()
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._part_size = max(part_size, MIN_PART_SIZE)
+        self._buffer = bytearray()
+        self._position = 0
+        self._upload_id: Optional[str] = None
+        self._parts: List[Future] = []
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._pool = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="s3-upload"
+        )
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, data: Any) -> int:
+        chunk = memoryview(data).cast("B")
+        self._buffer += chunk
+        self._position += len(chunk)
+        while len(self._buffer) >= self._part_size:
+            part = bytes(self._buffer[: self._part_size])
+            del self._buffer[: self._part_size]
+            self._submit(part)
+        return len(chunk)
+
+    def _submit(self, data: bytes) -> None:
+        if self._upload_id is None:
+            response = self._client.create_multipart_upload(
+                Bucket=self._bucket, Key=self._key
+            )
+            self._upload_id = response["UploadId"]
+        part_number = len(self._parts) + 1
+        self._slots.acquire()
+        future = self._pool.submit(self._upload_part, part_number, data)
+        future.add_done_callback(lambda _: self._slots.release())
+        self._parts.append(future)
+
+    def _upload_part(self, part_number: int, data: bytes) -> Dict[str, Any]:
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            PartNumber=part_number,
+            UploadId=self._upload_id,
+            Body=data,
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    def commit(self) -> None:
+        """Upload what is left and complete the upload."""
+        try:
+            if self._upload_id is None:
+                self._client.put_object(
+                    Bucket=self._bucket, Key=self._key, Body=bytes(self._buffer)
+                )
+                return
+            if self._buffer:
+                self._submit(bytes(self._buffer))
+            parts = [future.result() for future in self._parts]
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=self._key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        finally:
+            self._buffer.clear()
+            self._pool.shutdown(wait=True)
+            super().close()
+
+    def abort(self) -> None:
+        """Discard uploaded parts; nothing is stored at the key."""
+        self._pool.shutdown(wait=True, cancel_futures=True)
+        self._buffer.clear()
+        if self._upload_id is not None:
+            try:
+                self._client.abort_multipart_upload(
+                    Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+                )
+            except Exception as e:
+                logger.warning("s3_multipart_abort_failed", key=self._key, error=str(e))
+        super().close()
+
+    def close(self) -> None:
+        # Closing (e.g., by a ParquetWriter) must not complete the upload;
+        # open_write commits or aborts once the writer's block ends
+        pass
+
 
 class S3Storage(StorageBackend):
     """AWS S3 storage backend using direct boto3 calls.
@@ -143,13 +264,23 @@ class S3Storage(StorageBackend):
             if addressing_style:
                 config_kwargs["s3"] = {"addressing_style": addressing_style}
 
-            if config_kwargs:
-                client_kwargs["config"] = Config(**config_kwargs)
-
-            self._client = boto3.client("s3", **client_kwargs)
+            # Shared with every backend on the same endpoint and credentials,
+            # so connection pools (and TLS sessions) are reused
+            self._client = get_storage_client(
+                "s3",
+                {**client_kwargs, **config_kwargs},
+                lambda: boto3.client(
+                    "s3",
+                    **client_kwargs,
+                    **({"config": Config(**config_kwargs)} if config_kwargs else {}),
+                ),
+            )
 
         return self._client
 
+    def _listing_root(self) -> str:
+        return self._get_s3_key("")
+
     def _get_s3_key(self, path: str) -> str:
         """Get the S3 key (path within bucket) from a relative or absolute path."""
         if path.startswith("s3://"):
@@ -280,6 +411,7 @@ class S3Storage(StorageBackend):
                             path=key,
                             size=obj.get("Size", 0),
                             modified=obj.get("LastModified"),
+                            checksum=obj.get("ETag"),
                         )
                     )
 
@@ -289,6 +421,50 @@ class S3Storage(StorageBackend):
             logger.warning("Error listing s3://%s/%s: %s", self._bucket, s3_prefix, e)
             return []
 
+    def list_partitions(
+        self,
+        prefix: str = "",
+        key: str = "dt",
+        *,
+        start_after: Optional[str] = None,
+    ) -> List[str]:
+        """List partition values with a delimiter listing.
+
+        Each partition comes back as one CommonPrefix instead of one entry
+        per object, so thousands of partitions cost a few LIST calls.
+        start_after is passed to S3 as StartAfter, skipping older pages.
+        """
+        s3_prefix = self._get_s3_key(prefix)
+        if s3_prefix and not s3_prefix.endswith("/"):
+            s3_prefix += "/"
+        partition_prefix = f"{s3_prefix}{key}="
+
+        paginate_kwargs = {
+            "Bucket": self._bucket,
+            "Prefix": partition_prefix,
+            "Delimiter": "/",
+        }
+        if start_after is not None:
+            paginate_kwargs["StartAfter"] = f"{partition_prefix}{start_after}"
+
+        values: List[str] = []
+        paginator = self.client.get_paginator("list_objects_v2")
+        try:
+            for page in paginator.paginate(**paginate_kwargs):
+                for common in page.get("CommonPrefixes", []):
+                    value = partition_value(common["Prefix"], key)
+                    if value is not None:
+                        values.append(value)
+        except Exception as e:
+            logger.warning(
+                "Error listing partitions s3://%s/%s: %s",
+                self._bucket,
+                partition_prefix,
+                e,
+            )
+            return []
+        return filter_partitions(values, start_after)
+
     def read_bytes(self, path: str) -> bytes:
         """Read file contents as bytes."""
         s3_key = self._get_s3_key(path)
@@ -296,6 +472,40 @@ class S3Storage(StorageBackend):
         content: bytes = response["Body"].read()
         return content
 
+    @contextmanager
+    def open_read(self, path: str) -> Iterator[IO[bytes]]:
+        """Stream an object body without buffering it in memory."""
+        response = self.client.get_object(
+            Bucket=self._bucket, Key=self._get_s3_key(path)
+        )
+        body = response["Body"]
+        try:
+            yield cast(IO[bytes], body)
+        finally:
+            body.close()
+
+    @contextmanager
+    def open_write(self, path: str) -> Iterator[IO[bytes]]:
+        """Stream to S3 with a multipart upload (see _MultipartWriter).
+
+        Part size and concurrency come from upload_settings(). The upload
+        is completed when the block exits and aborted if it raises.
+        """
+        part_size, concurrency = self.upload_settings()
+        writer = _MultipartWriter(
+            self.client, self._bucket, self._get_s3_key(path), part_size, concurrency
+        )
+        try:
+            yield cast(IO[bytes], writer)
+        except BaseException:
+            writer.abort()
+            raise
+        try:
+            writer.commit()
+        except BaseException:
+            writer.abort()
+            raise
+
     def write_bytes(self, path: str, data: bytes) -> StorageResult:
         """Write bytes to a file."""
         s3_key = self._get_s3_key(path)
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import os
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 import ibis  # type: ignore[import-untyped]
@@ -22,6 +22,7 @@ __all__ = [
     "InputMode",
     "S3_YAML_TO_STORAGE_OPTIONS",
     "_configure_duckdb_s3",
+    "_duckdb_s3_settings",
     "_extract_storage_options",
     "get_bool_config_value",
     "get_config_value",
@@ -181,7 +182,14 @@ def _extract_storage_options(
         )
 
     # Pass through standard S3 options (also check environment variables)
-    pass_through = ["endpoint_url", "key", "secret", "region"]
+    pass_through = [
+        "endpoint_url",
+        "key",
+        "secret",
+        "region",
+        "upload_part_size_mb",
+        "upload_concurrency",
+    ]
     env_mapping = {
         "endpoint_url": "AWS_ENDPOINT_URL",
         "key": "AWS_ACCESS_KEY_ID",
@@ -202,31 +210,21 @@ def _extract_storage_options(
     return storage_opts
 
 
-def _configure_duckdb_s3(
-    con: ibis.BaseBackend, options: Optional[Dict[str, Any]] = None
-) -> None:
-    """Configure DuckDB's httpfs extension for S3/MinIO access.
-
-    DuckDB does not automatically pick up AWS_ENDPOINT_URL environment variable,
-    so we need to explicitly configure S3 settings when using custom endpoints
-    like MinIO or LocalStack.
+def _duckdb_s3_settings(options: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Build the DuckDB SET statements for S3/MinIO access.
 
     Args:
-        con: Ibis DuckDB connection
         options: Optional dict with endpoint_url, key, secret, region
+
+    Returns:
+        SET statements to run, or an empty list when no custom endpoint is
+        configured (DuckDB then uses AWS defaults)
     """
     # Get endpoint URL using shared helper (handles ${VAR} expansion)
     endpoint_url = get_config_value(options, "endpoint_url", "AWS_ENDPOINT_URL")
     if not endpoint_url:
         # No custom endpoint - DuckDB will use AWS defaults
-        return
-
-    # Install and load httpfs extension
-    try:
-        con.raw_sql("INSTALL httpfs; LOAD httpfs;")
-    except Exception:
-        # May already be installed/loaded
-        pass
+        return []
 
     # Parse endpoint URL
     parsed = urlparse(endpoint_url)
@@ -266,6 +264,36 @@ def _configure_duckdb_s3(
         settings.append("SET enable_server_cert_verification = false;")
         settings.append("SET enable_curl_server_cert_verification = false;")
 
+    return settings
+
+
+def _configure_duckdb_s3(
+    con: ibis.BaseBackend, options: Optional[Dict[str, Any]] = None
+) -> None:
+    """Configure DuckDB's httpfs extension for S3/MinIO access.
+
+    DuckDB does not automatically pick up AWS_ENDPOINT_URL environment variable,
+    so we need to explicitly configure S3 settings when using custom endpoints
+    like MinIO or LocalStack.
+
+    Pipelines normally get an already-configured connection from
+    pipelines.lib.engine.get_engine rather than calling this directly.
+
+    Args:
+        con: Ibis DuckDB connection
+        options: Optional dict with endpoint_url, key, secret, region
+    """
+    settings = _duckdb_s3_settings(options)
+    if not settings:
+        return
+
+    # Install and load httpfs extension
+    try:
+        con.raw_sql("INSTALL httpfs; LOAD httpfs;")
+    except Exception:
+        # May already be installed/loaded
+        pass
+
     for setting in settings:
         try:
             con.raw_sql(setting)
@@ -183,6 +183,40 @@ def validate_bronze_source(source: "BronzeSourceType") -> List[ValidationIssue]:
                 )
             )
 
+    # Range-partitioned (parallel) database extraction
+    num_partitions = source.options.get("num_partitions")
+    if num_partitions is not None:
+        if not isinstance(num_partitions, int) or num_partitions < 1:
+            issues.append(
+                ValidationIssue.error(
+                    "options.num_partitions",
+                    f"num_partitions must be a positive integer, got {num_partitions!r}",
+                    'Add "num_partitions": 4 to options',
+                )
+            )
+        elif num_partitions > 1:
+            if source.source_type not in (
+                SourceType.DATABASE_MSSQL,
+                SourceType.DATABASE_POSTGRES,
+                SourceType.DATABASE_MYSQL,
+            ):
+                issues.append(
+                    ValidationIssue.error(
+                        "options.num_partitions",
+                        "Range-partitioned extraction is only supported for "
+                        "MSSQL, PostgreSQL and MySQL sources",
+                        "Remove num_partitions from options",
+                    )
+                )
+            if not (source.options.get("partition_column") or source.watermark_column):
+                issues.append(
+                    ValidationIssue.error(
+                        "options.partition_column",
+                        "num_partitions requires a numeric or date column to split on",
+                        'Add "partition_column": "id" to options or set incremental_column',
+                    )
+                )
+
     # File-specific validation
     if source.source_type in (
         SourceType.FILE_CSV,
@@ -271,7 +305,7 @@ def validate_silver_entity(entity: "SilverEntityType") -> List[ValidationIssue]:
         ...         print(issue)
     """
     # Import here to avoid circular dependency
-    from pipelines.lib.silver import EntityKind, HistoryMode
+    from pipelines.lib.silver import EntityKind, HistoryMode, MergeMode
 
     issues: List[ValidationIssue] = []
 
@@ -326,6 +360,22 @@ def validate_silver_entity(entity: "SilverEntityType") -> List[ValidationIssue]:
                 )
             )
 
+    # Incremental merge only applies to state entities without CDC
+    if entity.merge_mode == MergeMode.INCREMENTAL and (
+        entity.entity_kind != EntityKind.STATE
+        or entity.cdc_options
+        or entity.partition_by
+    ):
+        issues.append(
+            ValidationIssue.warning(
+                "merge_mode",
+                "merge_mode 'incremental' is not supported for this entity and "
+                "will recompute from all Bronze partitions",
+                "Use incremental with state entities, no cdc_options "
+                "and no partition_by",
+            )
+        )
+
     # Attribute warnings
     if entity.attributes and entity.exclude_columns:
         issues.append(
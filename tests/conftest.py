@@ -41,6 +41,26 @@ def clean_checkpoint_state() -> None:
         checkpoint_dir.mkdir(parents=True, exist_ok=True)
 
 
+@pytest.fixture(autouse=True)
+def fresh_storage_clients() -> Generator[None, None, None]:
+    """Keep cached storage clients (and patched boto3 mocks) out of other tests."""
+    from pipelines.lib.storage import close_all_storage_clients
+
+    close_all_storage_clients()
+    yield
+    close_all_storage_clients()
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiters() -> Generator[None, None, None]:
+    """Give each test its own per-host API rate limit budgets."""
+    from pipelines.lib.api import clear_rate_limiters
+
+    clear_rate_limiters()
+    yield
+    clear_rate_limiters()
+
+
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for test outputs."""
@@ -346,3 +366,38 @@ def mock_api_response():
             "has_more": False,
         },
     }
+
+
+@pytest.fixture
+def mock_api_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Factory for ApiSources whose HTTP client is served by a mock handler.
+
+    Call it with an httpx handler (request -> response) and any ApiSource
+    arguments to override. By default the source pulls /v1/items from
+    vendor at https://api.example.com into tmp_path/bronze/.
+    """
+    import httpx
+
+    from pipelines.lib.api import ApiSource
+
+    def make(handler, **overrides: Any):
+        source = ApiSource(
+            **{
+                "system": "vendor",
+                "entity": "items",
+                "base_url": "https://api.example.com",
+                "endpoint": "/v1/items",
+                "target_path": str(tmp_path / "bronze") + "/",
+                **overrides,
+            }
+        )
+        monkeypatch.setattr(
+            source,
+            "_create_httpx_client",
+            lambda: httpx.Client(
+                base_url=source.base_url, transport=httpx.MockTransport(handler)
+            ),
+        )
+        return source
+
+    return make
@@ -0,0 +1,98 @@
+"""Tests for merge_history (incremental SCD2) function with data validation.
+
+merge_history applies new changes to an existing build_history output:
+- Keys without changes pass through untouched
+- Changed keys have their open version closed and new versions appended
+- The result matches a full build_history over all records
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import ibis
+import pandas as pd
+
+from pipelines.lib.curate import build_history, merge_history
+
+EXISTING = [
+    {"id": 1, "status": "pending", "ts": datetime(2025, 1, 10)},
+    {"id": 1, "status": "approved", "ts": datetime(2025, 1, 15)},
+    {"id": 2, "status": "active", "ts": datetime(2025, 1, 11)},
+]
+
+
+def _sorted(t: ibis.Table) -> pd.DataFrame:
+    return t.execute().sort_values(["id", "ts"]).reset_index(drop=True)
+
+
+def _history() -> ibis.Table:
+    return build_history(ibis.memtable(pd.DataFrame(EXISTING)), ["id"], "ts")
+
+
+class TestMergeHistory:
+    """Tests for merge_history."""
+
+    def test_closes_open_version_and_appends(self):
+        changes = pd.DataFrame(
+            [{"id": 1, "status": "completed", "ts": datetime(2025, 1, 20)}]
+        )
+
+        result = _sorted(
+            merge_history(_history(), ibis.memtable(changes), ["id"], "ts")
+        )
+
+        key1 = result[result["id"] == 1]
+        assert key1["status"].tolist() == ["pending", "approved", "completed"]
+        assert key1["is_current"].tolist() == [0, 0, 1]
+        assert key1["effective_to"].iloc[1] == datetime(2025, 1, 20)
+
+    def test_unchanged_keys_untouched(self):
+        changes = pd.DataFrame(
+            [{"id": 3, "status": "new", "ts": datetime(2025, 1, 20)}]
+        )
+
+        result = _sorted(
+            merge_history(_history(), ibis.memtable(changes), ["id"], "ts")
+        )
+
+        expected = _sorted(_history())
+        pd.testing.assert_frame_equal(
+            result[result["id"] != 3].reset_index(drop=True), expected
+        )
+        assert result[result["id"] == 3]["is_current"].tolist() == [1]
+
+    def test_matches_full_rebuild_with_late_change(self):
+        changes = [
+            {"id": 1, "status": "review", "ts": datetime(2025, 1, 12)},  # late
+            {"id": 2, "status": "inactive", "ts": datetime(2025, 1, 18)},
+        ]
+
+        merged = merge_history(
+            _history(), ibis.memtable(pd.DataFrame(changes)), ["id"], "ts"
+        )
+        rebuilt = build_history(
+            ibis.memtable(pd.DataFrame(EXISTING + changes)), ["id"], "ts"
+        )
+
+        pd.testing.assert_frame_equal(_sorted(merged), _sorted(rebuilt))
+
+    def test_new_columns_are_null_filled_for_history(self):
+        changes = pd.DataFrame(
+            [
+                {
+                    "id": 2,
+                    "status": "inactive",
+                    "region": "EU",
+                    "ts": datetime(2025, 1, 18),
+                }
+            ]
+        )
+
+        result = _sorted(
+            merge_history(_history(), ibis.memtable(changes), ["id"], "ts")
+        )
+
+        assert "region" in result.columns
+        assert result[result["id"] == 2]["region"].isna().tolist() == [True, False]
+        assert result[result["id"] == 1]["region"].isna().all()
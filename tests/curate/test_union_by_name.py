@@ -0,0 +1,53 @@
+"""Tests for union_by_name function with data validation.
+
+union_by_name unions two tables by column name, taking the second
+table's types and filling columns missing on either side with nulls.
+"""
+
+from __future__ import annotations
+
+import ibis
+import pandas as pd
+
+from pipelines.lib.curate import union_by_name
+
+
+class TestUnionByName:
+    """Tests for union_by_name functionality."""
+
+    def test_matches_columns_by_name(self):
+        """Columns in a different order are aligned by name."""
+        first = ibis.memtable(pd.DataFrame([{"value": "A", "id": 1}]))
+        second = ibis.memtable(pd.DataFrame([{"id": 2, "value": "B"}]))
+
+        result = union_by_name(first, second)
+        result_df = result.execute().sort_values("id")
+
+        assert result.columns == ("id", "value")
+        assert result_df.to_dict("records") == [
+            {"id": 1, "value": "A"},
+            {"id": 2, "value": "B"},
+        ]
+
+    def test_fills_missing_columns_with_nulls(self):
+        """Columns present on only one side are null on the other."""
+        first = ibis.memtable(pd.DataFrame([{"id": 1, "legacy": "x"}]))
+        second = ibis.memtable(pd.DataFrame([{"id": 2, "added": 5}]))
+
+        result_df = union_by_name(first, second).execute().sort_values("id")
+
+        assert set(result_df.columns) == {"id", "added", "legacy"}
+        assert result_df["legacy"].iloc[0] == "x"
+        assert pd.isna(result_df["legacy"].iloc[1])
+        assert pd.isna(result_df["added"].iloc[0])
+        assert result_df["added"].iloc[1] == 5
+
+    def test_second_table_types_win(self):
+        """Columns whose types differ are cast to the second table's type."""
+        first = ibis.memtable({"id": [1], "amount": [10]})
+        second = ibis.memtable({"id": [2], "amount": [2.5]})
+
+        result = union_by_name(first, second)
+
+        assert result.schema()["amount"] == second.schema()["amount"]
+        assert sorted(result.execute()["amount"]) == [2.5, 10.0]
@@ -0,0 +1,149 @@
+"""Tests for resumable, checkpointed API pagination."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pandas as pd
+import pytest
+
+from pipelines.lib.api import (
+    CHECKPOINT_FILENAME,
+    CursorPaginationState,
+    OffsetPaginationState,
+    PagePaginationState,
+    PaginationConfig,
+    PaginationStrategy,
+)
+
+TOTAL_RECORDS = 5
+
+
+class _Outage(Exception):
+    pass
+
+
+def _serve(requests, fail_on=None):
+    """Handler serving TOTAL_RECORDS items, one per page.
+
+    The first request for page ``fail_on`` raises, simulating a network
+    failure that outlasts the retries.
+    """
+    failed = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        requests.append(page)
+        if page == fail_on and not failed:
+            failed.append(page)
+            raise _Outage(f"connection lost on page {page}")
+        items = [{"id": page}] if page <= TOTAL_RECORDS else []
+        return httpx.Response(200, json=items)
+
+    return handler
+
+
+@pytest.fixture
+def items_source(mock_api_source):
+    """Checkpointing ApiSource over paged items, without retries."""
+
+    def make(requests, fail_on=None, **overrides):
+        return mock_api_source(
+            _serve(requests, fail_on),
+            pagination=PaginationConfig(strategy=PaginationStrategy.PAGE, page_size=1),
+            max_retries=0,
+            **{"checkpoint_pages": 1, **overrides},
+        )
+
+    return make
+
+
+@pytest.fixture(autouse=True)
+def _dirs(tmp_path, monkeypatch):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    monkeypatch.setenv("PIPELINE_STAGING_DIR", str(tmp_path / "staging"))
+
+
+def _checkpoint_dir(tmp_path):
+    return tmp_path / "staging" / "api_checkpoints" / "vendor_items_2025-01-15"
+
+
+def test_failed_run_resumes_from_checkpoint(tmp_path, items_source):
+    requests: list = []
+    with pytest.raises(_Outage):
+        items_source(requests, fail_on=4).run("2025-01-15")
+
+    checkpoint = json.loads(
+        (_checkpoint_dir(tmp_path) / CHECKPOINT_FILENAME).read_text()
+    )
+    assert checkpoint["state"] == {"page": 4}
+    assert checkpoint["row_count"] == 3
+    assert checkpoint["complete"] is False
+
+    requests.clear()
+    result = items_source(requests).run("2025-01-15")
+
+    # Pages 1-3 are not requested again
+    assert requests == [4, 5, 6]
+    assert result["row_count"] == TOTAL_RECORDS
+    assert result["pages_fetched"] == 6
+    df = pd.read_parquet(tmp_path / "bronze" / "items.parquet")
+    assert sorted(df["id"]) == [1, 2, 3, 4, 5]
+    assert not _checkpoint_dir(tmp_path).exists()
+
+
+def test_changed_request_discards_checkpoint(tmp_path, items_source):
+    requests: list = []
+    with pytest.raises(_Outage):
+        items_source(requests, fail_on=3).run("2025-01-15")
+
+    requests.clear()
+    items_source(requests, params={"status": "active"}).run("2025-01-15")
+
+    assert requests == [1, 2, 3, 4, 5, 6]
+
+
+def test_checkpointing_disabled_starts_over(tmp_path, items_source):
+    requests: list = []
+    with pytest.raises(_Outage):
+        items_source(requests, fail_on=3, checkpoint_pages=0).run("2025-01-15")
+
+    assert not _checkpoint_dir(tmp_path).exists()
+    with pytest.raises(ValueError, match="checkpoint_pages"):
+        items_source(requests, checkpoint_pages=-1)
+
+
+@pytest.mark.parametrize(
+    "state_class, strategy, advance, expected",
+    [
+        (OffsetPaginationState, PaginationStrategy.OFFSET, 2, {"offset": 20}),
+        (PagePaginationState, PaginationStrategy.PAGE, 2, {"page": 3}),
+    ],
+)
+def test_pagination_state_round_trips(state_class, strategy, advance, expected):
+    config = PaginationConfig(strategy=strategy, page_size=10)
+    state = state_class(config)
+    for _ in range(advance):
+        records = [{"id": i} for i in range(10)]
+        state.on_response(records, records)
+
+    restored = state_class(config)
+    restored.restore(json.loads(json.dumps(state.checkpoint())))
+
+    assert state.checkpoint() == expected
+    assert restored.build_params() == state.build_params()
+    assert restored.page_index == advance
+
+
+def test_cursor_state_round_trips():
+    config = PaginationConfig(
+        strategy=PaginationStrategy.CURSOR, cursor_path="next", cursor_param="after"
+    )
+    state = CursorPaginationState(config)
+    state.on_response([{"id": 1}], {"items": [{"id": 1}], "next": "abc"})
+
+    restored = CursorPaginationState(config)
+    restored.restore(state.checkpoint())
+
+    assert restored.build_params()["after"] == "abc"
@@ -0,0 +1,125 @@
+"""Tests for concurrent page fetching in ApiSource."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import httpx
+import pytest
+
+from pipelines.lib.api import (
+    PaginationConfig,
+    PaginationStrategy,
+    build_pagination_config_from_dict,
+)
+
+TOTAL_RECORDS = 95
+
+
+def _serve(requests, *, delay=0.0, in_flight=None):
+    """Handler serving TOTAL_RECORDS items by offset or page."""
+    lock = threading.Lock()
+    active = [0]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        with lock:
+            requests.append(dict(params))
+            active[0] += 1
+            if in_flight is not None:
+                in_flight.append(active[0])
+        try:
+            time.sleep(delay)
+            if "offset" in params:
+                start, size = int(params["offset"]), int(params["limit"])
+            else:
+                size = int(params["page_size"])
+                start = (int(params["page"]) - 1) * size
+            ids = range(start, min(start + size, TOTAL_RECORDS))
+            return httpx.Response(200, json={"items": [{"id": i} for i in ids]})
+        finally:
+            with lock:
+                active[0] -= 1
+
+    return handler
+
+
+@pytest.mark.parametrize(
+    "strategy", [PaginationStrategy.OFFSET, PaginationStrategy.PAGE]
+)
+def test_concurrent_pages_keep_record_order(mock_api_source, strategy):
+    requests: list = []
+    in_flight: list = []
+    source = mock_api_source(
+        _serve(requests, delay=0.02, in_flight=in_flight),
+        pagination=PaginationConfig(strategy=strategy, page_size=10, concurrency=4),
+    )
+
+    records, pages, total_requests = source._fetch_all("2025-01-15", None)
+
+    assert [r["id"] for r in records] == list(range(TOTAL_RECORDS))
+    # Ten pages; the short tenth page ends the fetch
+    assert pages == 10
+    assert max(in_flight) > 1
+    # Pages speculatively requested past the end still count as requests
+    assert total_requests == len(requests) <= 10 + 3
+
+
+def test_concurrent_pages_respect_max_pages(mock_api_source):
+    requests: list = []
+    source = mock_api_source(
+        _serve(requests),
+        pagination=PaginationConfig(
+            strategy=PaginationStrategy.PAGE, page_size=10, max_pages=3, concurrency=8
+        ),
+    )
+
+    records, pages, _ = source._fetch_all("2025-01-15", None)
+
+    assert pages == 3
+    assert len(records) == 30
+    assert sorted(int(r["page"]) for r in requests) == [1, 2, 3]
+
+
+def test_concurrent_pages_respect_max_records(mock_api_source):
+    requests: list = []
+    source = mock_api_source(
+        _serve(requests),
+        pagination=PaginationConfig(
+            strategy=PaginationStrategy.OFFSET,
+            page_size=10,
+            max_records=25,
+            concurrency=8,
+        ),
+    )
+
+    records, _, _ = source._fetch_all("2025-01-15", None)
+
+    assert [r["id"] for r in records] == list(range(25))
+    assert sorted(int(r["offset"]) for r in requests) == [0, 10, 20]
+
+
+def test_concurrency_one_fetches_sequentially(mock_api_source):
+    requests: list = []
+    in_flight: list = []
+    source = mock_api_source(
+        _serve(requests, in_flight=in_flight),
+        pagination=PaginationConfig(strategy=PaginationStrategy.OFFSET, page_size=10),
+    )
+
+    records, pages, total_requests = source._fetch_all("2025-01-15", None)
+
+    assert len(records) == TOTAL_RECORDS
+    assert (pages, total_requests) == (10, 10)
+    assert max(in_flight) == 1
+
+
+def test_concurrency_from_options():
+    config = build_pagination_config_from_dict(
+        {"pagination_type": "page", "concurrency": 20}
+    )
+    assert config.concurrency == 20
+
+    with pytest.raises(ValueError, match="concurrency"):
+        PaginationConfig(strategy=PaginationStrategy.PAGE, concurrency=0)
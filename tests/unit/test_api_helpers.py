@@ -54,6 +54,39 @@ def test_compute_max_watermark_handles_missing_column(tmp_path):
     assert source._compute_max_watermark([{"value": 1}]) is None
 
 
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        # Mixed ISO formats are parsed, not compared as strings
+        (
+            ["2025-01-10T23:00:00", "2025-01-11", "2025-01-10 05:00:00", None],
+            "2025-01-11",
+        ),
+        # Zone offsets are compared in UTC
+        (
+            ["2025-01-10T23:00:00Z", "2025-01-11T00:30:00+02:00"],
+            "2025-01-10T23:00:00Z",
+        ),
+        ([3, 17, 5], "17"),
+    ],
+)
+def test_compute_max_watermark_vectorized(tmp_path, monkeypatch, values, expected):
+    source = _make_source(tmp_path, watermark_column="value")
+    monkeypatch.setattr(
+        source, "_watermark_sort_key", lambda value: pytest.fail("per-record key")
+    )
+
+    records = [{"value": value} for value in values]
+    assert source._compute_max_watermark(records) == expected
+
+
+def test_compute_max_watermark_falls_back_for_unparsed_strings(tmp_path):
+    source = _make_source(tmp_path, watermark_column="value")
+    records = [{"value": "2025-01-10T00:00:00"}, {"value": "2025-01-12 (approx)"}]
+
+    assert source._compute_max_watermark(records) == "2025-01-12 (approx)"
+
+
 @pytest.mark.parametrize(
     "status_code,expected",
     ((500, True), (418, False)),
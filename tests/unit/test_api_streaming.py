@@ -0,0 +1,108 @@
+"""Tests for streaming API extraction through staged Parquet parts."""
+
+from __future__ import annotations
+
+import httpx
+import pandas as pd
+import pytest
+
+from pipelines.lib.api import PaginationConfig, PaginationStrategy
+from pipelines.lib.state import get_watermark
+
+PAGES = [
+    [{"id": 1, "updated_at": "2025-01-10T00:00:00"}],
+    [{"id": 2, "updated_at": "2025-01-12T00:00:00", "note": "added"}],
+    [{"id": 3, "updated_at": "2025-01-11T00:00:00", "note": None}],
+]
+
+
+def _serve(pages):
+    """Handler serving one list of records per page."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json=pages[page - 1] if page <= len(pages) else [])
+
+    return handler
+
+
+@pytest.fixture
+def items_source(mock_api_source):
+    """ApiSource over paged items, watermarked by updated_at."""
+
+    def make(pages=PAGES, **overrides):
+        return mock_api_source(
+            _serve(pages),
+            pagination=PaginationConfig(strategy=PaginationStrategy.PAGE, page_size=1),
+            watermark_param="since",
+            **{"watermark_column": "updated_at", **overrides},
+        )
+
+    return make
+
+
+def test_run_streams_pages_into_parts(tmp_path, monkeypatch, items_source):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    parts = []
+    source = items_source(chunk_size=1)
+    write_part = source._write_part
+    monkeypatch.setattr(
+        source,
+        "_write_part",
+        lambda records, path: parts.append(len(records)) or write_part(records, path),
+    )
+
+    result = source.run("2025-01-15")
+
+    # One staged part per chunk; the writer never sees all records at once
+    assert parts == [1, 1, 1]
+    assert result["row_count"] == 3
+    assert result["pages_fetched"] == 4
+    assert result["new_watermark"] == "2025-01-12T00:00:00"
+    assert get_watermark("vendor", "items") == "2025-01-12T00:00:00"
+
+    df = pd.read_parquet(tmp_path / "bronze" / "items.parquet")
+    # Columns seen only on later pages are unified by name
+    assert list(df.columns) == [
+        "id",
+        "updated_at",
+        "note",
+        "_load_date",
+        "_extracted_at",
+        "_source_system",
+        "_source_entity",
+    ]
+    assert sorted(df["id"]) == [1, 2, 3]
+    assert set(df["_load_date"]) == {"2025-01-15"}
+    assert set(df["_source_system"]) == {"vendor"}
+
+
+def test_run_without_records(tmp_path, monkeypatch, items_source):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    source = items_source(pages=[])
+
+    result = source.run("2025-01-15")
+
+    assert result["row_count"] == 0
+    assert not (tmp_path / "bronze").exists()
+
+
+def test_watermark_compares_parts_by_value(tmp_path, monkeypatch, items_source):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    pages = [[{"id": 1, "seq": 99}], [{"id": 2, "seq": 100}], [{"id": 3, "seq": 7}]]
+    source = items_source(pages=pages, chunk_size=1, watermark_column="seq")
+
+    result = source.run("2025-01-15")
+
+    assert result["new_watermark"] == "100"
+    assert get_watermark("vendor", "items") == "100"
+
+
+def test_watermark_value_mixed_formats(items_source):
+    source = items_source()
+
+    assert source._max_watermark_value(["100", "99"]) == "100"
+    assert (
+        source._max_watermark_value(["2025-01-11T00:00:00", "2025-01-10T23:00:00Z"])
+        == "2025-01-11T00:00:00"
+    )
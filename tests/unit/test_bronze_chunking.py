@@ -0,0 +1,160 @@
+"""Tests for chunk_size streaming in Bronze extraction and artifact writes."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import ibis
+import pandas as pd
+import pyarrow.parquet as pq
+
+from pipelines.lib import _path_utils, artifact_writer
+from pipelines.lib.artifact_writer import _write_parquet_batches, write_artifacts
+from pipelines.lib.bronze import BronzeSource, LoadPattern, SourceType
+from pipelines.lib.deprecation import DEPRECATED_FIELDS
+
+
+def _table(rows: int) -> ibis.Table:
+    return ibis.memtable(
+        pd.DataFrame({"id": range(rows), "name": [f"n{i}" for i in range(rows)]})
+    )
+
+
+def test_write_parquet_batches_streams_row_groups():
+    buffer = io.BytesIO()
+
+    rows = _write_parquet_batches(_table(10), buffer, "snappy", chunk_size=3)
+
+    assert rows == 10
+    parquet = pq.ParquetFile(io.BytesIO(buffer.getvalue()))
+    assert parquet.metadata.num_rows == 10
+    assert parquet.metadata.num_row_groups == 4
+
+
+def test_write_parquet_batches_folds_column_stats():
+    stats = {}
+    table = ibis.memtable(
+        pd.DataFrame({"id": [5, None, 1, 9, None], "name": ["e", "a", None, "z", "m"]})
+    )
+
+    _write_parquet_batches(
+        table, io.BytesIO(), "snappy", chunk_size=2, column_stats=stats
+    )
+
+    assert stats["id"] == {"min": 1.0, "max": 9.0, "null_count": 2}
+    assert stats["name"] == {"min": "a", "max": "z", "null_count": 1}
+
+
+def test_write_artifacts_local_caps_row_group_size(tmp_path):
+    target = tmp_path / "out"
+
+    result = write_artifacts(
+        table=_table(5000),
+        target=str(target),
+        entity_name="orders",
+        columns=[{"name": "id"}, {"name": "name"}],
+        run_date="2025-01-15",
+        chunk_size=1000,
+    )
+
+    assert result.row_count == 5000
+    metadata = pq.ParquetFile(target / "orders.parquet").metadata
+    assert metadata.num_rows == 5000
+    assert metadata.num_row_groups == 5
+
+
+def _write_as_object_storage(monkeypatch):
+    """Send local targets down the writer's S3/ADLS path."""
+    monkeypatch.setattr(artifact_writer, "parse_uri", lambda target: ("s3", target))
+    engine = artifact_writer.get_engine
+    monkeypatch.setattr(artifact_writer, "get_engine", lambda *args: engine())
+
+
+def test_partitioned_cloud_write_streams_batches(tmp_path, monkeypatch):
+    _write_as_object_storage(monkeypatch)
+    table = _table(10_000).mutate(_load_date=ibis.literal("2025-01-15"))
+    monkeypatch.setattr(
+        type(table),
+        "to_pyarrow",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("buffered")),
+    )
+    target = tmp_path / "dt=2025-01-15"
+
+    result = write_artifacts(
+        table=table,
+        target=str(target) + "/",
+        entity_name="orders",
+        columns=[{"name": "id"}, {"name": "name"}],
+        run_date="2025-01-15",
+        partition_by=["_load_date"],
+        chunk_size=2048,
+        write_checksums=False,
+    )
+
+    assert result.row_count == 10_000
+    (written,) = (target / "_load_date=2025-01-15").glob("orders-*.parquet")
+    metadata = pq.ParquetFile(written).metadata
+    assert metadata.num_rows == 10_000
+    assert metadata.num_row_groups == 5
+
+
+def test_bronze_run_with_chunk_size(tmp_path, monkeypatch):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    csv_path = tmp_path / "orders.csv"
+    pd.DataFrame({"id": range(2500), "amount": range(2500)}).to_csv(
+        csv_path, index=False
+    )
+
+    source = BronzeSource(
+        system="erp",
+        entity="orders",
+        source_type=SourceType.FILE_CSV,
+        source_path=str(csv_path),
+        target_path=str(tmp_path / "bronze" / "dt={run_date}"),
+        chunk_size=1000,
+    )
+
+    result = source.run("2025-01-15")
+
+    assert result["row_count"] == 2500
+    output = tmp_path / "bronze" / "dt=2025-01-15" / "orders.parquet"
+    metadata = pq.ParquetFile(output).metadata
+    assert metadata.num_rows == 2500
+    assert metadata.num_row_groups > 1
+
+
+def test_cloud_bronze_records_watermark_and_stats(tmp_path, monkeypatch):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    _write_as_object_storage(monkeypatch)
+    # Bronze applies its default _load_date partitioning to cloud targets
+    monkeypatch.setattr(
+        _path_utils, "is_object_storage_path", lambda path: "bronze" in str(path)
+    )
+    csv_path = tmp_path / "orders.csv"
+    pd.DataFrame({"id": range(2500), "amount": range(2500)}).to_csv(
+        csv_path, index=False
+    )
+
+    source = BronzeSource(
+        system="erp",
+        entity="orders",
+        source_type=SourceType.FILE_CSV,
+        source_path=str(csv_path),
+        target_path=str(tmp_path / "bronze" / "dt={run_date}") + "/",
+        load_pattern=LoadPattern.INCREMENTAL_APPEND,
+        watermark_column="id",
+    )
+
+    result = source.run("2025-01-15")
+
+    partition = tmp_path / "bronze" / "dt=2025-01-15"
+    assert list(partition.glob("_load_date=2025-01-15/orders-*.parquet"))
+    metadata = json.loads((partition / "_metadata.json").read_text())
+    assert metadata["new_watermark"] == "2499"
+    assert metadata["column_stats"]["amount"]["max"] == 2499
+    assert result["new_watermark"] == "2499"
+
+
+def test_chunk_size_no_longer_deprecated():
+    assert "bronze.chunk_size" not in DEPRECATED_FIELDS
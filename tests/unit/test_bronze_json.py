@@ -0,0 +1,201 @@
+"""Tests for Arrow-based JSON / JSONL readers in Bronze."""
+
+from __future__ import annotations
+
+import json
+
+import pyarrow as pa
+import pytest
+
+from pipelines.lib.bronze import (
+    BronzeSource,
+    SourceType,
+    _flatten_struct_columns,
+    _records_to_arrow,
+)
+
+
+def _source(tmp_path, source_type: SourceType, path, **options) -> BronzeSource:
+    return BronzeSource(
+        system="web",
+        entity="events",
+        source_type=source_type,
+        source_path=str(path),
+        target_path=str(tmp_path / "bronze"),
+        options=options,
+    )
+
+
+def test_records_to_arrow_unions_keys():
+    table = _records_to_arrow([{"a": 1}, {"b": {"c": "x"}}])
+
+    assert table.column_names == ["a", "b"]
+    assert _flatten_struct_columns(table).column_names == ["a", "b.c"]
+
+
+def test_records_to_arrow_rejects_conflicting_types():
+    assert _records_to_arrow([{"a": 1}, {"a": "x"}]) is None
+    assert _records_to_arrow([]) is None
+    assert _records_to_arrow([1, 2]) is None
+
+
+def test_flatten_struct_columns_is_recursive():
+    table = pa.table({"a": [{"b": {"c": 1}}]})
+
+    assert _flatten_struct_columns(table).column_names == ["a.b.c"]
+
+
+def test_read_jsonl_with_flatten(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text(
+        '{"id": 1, "user": {"name": "a", "geo": {"country": "US"}}}\n'
+        "\n"
+        '{"id": 2, "user": {"name": "b"}}\n'
+    )
+    source = _source(tmp_path, SourceType.FILE_JSONL, path, flatten=True)
+
+    df = source._read_jsonl(None, str(path)).execute()
+
+    assert list(df.columns) == ["id", "user.name", "user.geo.country"]
+    assert df["user.name"].tolist() == ["a", "b"]
+
+
+def test_read_jsonl_without_flatten_keeps_structs(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text('{"id": 1, "user": {"name": "a"}}\n')
+    source = _source(tmp_path, SourceType.FILE_JSONL, path)
+
+    t = source._read_jsonl(None, str(path))
+
+    assert t.columns == ("id", "user")
+    assert t.schema()["user"].is_struct()
+
+
+def test_read_jsonl_falls_back_when_record_exceeds_block(tmp_path, monkeypatch):
+    monkeypatch.setattr("pipelines.lib.bronze._JSON_BLOCK_SIZE", 32)
+    path = tmp_path / "events.jsonl"
+    path.write_text(
+        '{"id": 1, "note": "short"}\n' + json.dumps({"id": 2, "note": "x" * 200}) + "\n"
+    )
+    source = _source(tmp_path, SourceType.FILE_JSONL, path)
+
+    df = source._read_jsonl(None, str(path)).execute()
+
+    assert df["id"].tolist() == [1, 2]
+    assert len(df["note"].iloc[1]) == 200
+
+
+def test_read_json_data_path_and_flatten(tmp_path):
+    path = tmp_path / "events.json"
+    path.write_text(
+        json.dumps(
+            {
+                "response": {
+                    "data": {
+                        "items": [
+                            {"id": 1, "meta": {"tag": "x"}},
+                            {"id": 2, "meta": {"tag": "y"}, "extra": True},
+                        ]
+                    }
+                }
+            }
+        )
+    )
+    source = _source(
+        tmp_path,
+        SourceType.FILE_JSON,
+        path,
+        data_path="response.data.items",
+        flatten=True,
+    )
+
+    df = source._read_json(None, str(path)).execute()
+
+    assert list(df.columns) == ["id", "meta.tag", "extra"]
+    assert df["meta.tag"].tolist() == ["x", "y"]
+
+
+def test_bronze_run_jsonl(tmp_path, monkeypatch):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    path = tmp_path / "events.jsonl"
+    path.write_text(
+        "".join(json.dumps({"id": i, "v": {"n": i}}) + "\n" for i in range(50))
+    )
+    source = _source(tmp_path, SourceType.FILE_JSONL, path, flatten=True)
+
+    result = source.run("2025-01-15")
+
+    assert result["row_count"] == 50
+    assert "v.n" in result["columns"]
+
+
+def test_read_jsonl_keeps_date_strings(tmp_path, monkeypatch):
+    # A small block puts the "closed" field beyond the sampled first block
+    monkeypatch.setattr("pipelines.lib.bronze._JSON_BLOCK_SIZE", 64)
+    path = tmp_path / "events.jsonl"
+    path.write_text(
+        '{"id": 1, "day": "2025-01-15", "at": {"ts": "2025-01-15T10:00:00"}}\n'
+        '{"id": 2, "day": "2025-01-16"}\n'
+        '{"id": 3, "closed": "2025-01-17 08:30:00"}\n'
+    )
+    source = _source(tmp_path, SourceType.FILE_JSONL, path, flatten=True)
+
+    t = source._read_jsonl(None, str(path))
+
+    assert all(t.schema()[c].is_string() for c in ("day", "at.ts", "closed"))
+    df = t.execute()
+    assert df["day"].tolist()[:2] == ["2025-01-15", "2025-01-16"]
+    assert df["closed"].iloc[2] == "2025-01-17 08:30:00"
+
+
+@pytest.mark.parametrize("source_type", [SourceType.FILE_JSON, SourceType.FILE_JSONL])
+def test_read_json_keeps_column_order(tmp_path, monkeypatch, source_type):
+    # A small block puts "closed_at" beyond the sampled first block
+    monkeypatch.setattr("pipelines.lib.bronze._JSON_BLOCK_SIZE", 128)
+    records = [
+        {"id": 1, "name": "a", "created_at": "2025-01-15T10:00:00", "amount": 5},
+        {"id": 2, "name": "b", "created_at": "2025-01-16T10:00:00", "amount": 7},
+        {"id": 3, "closed_at": "2025-01-17T08:30:00", "amount": 9},
+    ]
+    path = tmp_path / "events.json"
+    if source_type == SourceType.FILE_JSON:
+        path.write_text(json.dumps(records))
+        read = _source(tmp_path, source_type, path)._read_json
+    else:
+        path.write_text("".join(json.dumps(r) + "\n" for r in records))
+        read = _source(tmp_path, source_type, path)._read_jsonl
+
+    t = read(None, str(path))
+
+    assert t.columns == ("id", "name", "created_at", "amount", "closed_at")
+    assert t.schema()["created_at"].is_string()
+    assert t.schema()["closed_at"].is_string()
+
+
+def test_read_json_top_level_array(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "pipelines.lib.bronze.BronzeSource._records_table",
+        lambda self, records: pytest.fail("parsed in Python"),
+    )
+    path = tmp_path / "events.json"
+    path.write_text(
+        json.dumps([{"id": 1, "at": "2025-01-15T10:00:00"}, {"id": 2, "at": None}]),
+    )
+    source = _source(tmp_path, SourceType.FILE_JSON, path)
+
+    t = source._read_json(None, str(path))
+
+    assert t.schema()["at"].is_string()
+    assert t.to_pyarrow()["at"].to_pylist() == ["2025-01-15T10:00:00", None]
+
+
+def test_read_json_data_path_index_and_errors(tmp_path):
+    path = tmp_path / "events.json"
+    path.write_text(json.dumps({"pages": [{"items": [{"id": 1}]}, {"items": []}]}))
+
+    first = _source(tmp_path, SourceType.FILE_JSON, path, data_path="pages.0.items")
+    assert first._read_json(None, str(path)).execute()["id"].tolist() == [1]
+
+    missing = _source(tmp_path, SourceType.FILE_JSON, path, data_path="data.items")
+    with pytest.raises(ValueError, match="Available top-level keys: 'pages'"):
+        missing._read_json(None, str(path))
@@ -0,0 +1,180 @@
+"""Tests for range-partitioned (parallel) database extraction in Bronze."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import ibis
+import pandas as pd
+import pytest
+
+from pipelines.lib.bronze import (
+    BronzeSource,
+    LoadPattern,
+    SourceType,
+    _split_range,
+)
+
+
+class TestSplitRange:
+    def test_integer_ranges_cover_bounds(self):
+        ranges = _split_range(1, 100, 4)
+
+        assert ranges == [(1, 25), (25, 50), (50, 75), (75, 100)]
+
+    def test_narrow_integer_range_collapses(self):
+        assert _split_range(1, 2, 8) == [(1, 2)]
+
+    def test_single_value(self):
+        assert _split_range(5, 5, 4) == [(5, 5)]
+
+    def test_dates(self):
+        ranges = _split_range(date(2025, 1, 1), date(2025, 1, 9), 2)
+
+        assert ranges == [
+            (date(2025, 1, 1), date(2025, 1, 5)),
+            (date(2025, 1, 5), date(2025, 1, 9)),
+        ]
+
+    def test_timestamps_and_decimals(self):
+        ts = _split_range(datetime(2025, 1, 1), datetime(2025, 1, 2), 4)
+        dec = _split_range(Decimal("0"), Decimal("1"), 2)
+
+        assert len(ts) == 4
+        assert ts[-1][1] == datetime(2025, 1, 2)
+        assert dec == [(Decimal("0"), Decimal("0.5")), (Decimal("0.5"), Decimal("1"))]
+
+    def test_strings_rejected(self):
+        with pytest.raises(ValueError, match="numeric or date/time"):
+            _split_range("a", "z", 4)
+
+
+@pytest.fixture
+def orders_db(tmp_path):
+    """DuckDB file standing in for a source database."""
+    db_path = str(tmp_path / "source.duckdb")
+    con = ibis.duckdb.connect(db_path)
+    con.create_table(
+        "orders",
+        pd.DataFrame(
+            {
+                "order_id": [*range(1, 101), None],
+                "amount": [float(i) for i in range(101)],
+            }
+        ),
+    )
+    con.disconnect()
+    return db_path
+
+
+def _source(tmp_path, **overrides) -> BronzeSource:
+    options = {
+        "host": "localhost",
+        "database": "erp",
+        "partition_column": "order_id",
+        "num_partitions": 4,
+    }
+    options.update(overrides.pop("options", {}))
+    return BronzeSource(
+        system="erp",
+        entity="orders",
+        source_type=SourceType.DATABASE_MYSQL,
+        target_path=str(tmp_path / "bronze" / "dt={run_date}"),
+        options=options,
+        **overrides,
+    )
+
+
+def _patch_connections(monkeypatch, db_path):
+    names = []
+
+    def fake_get_connection(name, source_type, options):
+        names.append(name)
+        return ibis.duckdb.connect(db_path)
+
+    monkeypatch.setattr("pipelines.lib.bronze.get_connection", fake_get_connection)
+    return names
+
+
+def test_range_extraction_writes_one_part_per_range(tmp_path, monkeypatch, orders_db):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    names = _patch_connections(monkeypatch, orders_db)
+
+    result = _source(tmp_path).run("2025-01-15")
+
+    output = tmp_path / "bronze" / "dt=2025-01-15"
+    parts = sorted(p.name for p in output.glob("*.parquet"))
+    assert parts == [f"orders-part-{i:04d}.parquet" for i in range(4)]
+    assert result["row_count"] == 101
+    written = pd.read_parquet(output)
+    assert len(written) == 101
+    assert written["order_id"].isna().sum() == 1
+    assert written["_extracted_at"].nunique() == 1
+    # One aggregate connection reused for range 0, plus one per other range
+    assert set(names) == {"erp_orders", *(f"erp_orders_range{i}" for i in (1, 2, 3))}
+
+
+def test_range_extraction_metadata_and_checksums_list_parts(
+    tmp_path, monkeypatch, orders_db
+):
+    import json
+
+    from pipelines.lib.checksum import verify_checksum_manifest
+
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    _patch_connections(monkeypatch, orders_db)
+
+    _source(tmp_path, options={"num_partitions": 2}).run("2025-01-15")
+
+    output = tmp_path / "bronze" / "dt=2025-01-15"
+    metadata = json.loads((output / "_metadata.json").read_text())
+    assert metadata["data_files"] == [
+        "orders-part-0000.parquet",
+        "orders-part-0001.parquet",
+    ]
+    assert verify_checksum_manifest(output).valid
+
+
+def test_range_extraction_defaults_to_watermark_column(
+    tmp_path, monkeypatch, orders_db
+):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    _patch_connections(monkeypatch, orders_db)
+
+    source = _source(
+        tmp_path,
+        options={"partition_column": None},
+        load_pattern=LoadPattern.INCREMENTAL_APPEND,
+        watermark_column="order_id",
+    )
+    result = source.run("2025-01-15")
+
+    assert result["row_count"] == 101
+    assert result["new_watermark"] == "100.0"
+
+
+def test_num_partitions_requires_column(tmp_path):
+    with pytest.raises(ValueError, match="num_partitions requires"):
+        _source(tmp_path, options={"partition_column": None})
+
+
+def test_num_partitions_rejected_for_file_sources(tmp_path):
+    with pytest.raises(ValueError, match="only supported for"):
+        BronzeSource(
+            system="erp",
+            entity="orders",
+            source_type=SourceType.FILE_CSV,
+            source_path="orders.csv",
+            options={"num_partitions": 4, "partition_column": "id"},
+        )
+
+
+def test_num_partitions_column_expanding_to_empty(tmp_path, monkeypatch, orders_db):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    monkeypatch.setenv("SPLIT_COLUMN", "")
+    _patch_connections(monkeypatch, orders_db)
+    source = _source(tmp_path, options={"partition_column": "${SPLIT_COLUMN}"})
+
+    with pytest.raises(ValueError, match="requires options.partition_column"):
+        source.run("2025-01-15")
@@ -1,5 +1,3 @@
-import ibis
-import pandas as pd
 import pytest
 
 from pipelines.lib.bronze import BronzeSource, SourceType
@@ -78,6 +76,29 @@ def test_read_fixed_width_reads_columns(tmp_path):
     assert result["value"].tolist() == ["abc", "xyz"]
 
 
+def test_read_fixed_width_infer_types_option(tmp_path):
+    file_path = tmp_path / "fixed.txt"
+    file_path.write_text("01 12.5\n02  7.0\n")
+    options = {"columns": ["id", "amt"], "widths": [2, 5]}
+
+    typed = _make_source(
+        tmp_path,
+        source_type=SourceType.FILE_FIXED_WIDTH,
+        source_path=str(file_path),
+        options=options,
+    )._read_fixed_width(str(file_path))
+    strings = _make_source(
+        tmp_path,
+        source_type=SourceType.FILE_FIXED_WIDTH,
+        source_path=str(file_path),
+        options={**options, "infer_types": False},
+    )._read_fixed_width(str(file_path))
+
+    assert typed.schema()["amt"].is_float64()
+    assert typed.execute()["id"].tolist() == [1, 2]
+    assert strings.execute()["amt"].tolist() == ["12.5", "7.0"]
+
+
 def test_read_fixed_width_requires_widths(tmp_path):
     source = _make_source(
         tmp_path,
@@ -96,23 +117,3 @@ def test_read_fixed_width_requires_widths(tmp_path):
 
     with pytest.raises(ValueError, match="Fixed-width files require"):
         source._read_fixed_width(str(file_path))
-
-
-def test_get_max_watermark_returns_latest(tmp_path):
-    source = _make_source(tmp_path)
-    source.watermark_column = "wm"
-
-    df = pd.DataFrame({"wm": ["2025-01-01", "2025-02-01"]})
-    table = ibis.memtable(df)
-
-    assert source._get_max_watermark(table) == "2025-02-01"
-
-
-def test_get_max_watermark_missing_column(tmp_path):
-    source = _make_source(tmp_path)
-    source.watermark_column = "missing"
-
-    df = pd.DataFrame({"wm": ["2025-01-01"]})
-    table = ibis.memtable(df)
-
-    assert source._get_max_watermark(table) is None
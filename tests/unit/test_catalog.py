@@ -0,0 +1,199 @@
+"""Tests for the entity-level partition catalog (_catalog.json)."""
+
+from __future__ import annotations
+
+import json
+import shutil
+
+import pandas as pd
+import pytest
+
+from pipelines.lib.bronze import BronzeSource, LoadPattern, SourceType
+from pipelines.lib.catalog import (
+    CATALOG_FILENAME,
+    CatalogError,
+    entity_root,
+    read_catalog,
+    schema_hash,
+    update_catalog,
+)
+from pipelines.lib.pipeline import Pipeline
+from pipelines.lib.silver import InputMode, SilverEntity
+from pipelines.lib.state import get_watermark_from_destination
+
+COLUMNS = [{"name": "id", "type": "int64"}, {"name": "updated_at", "type": "string"}]
+
+
+def _bronze(tmp_path, csv_path, load_pattern=LoadPattern.INCREMENTAL_APPEND):
+    return BronzeSource(
+        system="erp",
+        entity="orders",
+        source_type=SourceType.FILE_CSV,
+        source_path=str(csv_path),
+        target_path=str(tmp_path / "bronze" / "dt={run_date}") + "/",
+        load_pattern=load_pattern,
+        watermark_column="updated_at",
+    )
+
+
+def test_entity_root():
+    assert entity_root("s3://b/bronze/entity=x/dt=2025-01-15/") == (
+        "s3://b/bronze/entity=x/"
+    )
+    assert entity_root("/data/bronze/dt=20250115") == "/data/bronze/"
+    assert entity_root("/data/bronze/orders/") is None
+
+
+def test_update_catalog_records_and_replaces_partitions(tmp_path):
+    root = tmp_path / "orders"
+    for dt, rows in [("2025-01-15", 10), ("2025-01-14", 5), ("2025-01-15", 12)]:
+        update_catalog(
+            str(root / f"dt={dt}"),
+            row_count=rows,
+            files=["orders.parquet"],
+            columns=COLUMNS,
+            load_pattern="incremental",
+            watermark=f"{dt}T00:00:00",
+        )
+
+    entries = read_catalog(str(root))
+
+    assert sorted(entries) == ["2025-01-14", "2025-01-15"]
+    assert entries["2025-01-15"].row_count == 12
+    assert entries["2025-01-15"].schema_hash == schema_hash(COLUMNS)
+    document = json.loads((root / CATALOG_FILENAME).read_text())
+    assert list(document["partitions"]) == ["2025-01-14", "2025-01-15"]
+
+
+def _record(root, dt, rows=1, watermark=None):
+    return update_catalog(
+        str(root / f"dt={dt}"),
+        row_count=rows,
+        files=["orders.parquet"],
+        columns=COLUMNS,
+        watermark=watermark,
+    )
+
+
+def test_read_catalog_recovers_entries_lost_from_index(tmp_path):
+    root = tmp_path / "orders"
+    _record(root, "2025-01-14")
+    stale_index = (root / CATALOG_FILENAME).read_text()
+    _record(root, "2025-01-15", rows=7)
+    # A concurrent writer rewrites the index from before the second write
+    (root / CATALOG_FILENAME).write_text(stale_index)
+
+    entries = read_catalog(str(root))
+
+    assert sorted(entries) == ["2025-01-14", "2025-01-15"]
+    assert entries["2025-01-15"].row_count == 7
+
+
+def test_corrupt_catalog_raises_and_is_not_overwritten(tmp_path):
+    root = tmp_path / "orders"
+    root.mkdir()
+    (root / CATALOG_FILENAME).write_text("{not json")
+
+    with pytest.raises(CatalogError):
+        read_catalog(str(root))
+
+    assert _record(root, "2025-01-15") is not None
+    assert (root / CATALOG_FILENAME).read_text() == "{not json"
+
+
+def test_destination_watermark_ignores_catalog_behind_latest_partition(tmp_path):
+    root = tmp_path / "orders"
+    _record(root, "2025-01-14", watermark="2025-01-14T00:00:00")
+    (root / "dt=2025-01-14").mkdir()
+    # Written without artifacts, so the catalog has no entry for it
+    newer = root / "dt=2025-01-15"
+    newer.mkdir()
+    (newer / "_metadata.json").write_text(
+        json.dumps({"extra": {"new_watermark": "2025-01-15T00:00:00"}})
+    )
+
+    assert (
+        get_watermark_from_destination(str(root / "dt=2025-01-16"))
+        == "2025-01-15T00:00:00"
+    )
+
+
+def test_update_catalog_ignores_unpartitioned_targets(tmp_path):
+    assert (
+        update_catalog(str(tmp_path / "out"), row_count=1, files=[], columns=COLUMNS)
+        is None
+    )
+    assert read_catalog(str(tmp_path)) == {}
+
+
+def test_schema_hash_tracks_types():
+    changed = [{**COLUMNS[0], "type": "string"}, COLUMNS[1]]
+    assert schema_hash(COLUMNS) != schema_hash(changed)
+
+
+def test_bronze_run_updates_catalog_and_destination_watermark(tmp_path, monkeypatch):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    csv_path = tmp_path / "orders.csv"
+    pd.DataFrame(
+        {"id": [1, 2], "updated_at": ["2025-01-14 08:00", "2025-01-15 09:30"]}
+    ).to_csv(csv_path, index=False)
+
+    _bronze(tmp_path, csv_path).run("2025-01-15")
+
+    entry = read_catalog(str(tmp_path / "bronze"))["2025-01-15"]
+    assert entry.row_count == 2
+    assert entry.load_pattern == "incremental"
+    assert entry.files == ["orders.parquet"]
+    assert entry.watermark == "2025-01-15 09:30:00"
+    assert (
+        get_watermark_from_destination(str(tmp_path / "bronze" / "dt=2025-01-16"))
+        == "2025-01-15 09:30:00"
+    )
+
+
+def test_silver_boundary_discovery_reads_catalog(tmp_path):
+    bronze = tmp_path / "bronze"
+    for dt, pattern in [
+        ("2025-01-13", "incremental"),
+        ("2025-01-14", "full_snapshot"),
+        ("2025-01-15", "incremental"),
+    ]:
+        partition = bronze / f"dt={dt}"
+        partition.mkdir(parents=True)
+        update_catalog(
+            str(partition),
+            row_count=1,
+            files=["orders.parquet"],
+            columns=COLUMNS,
+            load_pattern=pattern,
+        )
+
+    silver = SilverEntity(
+        source_path=str(bronze / "dt=*" / "*.parquet"),
+        target_path=str(tmp_path / "silver") + "/",
+        unique_columns=["id"],
+        last_updated_column="updated_at",
+    )
+
+    # No per-partition _metadata.json exists; the catalog alone answers
+    assert silver._discover_partition_boundaries(
+        str(bronze / "dt=*" / "*.parquet")
+    ) == (InputMode.APPEND_LOG, "2025-01-14")
+
+
+def test_explain_summarizes_catalog(tmp_path, monkeypatch):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    csv_path = tmp_path / "orders.csv"
+    pd.DataFrame({"id": [1], "updated_at": ["2025-01-15 09:30"]}).to_csv(
+        csv_path, index=False
+    )
+    bronze = _bronze(tmp_path, csv_path)
+    bronze.run("2025-01-15")
+
+    explained = Pipeline(bronze=bronze).explain("2025-01-16")
+
+    assert "Partitions:   1 recorded, 1 rows" in explained
+    assert "High Mark:    2025-01-15 09:30:00" in explained
+
+    shutil.rmtree(tmp_path / "bronze")
+    assert "no partitions recorded" in Pipeline(bronze=bronze).explain("2025-01-16")
@@ -0,0 +1,136 @@
+"""Tests for the shared DuckDB engine manager."""
+
+from __future__ import annotations
+
+import gc
+import threading
+import weakref
+
+import pytest
+
+from pipelines.lib import engine
+from pipelines.lib.config_loader import YAMLConfigError, load_engine_from_yaml
+from pipelines.lib.engine import (
+    EngineSettings,
+    close_all_engines,
+    configure_engine,
+    get_engine,
+    get_engine_settings,
+    materialized,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_engines(monkeypatch):
+    for env_var in engine.ENGINE_ENV_VARS.values():
+        monkeypatch.delenv(env_var, raising=False)
+    monkeypatch.setattr(engine, "_overrides", EngineSettings())
+    close_all_engines()
+    yield
+    close_all_engines()
+
+
+def _setting(con, name: str):
+    return con.raw_sql(f"SELECT current_setting('{name}')").fetchone()[0]
+
+
+def test_same_thread_reuses_connection():
+    assert get_engine() is get_engine()
+
+
+def test_threads_get_own_cursor_on_shared_database():
+    main = get_engine()
+    main.create_table("shared", {"a": [1]})
+    seen = {}
+
+    def worker():
+        con = get_engine()
+        seen["con"] = con
+        seen["tables"] = con.list_tables()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert seen["con"] is not main
+    assert "shared" in seen["tables"]
+
+
+def test_worker_cursor_released_when_thread_exits():
+    main = get_engine()
+    cursors = []
+
+    def worker():
+        cursors.append(weakref.ref(get_engine()))
+
+    for _ in range(3):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+    gc.collect()
+
+    assert [ref() for ref in cursors] == [None, None, None]
+    assert get_engine() is main
+
+
+def test_close_all_engines_invalidates_thread_cursors():
+    before = get_engine()
+    close_all_engines()
+
+    after = get_engine()
+
+    assert after is not before
+    assert after.raw_sql("SELECT 1").fetchone() == (1,)
+
+
+def test_env_settings_applied_to_new_database(monkeypatch, tmp_path):
+    spill = tmp_path / "spill"
+    monkeypatch.setenv("PIPELINE_DUCKDB_THREADS", "2")
+    monkeypatch.setenv("PIPELINE_DUCKDB_TEMP_DIRECTORY", str(spill))
+    monkeypatch.setenv("PIPELINE_DUCKDB_PRESERVE_INSERTION_ORDER", "false")
+
+    con = get_engine()
+
+    assert _setting(con, "threads") == 2
+    assert _setting(con, "preserve_insertion_order") is False
+    assert spill.is_dir()
+
+
+def test_configure_engine_overrides_env_and_updates_open_databases(monkeypatch):
+    monkeypatch.setenv("PIPELINE_DUCKDB_THREADS", "2")
+    con = get_engine()
+
+    effective = configure_engine(threads=3, memory_limit="512MB")
+
+    assert effective.threads == 3
+    assert get_engine_settings().memory_limit == "512MB"
+    assert _setting(con, "threads") == 3
+
+
+def test_settings_validation():
+    with pytest.raises(ValueError, match="Unknown duckdb setting"):
+        EngineSettings.from_dict({"thread": 4})
+    with pytest.raises(ValueError, match="at least 1"):
+        EngineSettings.from_dict({"threads": 0})
+    assert EngineSettings.from_dict({"enable_object_cache": "yes"}).to_config() == {
+        "enable_object_cache": True
+    }
+
+
+def test_load_engine_from_yaml_resolves_temp_directory(tmp_path):
+    settings = load_engine_from_yaml({"temp_directory": "./spill"}, tmp_path)
+    assert settings.temp_directory == str((tmp_path / "spill").resolve())
+
+    with pytest.raises(YAMLConfigError, match="Invalid duckdb configuration"):
+        load_engine_from_yaml({"threads": "many"}, tmp_path)
+
+
+def test_materialized_replaces_and_drops_temp_table():
+    con = get_engine()
+    source = con.create_table("source", {"a": [1, 2, 3]})
+    con.create_table("_cached", {"a": [0]}, temp=True)
+
+    with materialized(con, source.filter(source.a > 1), "_cached") as cached:
+        assert cached.count().execute() == 2
+
+    assert "_cached" not in con.list_tables()
@@ -0,0 +1,152 @@
+"""Tests for the columnar fixed-width engine."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from pipelines.lib.fixed_width import (
+    parse_fixed_width_line,
+    read_fixed_width,
+    read_parent_child_fixed_width,
+)
+
+RECORD_TYPES = [
+    {"type": "H", "role": "parent", "columns": ["claim", "member"], "widths": [4, 6]},
+    {"type": "D", "role": "child", "columns": ["line", "amount"], "widths": [2, 7]},
+    {"type": "T", "role": "skip"},
+]
+
+
+def _claims_file(path: Path, claims: int = 40) -> Path:
+    lines = []
+    for c in range(claims):
+        lines.append(f"H{c:04d}M{c:05d}")
+        for d in range(c % 4):
+            lines.append(f"D{d:02d}{c * 10 + d:7d}")
+        if c % 7 == 0:
+            lines.append("")
+    lines.append("T0000000")
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def _reference_flatten(path: Path) -> pd.DataFrame:
+    """Line-by-line reference implementation of flatten mode."""
+    rows, parent = [], None
+    for line in path.read_text().splitlines():
+        if line.startswith("H"):
+            parent = parse_fixed_width_line(line[1:], [4, 6])
+        elif line.startswith("D"):
+            rows.append(parent + parse_fixed_width_line(line[1:], [2, 7]))
+    return pd.DataFrame(rows, columns=["claim", "member", "line", "amount"])
+
+
+class TestReadFixedWidth:
+    def test_widths_strip_and_blank_as_null(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_text("01  ab\n02    \n")
+
+        df = read_fixed_width(
+            str(path), ["id", "code"], widths=[2, 4], infer_types=False
+        ).execute()
+
+        assert df["id"].tolist() == ["01", "02"]
+        assert df["code"].iloc[0] == "ab"
+        assert pd.isna(df["code"].iloc[1])
+
+    def test_colspecs_crlf_short_lines_and_no_trailing_newline(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_bytes(b"AAxBB\r\n\r\nCC\r\nDDyEE")
+
+        df = read_fixed_width(
+            str(path), ["a", "b"], colspecs=[(0, 2), (3, 5)]
+        ).execute()
+
+        assert df["a"].tolist() == ["AA", "CC", "DD"]
+        assert df["b"].tolist()[0] == "BB"
+        assert pd.isna(df["b"].iloc[1])
+        assert df["b"].tolist()[2] == "EE"
+
+    def test_non_ascii_uses_character_positions(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_text("Zoë  01\nJosé 02\n", encoding="utf-8")
+
+        df = read_fixed_width(str(path), ["name", "n"], widths=[5, 2]).execute()
+
+        assert df["name"].tolist() == ["Zoë", "José"]
+        assert df["n"].tolist() == [1, 2]
+
+    def test_file_handle_and_empty_file(self, tmp_path):
+        handle = io.BytesIO(b"12ab\n34cd\n")
+        df = read_fixed_width(handle, ["n", "s"], widths=[2, 2]).execute()
+        assert df["s"].tolist() == ["ab", "cd"]
+
+        empty = tmp_path / "empty.txt"
+        empty.write_text("")
+        t = read_fixed_width(str(empty), ["n"], widths=[2])
+        assert t.columns == ("n",)
+        assert t.count().execute() == 0
+
+    def test_numeric_columns_are_typed(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_text("001   12.50A1\n002        B2\n003  -3    C3\n")
+
+        t = read_fixed_width(str(path), ["id", "amt", "code"], widths=[3, 8, 2])
+
+        assert [str(t.schema()[c]) for c in t.columns] == ["int64", "float64", "string"]
+        df = t.execute()
+        assert df["id"].tolist() == [1, 2, 3]
+        assert df["amt"].iloc[0] == 12.5
+        assert pd.isna(df["amt"].iloc[1])
+
+    def test_mismatched_specs_raise(self, tmp_path):
+        with pytest.raises(ValueError, match="must match"):
+            read_fixed_width(io.BytesIO(b"x\n"), ["a", "b"], widths=[1])
+
+
+class TestParentChildWindows:
+    @pytest.fixture(autouse=True)
+    def tiny_windows(self, monkeypatch):
+        # Force many windows so parents carry across window boundaries
+        monkeypatch.setattr("pipelines.lib.fixed_width._WINDOW_BYTES", 37)
+
+    def test_flatten_matches_line_by_line_reference(self, tmp_path):
+        path = _claims_file(tmp_path / "claims.txt")
+
+        df = read_parent_child_fixed_width(str(path), [0, 1], RECORD_TYPES).execute()
+
+        pd.testing.assert_frame_equal(df, _reference_flatten(path))
+
+    def test_parent_and_child_only_modes(self, tmp_path):
+        path = _claims_file(tmp_path / "claims.txt")
+
+        parents = read_parent_child_fixed_width(
+            str(path), [0, 1], RECORD_TYPES, output_mode="parent_only"
+        ).execute()
+        children = read_parent_child_fixed_width(
+            str(path), [0, 1], RECORD_TYPES, output_mode="child_only"
+        ).execute()
+
+        assert len(parents) == 40
+        assert parents["claim"].iloc[-1] == "0039"
+        assert len(children) == len(_reference_flatten(path))
+
+    def test_streamed_handle_matches_mapped_file(self, tmp_path):
+        path = _claims_file(tmp_path / "claims.txt")
+
+        with open(path, "r", encoding="utf-8") as f:
+            streamed = read_parent_child_fixed_width(f, [0, 1], RECORD_TYPES)
+            df = streamed.execute()
+
+        pd.testing.assert_frame_equal(df, _reference_flatten(path))
+
+    def test_orphan_child_reports_file_line_number(self, tmp_path):
+        path = tmp_path / "orphan.txt"
+        path.write_text("T0000000\n\nT0000000\nT0000000\nD01      5\nH0001M00001\n")
+
+        with pytest.raises(ValueError, match="line 5 has no parent"):
+            read_parent_child_fixed_width(str(path), [0, 1], RECORD_TYPES)
@@ -0,0 +1,215 @@
+"""Tests for HTTP conditional requests and the API response cache."""
+
+from __future__ import annotations
+
+import json
+import os
+
+import httpx
+import pandas as pd
+import pytest
+
+from pipelines.lib.api import PaginationConfig, PaginationStrategy
+from pipelines.lib.http_cache import ResponseCache
+from pipelines.lib.silver import SilverEntity
+
+PAGES = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+
+
+class _Server:
+    """Mock API serving PAGES with an ETag per page version."""
+
+    def __init__(self) -> None:
+        self.versions: dict = {}
+        self.requests: list = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        etag = f'"{self.versions.get(page, "v1")}-{page}"'
+        self.requests.append((page, request.headers.get("If-None-Match")))
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag})
+        items = PAGES[page - 1] if page <= len(PAGES) else []
+        return httpx.Response(200, json=items, headers={"ETag": etag})
+
+
+@pytest.fixture
+def regions_source(tmp_path, mock_api_source):
+    """Cached ApiSource over the regions endpoint, two records per page."""
+
+    def make(server, **overrides):
+        return mock_api_source(
+            server,
+            entity="regions",
+            endpoint="/v1/regions",
+            target_path=str(tmp_path / "bronze" / "dt={run_date}") + "/",
+            pagination=PaginationConfig(strategy=PaginationStrategy.PAGE, page_size=2),
+            **{"response_cache": True, **overrides},
+        )
+
+    return make
+
+
+@pytest.fixture(autouse=True)
+def _dirs(tmp_path, monkeypatch):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    monkeypatch.setenv("PIPELINE_STAGING_DIR", str(tmp_path / "staging"))
+
+
+def test_unchanged_endpoint_writes_from_cache(tmp_path, regions_source):
+    server = _Server()
+    first = regions_source(server).run("2025-01-15")
+    assert first["row_count"] == 3
+    assert all(etag is None for _, etag in server.requests)
+
+    server.requests.clear()
+    second = regions_source(server).run("2025-01-16")
+
+    # Every page was revalidated (304) and the partition rebuilt from cache
+    assert second["unchanged"] is True
+    assert second["row_count"] == 3
+    assert server.requests == [(1, '"v1-1"'), (2, '"v1-2"')]
+    partition = tmp_path / "bronze" / "dt=2025-01-16"
+    metadata = json.loads((partition / "_metadata.json").read_text())
+    assert metadata["unchanged"] is True
+    assert sorted(pd.read_parquet(partition / "regions.parquet")["id"]) == [1, 2, 3]
+
+
+def test_silver_runs_after_unchanged_bronze_run(tmp_path, regions_source):
+    server = _Server()
+    regions_source(server).run("2025-01-15")
+    assert regions_source(server).run("2025-01-16")["unchanged"] is True
+
+    silver_target = tmp_path / "silver" / "dt={run_date}"
+    silver = SilverEntity(
+        domain="vendor",
+        subject="regions",
+        source_path=str(tmp_path / "bronze" / "dt={run_date}" / "*.parquet"),
+        target_path=str(silver_target) + "/",
+        unique_columns=["id"],
+        last_updated_column="_extracted_at",
+    )
+
+    result = silver.run("2025-01-16")
+
+    assert result["row_count"] == 3
+
+
+def test_changed_page_writes_with_cached_pages(tmp_path, regions_source):
+    server = _Server()
+    regions_source(server).run("2025-01-15")
+
+    # Only the first page changes; the second is answered from the cache
+    server.versions[1] = "v2"
+    server.requests.clear()
+    result = regions_source(server).run("2025-01-16")
+
+    assert "unchanged" not in result
+    assert result["row_count"] == 3
+    # Page 2 was revalidated (304) and its records came from the cache
+    assert server.requests == [(1, '"v1-1"'), (2, '"v1-2"')]
+    df = pd.read_parquet(tmp_path / "bronze" / "dt=2025-01-16" / "regions.parquet")
+    assert sorted(df["id"]) == [1, 2, 3]
+
+
+def test_failed_write_does_not_commit_validators(monkeypatch, regions_source):
+    def fail_write(*args, **kwargs):
+        raise OSError("disk full")
+
+    server = _Server()
+    source = regions_source(server)
+    monkeypatch.setattr(source, "_write", fail_write)
+    with pytest.raises(OSError):
+        source.run("2025-01-15")
+
+    server.requests.clear()
+    result = regions_source(server).run("2025-01-15")
+
+    # Nothing was cached, so the retry downloads and writes everything
+    assert all(etag is None for _, etag in server.requests)
+    assert result["row_count"] == 3
+
+
+def test_cache_disabled_sends_no_validators(tmp_path, regions_source):
+    server = _Server()
+    regions_source(server, response_cache=False).run("2025-01-15")
+    regions_source(server, response_cache=False).run("2025-01-16")
+
+    assert all(etag is None for _, etag in server.requests)
+    assert not (tmp_path / "staging" / "api_response_cache").exists()
+
+
+def test_callers_with_other_credentials_do_not_share_entries(regions_source):
+    server = _Server()
+    regions_source(server, headers={"Authorization": "Bearer a"}).run("2025-01-15")
+
+    server.requests.clear()
+    result = regions_source(server, headers={"Authorization": "Bearer b"}).run(
+        "2025-01-16"
+    )
+
+    assert all(etag is None for _, etag in server.requests)
+    assert result["row_count"] == 3
+
+
+def test_unexpected_304_refetches_without_validators(regions_source):
+    sent = []
+
+    def server(request: httpx.Request) -> httpx.Response:
+        sent.append(request.headers.get("If-None-Match"))
+        page = int(request.url.params["page"])
+        if len(sent) == 1:
+            # A proxy answering 304 to a request the cache never validated
+            return httpx.Response(304)
+        items = PAGES[page - 1] if page <= len(PAGES) else []
+        return httpx.Response(200, json=items, headers={"ETag": f'"{page}"'})
+
+    source = regions_source(server, headers={"If-None-Match": '"stale"'})
+
+    result = source.run("2025-01-15")
+
+    assert result["row_count"] == 3
+    assert sent[:2] == ['"stale"', None]
+
+
+def _response(body: bytes, **headers) -> httpx.Response:
+    return httpx.Response(
+        200,
+        content=body,
+        headers=headers,
+        request=httpx.Request("GET", "https://api.example.com/v1/x"),
+    )
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(tmp_path, max_bytes=25)
+    for name in ("a", "b"):
+        cache.stage(name, _response(b"x" * 10, ETag=f'"{name}"'))
+    cache.commit()
+    os.utime(tmp_path / "a.body", (1, 1))
+    os.utime(tmp_path / "b.body", (2, 2))
+
+    # A hit makes "a" the most recently used entry
+    assert cache.get("a").conditional_headers() == {"If-None-Match": '"a"'}
+    cache.stage("c", _response(b"x" * 10, **{"Last-Modified": "Mon, 13 Jan 2025"}))
+    cache.commit()
+
+    assert cache.get("b") is None
+    assert cache.get("a").read() == b"x" * 10
+    assert cache.get("c").conditional_headers() == {
+        "If-Modified-Since": "Mon, 13 Jan 2025"
+    }
+
+
+def test_cache_skips_responses_without_validators(tmp_path):
+    cache = ResponseCache(tmp_path)
+
+    assert not cache.stage("a", _response(b"{}"))
+    assert not cache.stage(
+        "b", _response(b"{}", ETag='"b"', **{"Cache-Control": "no-store"})
+    )
+    cache.stage("c", _response(b"{}", ETag='"c"'))
+    cache.discard()
+
+    assert list(tmp_path.iterdir()) == []
+    assert cache.key("u", {"a": 1, "b": 2}) == cache.key("u", {"b": "2", "a": "1"})
@@ -63,3 +63,15 @@ def test_infer_column_types_from_records_and_table(tmp_path):
 
     with pytest.raises(TypeError):
         infer_column_types("not a table or records")
+
+
+def test_infer_column_types_from_records_uses_all_values():
+    records = [{"id": 1, "score": None}, {"id": 2, "score": 2.5, "tags": ["a"]}]
+
+    assert [(c["name"], c["type"]) for c in infer_column_types(records)] == [
+        ("id", "int"),
+        ("score", "float"),
+        ("tags", "list"),
+    ]
+    # Columns Arrow cannot unify fall back to the first non-null value
+    assert infer_column_types([{"v": 1}, {"v": "x"}])[0]["type"] == "int"
@@ -1,9 +1,13 @@
 """Tests for the pipelines late-data helpers."""
 
+from datetime import timedelta
+
 import ibis
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
+from pipelines.lib import state
 from pipelines.lib.state import (
     LateDataConfig,
     LateDataMode,
@@ -118,3 +122,186 @@ class TestGetLateRecords:
         df = late.execute()
         assert len(df) == 1
         assert df["id"].iloc[0] == 1
+
+
+class TestSinglePass:
+    """Late-data handling scans the batch once per call."""
+
+    @pytest.fixture
+    def executions(self, monkeypatch):
+        calls = []
+        execute = ibis.expr.types.Expr.execute
+
+        def spy(self, *args, **kwargs):
+            calls.append(self)
+            return execute(self, *args, **kwargs)
+
+        monkeypatch.setattr(ibis.expr.types.Expr, "execute", spy)
+        return calls
+
+    def test_detect_runs_one_aggregate(self, sample_table, executions):
+        result = detect_late_data(sample_table, "event_ts", "2025-01-15T00:00:00")
+
+        assert len(executions) == 1
+        assert (result.late_count, result.total_count) == (1, 3)
+
+    def test_ignore_mode_stays_lazy(self, sample_table, executions):
+        config = LateDataConfig(mode=LateDataMode.IGNORE)
+        filter_late_data(sample_table, "event_ts", "2025-01-15T00:00:00", config)
+
+        assert executions == []
+
+    def test_max_lateness_moves_cutoff(self, sample_table):
+        result = detect_late_data(
+            sample_table,
+            "event_ts",
+            "2025-01-15T00:00:00",
+            max_lateness=timedelta(days=7),
+        )
+
+        assert result.late_count == 0
+        assert result.total_count == 3
+
+
+class TestQuarantine:
+    """Quarantine splits on-time and late rows and stores the late ones."""
+
+    def test_writes_late_records_to_storage(self, sample_table, tmp_path):
+        config = LateDataConfig(
+            mode=LateDataMode.QUARANTINE,
+            quarantine_path=str(tmp_path / "quarantine"),
+        )
+
+        filtered = filter_late_data(
+            sample_table, "event_ts", "2025-01-15T00:00:00", config
+        )
+
+        assert sorted(filtered.execute()["id"]) == [2, 3]
+        (output,) = (tmp_path / "quarantine").glob("late_records_*.parquet")
+        assert pq.read_table(output).to_pydict() == {
+            "id": [1],
+            "event_ts": ["2025-01-10T10:00:00"],
+        }
+
+    def test_no_file_without_late_records(self, sample_table, tmp_path):
+        config = LateDataConfig(
+            mode=LateDataMode.QUARANTINE,
+            quarantine_path=str(tmp_path / "quarantine"),
+        )
+
+        filtered = filter_late_data(
+            sample_table, "event_ts", "2025-01-01T00:00:00", config
+        )
+
+        assert filtered.count().execute() == 3
+        assert not (tmp_path / "quarantine").exists()
+
+    def test_source_is_scanned_once_by_default(
+        self, sample_table, tmp_path, monkeypatch
+    ):
+        config = LateDataConfig(
+            mode=LateDataMode.QUARANTINE,
+            quarantine_path=str(tmp_path / "quarantine"),
+        )
+        monkeypatch.setenv("PIPELINE_STAGING_DIR", str(tmp_path / "staging"))
+        monkeypatch.setattr(state, "_late_staging_dir", None)
+        monkeypatch.setattr(state, "_late_spool", None)
+        scans = []
+        to_batches = ibis.expr.types.Table.to_pyarrow_batches
+
+        def spy(self, *args, **kwargs):
+            scans.append(self)
+            return to_batches(self, *args, **kwargs)
+
+        monkeypatch.setattr(ibis.expr.types.Table, "to_pyarrow_batches", spy)
+
+        filtered = filter_late_data(
+            sample_table, "event_ts", "2025-01-15T00:00:00", config
+        )
+
+        # The on-time rows are read back from the spool, not the source
+        assert len(scans) == 1
+        assert sample_table.op() not in filtered.op().find(type(sample_table.op()))
+        assert list((tmp_path / "staging").glob("staging_late_data_*/on_time_*"))
+        assert sorted(filtered.execute()["id"]) == [2, 3]
+
+    def test_no_late_rows_returns_source_table(self, sample_table, tmp_path):
+        config = LateDataConfig(mode=LateDataMode.QUARANTINE)
+
+        filtered = filter_late_data(
+            sample_table,
+            "event_ts",
+            "2025-01-01T00:00:00",
+            config,
+            staging_dir=tmp_path,
+        )
+
+        assert filtered is sample_table
+        assert list(tmp_path.iterdir()) == []
+
+    def test_default_spool_is_replaced_by_next_call(
+        self, sample_table, tmp_path, monkeypatch
+    ):
+        config = LateDataConfig(mode=LateDataMode.QUARANTINE)
+        monkeypatch.setenv("PIPELINE_STAGING_DIR", str(tmp_path))
+        monkeypatch.setattr(state, "_late_staging_dir", None)
+        monkeypatch.setattr(state, "_late_spool", None)
+
+        for _ in range(3):
+            filtered = filter_late_data(
+                sample_table, "event_ts", "2025-01-15T00:00:00", config
+            )
+
+        assert len(list(tmp_path.glob("staging_late_data_*/on_time_*.parquet"))) == 1
+        assert sorted(filtered.execute()["id"]) == [2, 3]
+
+    def test_staging_dir_spools_on_time_rows(self, sample_table, tmp_path):
+        config = LateDataConfig(
+            mode=LateDataMode.QUARANTINE,
+            quarantine_path=str(tmp_path / "quarantine"),
+        )
+        staging = tmp_path / "staging"
+        staging.mkdir()
+
+        filtered = filter_late_data(
+            sample_table,
+            "event_ts",
+            "2025-01-15T00:00:00",
+            config,
+            staging_dir=staging,
+        )
+
+        (spooled,) = staging.glob("on_time_*.parquet")
+        assert sorted(pq.read_table(spooled).column("id").to_pylist()) == [2, 3]
+        assert sorted(filtered.execute()["id"]) == [2, 3]
+        (output,) = (tmp_path / "quarantine").glob("late_records_*.parquet")
+        assert pq.read_table(output).column("id").to_pylist() == [1]
+
+    def test_quarantine_storage_gets_storage_options(
+        self, sample_table, tmp_path, monkeypatch
+    ):
+        from pipelines.lib import storage
+
+        seen = []
+        get_storage = storage.get_storage
+
+        def spy(path, **options):
+            seen.append((path, options))
+            return get_storage(path)
+
+        monkeypatch.setattr(storage, "get_storage", spy)
+        quarantine = str(tmp_path / "quarantine")
+        config = LateDataConfig(
+            mode=LateDataMode.QUARANTINE, quarantine_path=quarantine
+        )
+
+        filter_late_data(
+            sample_table,
+            "event_ts",
+            "2025-01-15T00:00:00",
+            config,
+            staging_dir=tmp_path,
+            storage_options={"key": "k", "secret": "s"},
+        )
+
+        assert seen == [(quarantine, {"key": "k", "secret": "s"})]
@@ -0,0 +1,201 @@
+"""Tests for multi-process parsing of large line-oriented files."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from pipelines.lib.bronze import BronzeSource, SourceType
+from pipelines.lib import parallel_parse
+from pipelines.lib.fixed_width import read_fixed_width, read_parent_child_fixed_width
+from pipelines.lib.parallel_parse import (
+    ByteRange,
+    concat_range_tables,
+    count_lines_before,
+    map_byte_ranges,
+    read_byte_range,
+    resolve_parse_workers,
+    split_byte_ranges,
+)
+
+RECORD_TYPES = [
+    {"type": "H", "role": "parent", "columns": ["claim"], "widths": [4]},
+    {"type": "D", "role": "child", "columns": ["amount"], "widths": [6]},
+]
+
+
+@pytest.fixture
+def small_ranges(monkeypatch):
+    """Force many tiny byte ranges (and windows) so files split mid-record."""
+    monkeypatch.setattr("pipelines.lib.parallel_parse.RANGE_BYTES", 64)
+    monkeypatch.setattr("pipelines.lib.fixed_width._WINDOW_BYTES", 32)
+
+
+class TestSplitByteRanges:
+    def test_ranges_cover_file_on_line_boundaries(self, tmp_path):
+        path = tmp_path / "f.txt"
+        content = b"".join(f"line {i:03d}\n".encode() for i in range(50))
+        path.write_bytes(content)
+
+        ranges = split_byte_ranges(str(path), range_bytes=40)
+
+        assert len(ranges) > 5
+        assert b"".join(read_byte_range(r) for r in ranges) == content
+        assert all(read_byte_range(r).endswith(b"\n") for r in ranges)
+
+    def test_long_line_and_missing_trailing_newline(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_bytes(b"a" * 100 + b"\nshort\nlast")
+
+        ranges = split_byte_ranges(str(path), range_bytes=10)
+
+        assert [read_byte_range(r) for r in ranges] == [
+            b"a" * 100 + b"\n",
+            b"short\nlast",
+        ]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_bytes(b"")
+
+        assert split_byte_ranges(str(path)) == []
+
+    def test_count_lines_before(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_bytes(b"a\nb\nc\n")
+
+        assert count_lines_before(ByteRange(str(path), 4, 6)) == 2
+
+
+def test_resolve_parse_workers():
+    small = [ByteRange("f", 0, 10), ByteRange("f", 10, 20)]
+    large = [ByteRange("f", 0, 300 * 1024 * 1024)]
+
+    assert resolve_parse_workers(None, []) == 1
+    assert resolve_parse_workers("auto", small) == 1
+    assert resolve_parse_workers(8, small) == 2
+    assert resolve_parse_workers(1, small) == 1
+    assert resolve_parse_workers(None, large) == 1  # one range, nothing to split
+
+
+def test_parse_workers_opt_in(tmp_path, monkeypatch):
+    large = [ByteRange("f", i << 28, (i + 1) << 28) for i in range(4)]
+    monkeypatch.setattr("os.cpu_count", lambda: 8)
+
+    # Splitting can break quoted multi-line records, so it is never implicit
+    assert resolve_parse_workers(None, large) == 1
+    assert resolve_parse_workers("auto", large) == 4
+
+    path = tmp_path / "f.txt"
+    path.write_text("00001ab\n")
+    monkeypatch.setattr(
+        "pipelines.lib.fixed_width.split_byte_ranges",
+        lambda *args: pytest.fail("split without parse_workers"),
+    )
+    t = read_fixed_width(str(path), ["id", "s"], widths=[5, 2], parse_workers=None)
+    assert t.count().execute() == 1
+
+
+def test_map_byte_ranges_does_not_fork(monkeypatch):
+    contexts = []
+
+    class _Pool:
+        def __init__(self, max_workers, mp_context):
+            contexts.append(mp_context.get_start_method())
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, fn, items):
+            return map(fn, items)
+
+    monkeypatch.setattr(parallel_parse, "ProcessPoolExecutor", _Pool)
+
+    assert map_byte_ranges(str, [ByteRange("f", 0, 1)], 2) == [
+        str(ByteRange("f", 0, 1))
+    ]
+    assert contexts in (["forkserver"], ["spawn"])
+
+
+def test_concat_range_tables_promotes_and_falls_back_to_strings():
+    promoted = concat_range_tables(
+        [pa.table({"a": [1, 2]}), pa.table({"a": [1.5, None]})]
+    )
+    assert promoted.schema.field("a").type == pa.float64()
+
+    mixed = concat_range_tables(
+        [pa.table({"a": [1], "b": ["x"]}), pa.table({"a": ["X1"], "b": ["y"]})]
+    )
+    assert mixed.column("a").to_pylist() == ["1", "X1"]
+
+
+def _claims(path: Path) -> Path:
+    lines = []
+    for c in range(30):
+        lines.append(f"H{c:04d}")
+        lines.extend(f"D{c * 100 + d:6d}" for d in range(c % 5))
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def test_fixed_width_parallel_matches_serial(tmp_path, small_ranges):
+    path = tmp_path / "f.txt"
+    path.write_text("".join(f"{i:05d}{'x' * (i % 7):<8}\n" for i in range(200)))
+
+    serial = read_fixed_width(str(path), ["id", "s"], widths=[5, 8]).execute()
+    parallel = read_fixed_width(
+        str(path), ["id", "s"], widths=[5, 8], parse_workers=3
+    ).execute()
+
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+@pytest.mark.parametrize("mode", ["flatten", "parent_only", "child_only"])
+def test_parent_child_parallel_matches_serial(tmp_path, small_ranges, mode):
+    path = _claims(tmp_path / "claims.txt")
+
+    serial = read_parent_child_fixed_width(
+        str(path), [0, 1], RECORD_TYPES, output_mode=mode
+    ).execute()
+    parallel = read_parent_child_fixed_width(
+        str(path), [0, 1], RECORD_TYPES, output_mode=mode, parse_workers=3
+    ).execute()
+
+    assert len(serial) > 0
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_parent_child_parallel_orphan_line_number(tmp_path, small_ranges):
+    path = tmp_path / "orphan.txt"
+    path.write_text("".join(f"X{i:09d}\n" for i in range(20)) + "D000042\nH0001\n")
+
+    with pytest.raises(ValueError, match="line 21 has no parent"):
+        read_parent_child_fixed_width(str(path), [0, 1], RECORD_TYPES, parse_workers=2)
+
+
+def test_bronze_space_delimited_parallel(tmp_path, small_ranges, monkeypatch):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    path = tmp_path / "accounts.txt"
+    path.write_text(
+        "account_id  balance\n" + "".join(f"A{i:03d}  {i * 10}\n" for i in range(100))
+    )
+    source = BronzeSource(
+        system="legacy",
+        entity="accounts",
+        source_type=SourceType.FILE_SPACE_DELIMITED,
+        source_path=str(path),
+        target_path=str(tmp_path / "bronze"),
+        options={"parse_workers": 2},
+    )
+
+    df = source._read_character_delimited(str(path)).execute()
+
+    assert list(df.columns) == ["account_id", "balance"]
+    assert df["account_id"].tolist() == [f"A{i:03d}" for i in range(100)]
+    assert df["balance"].sum() == sum(i * 10 for i in range(100))
@@ -1,12 +1,29 @@
 """Tests for the pipelines checksum helpers."""
 
+import io
+import json
+import os
 from pathlib import Path
 
+import ibis
+import pandas as pd
+import pytest
 
+from pipelines.lib import artifact_writer
+from pipelines.lib import checksum as checksum_module
+from pipelines.lib.artifact_writer import write_artifacts
+from pipelines.lib.catalog import read_catalog
 from pipelines.lib.checksum import (
     ChecksumManifest,
     ChecksumVerificationResult,
+    CHECKSUM_ALGORITHMS,
+    HashingWriter,
+    VerificationCache,
+    compute_bytes_hash,
+    compute_bytes_sha256,
+    compute_file_hash,
     compute_file_sha256,
+    resolve_checksum_algorithm,
     verify_checksum_manifest,
     write_checksum_manifest,
 )
@@ -86,3 +103,198 @@ class TestChecksumManifestVerification:
         manifest_path.write_text("{ invalid }")
         result = verify_checksum_manifest(tmp_path)
         assert not result.valid
+
+
+def test_hashing_writer_tees_bytes():
+    sink = io.BytesIO()
+    tee = HashingWriter(sink)
+
+    tee.write(b"hello ")
+    tee.write(memoryview(b"world"))
+    tee.close()
+
+    assert sink.getvalue() == b"hello world"
+    assert not sink.closed
+    assert tee.file_entry("a.bin") == {
+        "path": "a.bin",
+        "size_bytes": 11,
+        "sha256": compute_bytes_sha256(b"hello world"),
+    }
+
+
+def test_write_artifacts_hashes_while_writing(tmp_path: Path, monkeypatch):
+    def fail(path, algorithm):
+        raise AssertionError(f"{path} was read back")
+
+    monkeypatch.setattr(checksum_module, "compute_file_hash", fail)
+    table = ibis.memtable(pd.DataFrame({"id": range(100)}))
+
+    write_artifacts(
+        table=table,
+        target=str(tmp_path),
+        entity_name="orders",
+        columns=[{"name": "id"}],
+        run_date="2025-01-15",
+    )
+
+    monkeypatch.undo()
+    result = verify_checksum_manifest(tmp_path)
+    assert result.valid
+    assert result.verified_files == ["orders.parquet"]
+
+
+def _partitioned_cloud_write(target: Path, monkeypatch, **kwargs):
+    """Hive-partitioned write down the object storage path, to target."""
+    monkeypatch.setattr(artifact_writer, "parse_uri", lambda target: ("s3", target))
+    engine = artifact_writer.get_engine
+    monkeypatch.setattr(artifact_writer, "get_engine", lambda *args: engine())
+    table = ibis.memtable(
+        pd.DataFrame({"id": range(100), "region": ["east", "west"] * 50})
+    )
+    return write_artifacts(
+        table=table,
+        target=str(target) + "/",
+        entity_name="orders",
+        columns=[{"name": "id"}, {"name": "region"}],
+        run_date="2025-01-15",
+        partition_by=["region"],
+        **kwargs,
+    )
+
+
+def test_partitioned_write_records_written_files(tmp_path: Path, monkeypatch):
+    target = tmp_path / "dt=2025-01-15"
+    result = _partitioned_cloud_write(target, monkeypatch, catalog={})
+
+    assert result.checksums_file == "_checksums.json"
+    assert [name.split("/")[0] for name in result.data_files] == [
+        "region=east",
+        "region=west",
+    ]
+    metadata = json.loads((target / "_metadata.json").read_text())
+    assert metadata["data_files"] == result.data_files
+    assert read_catalog(str(tmp_path))["2025-01-15"].files == result.data_files
+    manifest = ChecksumManifest.from_file(target / "_checksums.json")
+    assert [entry["path"] for entry in manifest.files] == result.data_files
+
+    verified = verify_checksum_manifest(target)
+    assert verified.valid
+    assert verified.verified_files == result.data_files
+
+
+def test_failed_cloud_manifest_is_not_reported(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(
+        artifact_writer, "write_checksum_manifest_s3", lambda *args, **kwargs: False
+    )
+
+    result = _partitioned_cloud_write(tmp_path, monkeypatch)
+
+    assert result.checksums_file is None
+    assert "checksums_file" not in result.to_dict()
+
+
+def test_compute_file_sha256_mmaps_large_files(tmp_path: Path, monkeypatch):
+    file = tmp_path / "data.parquet"
+    file.write_bytes(b"x" * 4096)
+    expected = compute_file_sha256(file)
+
+    monkeypatch.setattr(checksum_module, "MMAP_THRESHOLD", 1024)
+
+    assert compute_file_sha256(file) == expected == compute_bytes_sha256(b"x" * 4096)
+
+
+def test_verification_cache_skips_unchanged_files(tmp_path: Path, monkeypatch):
+    data = tmp_path / "data"
+    data.mkdir()
+    files = []
+    for i in range(4):
+        files.append(data / f"part-{i}.parquet")
+        files[-1].write_bytes(f"payload-{i}".encode())
+    write_checksum_manifest(data, files, row_count=4)
+    cache_path = tmp_path / "state" / "_checksum_cache.json"
+
+    first = verify_checksum_manifest(
+        data, cache=VerificationCache(cache_path), max_workers=4
+    )
+    assert first.valid
+    assert len(first.verified_files) == 4
+
+    hashed = []
+    compute = checksum_module.compute_file_hash
+    monkeypatch.setattr(
+        checksum_module,
+        "compute_file_hash",
+        lambda path, algorithm: hashed.append(path.name) or compute(path, algorithm),
+    )
+    assert verify_checksum_manifest(data, cache=VerificationCache(cache_path)).valid
+    assert hashed == []
+
+    # Rewriting a file changes its cache key, so it is hashed again
+    files[0].write_bytes(b"tampered")
+    result = verify_checksum_manifest(data, cache=VerificationCache(cache_path))
+    assert result.mismatched_files == ["part-0.parquet"]
+    assert hashed == []  # size changed, so no hash was needed
+
+    files[1].write_bytes(b"payload-X")
+    # Same size; the cache must rely on the mtime, even on coarse clocks
+    os.utime(files[1], ns=(1, 1))
+    result = verify_checksum_manifest(data, cache=VerificationCache(cache_path))
+    assert "part-1.parquet" in result.mismatched_files
+    assert hashed == ["part-1.parquet"]
+
+
+@pytest.mark.parametrize("algorithm", list(CHECKSUM_ALGORITHMS))
+def test_manifest_round_trip_per_algorithm(tmp_path: Path, algorithm):
+    pytest.importorskip(CHECKSUM_ALGORITHMS[algorithm])
+    table = ibis.memtable(pd.DataFrame({"id": range(100)}))
+
+    write_artifacts(
+        table=table,
+        target=str(tmp_path),
+        entity_name="orders",
+        columns=[{"name": "id"}],
+        run_date="2025-01-15",
+        checksum_algorithm=algorithm,
+    )
+
+    manifest = ChecksumManifest.from_file(tmp_path / "_checksums.json")
+    assert manifest.algorithm == algorithm
+    assert manifest.files[0][algorithm] == compute_file_hash(
+        tmp_path / "orders.parquet", algorithm
+    )
+    assert verify_checksum_manifest(tmp_path).valid
+
+    (tmp_path / "orders.parquet").write_bytes(b"corrupt")
+    assert not verify_checksum_manifest(tmp_path).valid
+
+
+def test_legacy_manifest_without_algorithm_is_sha256(tmp_path: Path):
+    file = tmp_path / "data.parquet"
+    file.write_bytes(b"payload")
+    legacy = {
+        "timestamp": "2024-01-01T00:00:00Z",
+        "row_count": 1,
+        "files": [
+            {
+                "path": "data.parquet",
+                "size_bytes": 7,
+                "sha256": compute_bytes_sha256(b"payload"),
+            }
+        ],
+    }
+    (tmp_path / "_checksums.json").write_text(json.dumps(legacy))
+
+    result = verify_checksum_manifest(tmp_path)
+
+    assert result.valid
+    assert result.manifest.algorithm == "sha256"
+
+
+def test_checksum_algorithm_from_env(monkeypatch):
+    monkeypatch.setenv("PIPELINE_CHECKSUM_ALGORITHM", "BLAKE2B")
+
+    assert resolve_checksum_algorithm() == "blake2b"
+    assert resolve_checksum_algorithm("sha256") == "sha256"
+    assert compute_bytes_hash(b"x", "blake2b") != compute_bytes_sha256(b"x")
+    with pytest.raises(ValueError, match="Unsupported checksum algorithm"):
+        resolve_checksum_algorithm("md5")
@@ -10,8 +10,11 @@ Tests the command-line interface including:
 
 import subprocess
 import sys
+from pathlib import Path
 from unittest.mock import MagicMock
 
+EXAMPLES_DIR = Path(__file__).resolve().parents[2] / "pipelines" / "examples"
+
 
 class TestCLIHelp:
     """Tests for CLI help and basic invocation."""
@@ -139,6 +142,7 @@ class TestCLIExplain:
         mock_bronze.load_pattern = LoadPattern.FULL_SNAPSHOT
         mock_bronze.target_path = "/output/"
         mock_bronze.watermark_column = None
+        mock_bronze.catalog.return_value = {}
 
         mock_silver = MagicMock()
         mock_silver.source_path = "/bronze/*.parquet"
@@ -160,6 +164,18 @@ class TestCLIExplain:
         assert "BRONZE" in captured.out
         assert "SILVER" in captured.out
 
+    def test_explain_yaml_pipeline(self, capsys):
+        """--explain on a YAML pipeline should describe it and its catalog."""
+        from pipelines.__main__ import explain_yaml_pipeline
+
+        yaml_path = EXAMPLES_DIR / "csv_snapshot.yaml"
+        explain_yaml_pipeline(str(yaml_path), layer=None, run_date="2025-01-15")
+
+        captured = capsys.readouterr()
+        assert "EXPLANATION" in captured.out
+        assert "BRONZE LAYER" in captured.out
+        assert "(no partitions recorded)" in captured.out
+
 
 class TestCLIRunPipeline:
     """Tests for run_pipeline function."""
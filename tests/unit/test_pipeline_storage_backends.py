@@ -204,6 +204,21 @@ class TestLocalStorage:
 
         assert result is False
 
+    def test_list_partitions(self, tmp_path):
+        """list_partitions() returns the dt= directories directly under prefix."""
+        for name in ["dt=2025-01-15", "dt=2025-01-14", "region=eu", "dt="]:
+            (tmp_path / "orders" / name).mkdir(parents=True)
+        (tmp_path / "orders" / "dt=2025-01-16").write_text("not a directory")
+
+        storage = LocalStorage(str(tmp_path))
+
+        assert storage.list_partitions("orders") == ["2025-01-14", "2025-01-15"]
+        assert storage.list_partitions("orders", start_after="2025-01-14") == [
+            "2025-01-15"
+        ]
+        assert storage.list_partitions("orders", key="region") == ["eu"]
+        assert storage.list_partitions("missing") == []
+
     def test_makedirs(self, tmp_path):
         """makedirs() creates directories."""
         storage = LocalStorage(str(tmp_path))
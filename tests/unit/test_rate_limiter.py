@@ -1,9 +1,13 @@
 """Tests for pipelines.lib.rate_limiter module."""
 
+import asyncio
 import threading
 import time
 
-from pipelines.lib.api import RateLimiter, rate_limited
+import pytest
+from structlog.testing import capture_logs
+
+from pipelines.lib.api import ApiSource, RateLimiter, get_rate_limiter, rate_limited
 
 
 # ============================================
@@ -286,3 +290,152 @@ class TestRateLimitedDecorator:
 
         result = get_value()
         assert result == {"key": "value"}
+
+
+# ============================================
+# Shared limiters, in-flight slots and header adaptation
+# ============================================
+
+
+class TestRateLimiterReservations:
+    """Waiters reserve tokens and sleep once instead of polling."""
+
+    def test_waiters_sleep_once_for_their_reserved_token(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("pipelines.lib.api.time.sleep", sleeps.append)
+        limiter = RateLimiter(requests_per_second=10, burst_size=1)
+
+        for _ in range(3):
+            assert limiter.acquire() is True
+
+        # The second and third callers wait ~0.1s and ~0.2s, each in one sleep
+        assert len(sleeps) == 2
+        assert sleeps[0] == pytest.approx(0.1, abs=0.01)
+        assert sleeps[1] == pytest.approx(0.2, abs=0.01)
+
+    def test_async_acquire_waits_for_token(self):
+        limiter = RateLimiter(requests_per_second=50, burst_size=1)
+
+        async def acquire_twice():
+            await limiter.acquire_async()
+            start = time.monotonic()
+            await limiter.acquire_async()
+            return time.monotonic() - start
+
+        assert asyncio.run(acquire_twice()) >= 0.015
+
+
+class TestRateLimiterSlots:
+    """max_in_flight bounds concurrent holders of slot()."""
+
+    def test_threads_share_in_flight_limit(self):
+        limiter = RateLimiter(requests_per_second=None, max_in_flight=2)
+        peak = []
+
+        def worker():
+            with limiter.slot():
+                peak.append(limiter.in_flight)
+                time.sleep(0.01)
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert max(peak) == 2
+        assert limiter.in_flight == 0
+
+    def test_async_tasks_share_in_flight_limit(self):
+        limiter = RateLimiter(requests_per_second=None, max_in_flight=2)
+        peak = []
+
+        async def task():
+            async with limiter.slot_async():
+                peak.append(limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            await asyncio.gather(*(task() for _ in range(6)))
+
+        asyncio.run(main())
+
+        assert max(peak) == 2
+        assert limiter.in_flight == 0
+
+
+class TestRateLimiterObserve:
+    """Response headers pause or drain the bucket."""
+
+    def test_retry_after_pauses_limiter(self):
+        limiter = RateLimiter(requests_per_second=1000, burst_size=10)
+
+        limiter.observe({"Retry-After": "5"})
+
+        assert limiter.try_acquire() is False
+        assert limiter.acquire(timeout=1) is False
+
+    def test_requests_after_retry_after_are_spaced_at_the_rate(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr("pipelines.lib.api.time.sleep", sleeps.append)
+        limiter = RateLimiter(requests_per_second=2, burst_size=5)
+
+        limiter.observe({"Retry-After": "1"})
+        for _ in range(4):
+            assert limiter.acquire() is True
+
+        # The first request waits out the pause, the rest follow 0.5s apart
+        assert sleeps == pytest.approx([1.0, 1.5, 2.0, 2.5], abs=0.01)
+
+    def test_pause_earns_no_tokens(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("pipelines.lib.api.time.monotonic", lambda: now[0])
+        limiter = RateLimiter(requests_per_second=2, burst_size=5)
+
+        limiter.observe({"Retry-After": "10"})
+        now[0] = 110.25
+
+        # The pause earned nothing and 0.25s after it is not a whole token
+        assert limiter.try_acquire() is True
+        assert limiter.try_acquire() is False
+
+    def test_remaining_caps_tokens_and_reset_pauses(self):
+        limiter = RateLimiter(requests_per_second=1000, burst_size=10)
+
+        limiter.observe({"X-RateLimit-Remaining": "2"})
+        assert limiter.tokens <= 2
+
+        limiter.observe({"x-ratelimit-remaining": "0", "x-ratelimit-reset": "30"})
+        assert limiter.acquire(timeout=1) is False
+
+
+class TestSharedRateLimiters:
+    """ApiSources calling one host share a single budget."""
+
+    def test_registry_returns_one_limiter_per_key(self):
+        first = get_rate_limiter("api.example.com", 5)
+        with capture_logs() as logs:
+            assert get_rate_limiter("api.example.com", 5) is first
+            assert logs == []
+            assert get_rate_limiter("api.example.com", 50) is first
+        assert get_rate_limiter("other", 5) is not first
+        (warning,) = logs
+        assert warning["log_level"] == "warning"
+        assert "already exists" in warning["event"]
+
+    def test_sources_share_limiter_by_host_or_budget(self, tmp_path):
+        def source(entity, **overrides):
+            return ApiSource(
+                system="vendor",
+                entity=entity,
+                base_url="https://api.example.com/v2",
+                endpoint=f"/{entity}",
+                target_path=str(tmp_path / entity),
+                **{"requests_per_second": 5, **overrides},
+            )
+
+        orders = source("orders")._get_rate_limiter()
+        assert source("customers")._get_rate_limiter() is orders
+        assert get_rate_limiter("api.example.com", None) is orders
+        assert source("items", rate_limit_key="bulk")._get_rate_limiter() is not orders
+        assert source("misc", requests_per_second=None)._get_rate_limiter() is None
@@ -198,6 +198,11 @@ class TestBronzeSchemaFields:
             "endpoint",
             "data_path",
             "requests_per_second",
+            "max_in_flight",
+            "rate_limit_key",
+            "checkpoint_pages",
+            "response_cache",
+            "response_cache_max_mb",
             "timeout",
             "max_retries",
             "watermark_param",
@@ -421,7 +426,7 @@ class TestSchemaCompleteness:
         schema_fields = {name for name, _ in get_bronze_fields()}
 
         # Fields in the current (non-deprecated) schema
-        # Note: deprecated fields (chunk_size, full_refresh_days, partition_by,
+        # Note: deprecated fields (full_refresh_days, partition_by,
         # connection, input_mode) are only in pipeline.full.schema.json
         expected_handled = {
             "system",
@@ -436,6 +441,7 @@ class TestSchemaCompleteness:
             "database",
             "query",
             "options",
+            "chunk_size",
             "write_checksums",
             "write_metadata",
             # S3 options
@@ -451,6 +457,11 @@ class TestSchemaCompleteness:
             "auth",
             "pagination",
             "requests_per_second",
+            "max_in_flight",
+            "rate_limit_key",
+            "checkpoint_pages",
+            "response_cache",
+            "response_cache_max_mb",
             "timeout",
             "max_retries",
             "headers",
@@ -488,6 +499,7 @@ class TestSchemaCompleteness:
             "attributes",
             "bronze_source",
             "validate_source",
+            "merge_mode",
             # CDC model options
             "keep_history",
             "handle_deletes",
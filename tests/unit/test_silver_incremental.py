@@ -0,0 +1,165 @@
+"""Tests for incremental Silver merges (merge_mode: incremental)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+import pytest
+
+from pipelines.lib.config_loader import load_silver_from_yaml
+from pipelines.lib.silver import HistoryMode, InputMode, MergeMode, SilverEntity
+
+BATCHES: Dict[str, List[Dict]] = {
+    "2025-01-01": [
+        {"id": 1, "name": "a", "updated_at": "2025-01-01"},
+        {"id": 2, "name": "b", "updated_at": "2025-01-01"},
+    ],
+    "2025-01-02": [
+        {"id": 2, "name": "b2", "updated_at": "2025-01-02"},
+        {"id": 3, "name": "c", "updated_at": "2025-01-02"},
+    ],
+    "2025-01-03": [
+        {"id": 1, "name": "a3", "updated_at": "2025-01-03"},
+    ],
+}
+
+
+def _write_bronze(root: Path, run_date: str, rows: List[Dict]) -> None:
+    partition = root / f"dt={run_date}"
+    partition.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(rows).to_parquet(partition / "orders.parquet", index=False)
+
+
+def _entity(tmp_path: Path, merge_mode: MergeMode, name: str) -> SilverEntity:
+    return SilverEntity(
+        domain="sales",
+        subject="orders",
+        source_path=str(tmp_path / "bronze" / "dt={run_date}" / "*.parquet"),
+        target_path=str(tmp_path / name / "dt={run_date}") + "/",
+        unique_columns=["id"],
+        last_updated_column="updated_at",
+        input_mode=InputMode.APPEND_LOG,
+        merge_mode=merge_mode,
+    )
+
+
+def _silver(tmp_path: Path, name: str, run_date: str) -> pd.DataFrame:
+    df = pd.read_parquet(tmp_path / name / f"dt={run_date}")
+    return df.drop(columns=["_silver_curated_at"]).sort_values("id")
+
+
+def test_incremental_matches_full_recompute(tmp_path):
+    full = _entity(tmp_path, MergeMode.FULL, "full")
+    incremental = _entity(tmp_path, MergeMode.INCREMENTAL, "incremental")
+
+    for run_date, rows in BATCHES.items():
+        _write_bronze(tmp_path / "bronze", run_date, rows)
+        full.run(run_date)
+        incremental.run(run_date)
+
+    expected = _silver(tmp_path, "full", "2025-01-03").reset_index(drop=True)
+    actual = _silver(tmp_path, "incremental", "2025-01-03").reset_index(drop=True)
+    pd.testing.assert_frame_equal(actual, expected)
+    assert actual["name"].tolist() == ["a3", "b2", "c"]
+
+
+def test_incremental_reads_only_newer_bronze_partitions(tmp_path):
+    entity = _entity(tmp_path, MergeMode.INCREMENTAL, "silver")
+    _write_bronze(tmp_path / "bronze", "2025-01-01", BATCHES["2025-01-01"])
+    entity.run("2025-01-01")
+
+    # Rewriting an already-merged partition must not affect the next run
+    _write_bronze(
+        tmp_path / "bronze",
+        "2025-01-01",
+        [{"id": 9, "name": "late", "updated_at": "2025-01-01"}],
+    )
+    _write_bronze(tmp_path / "bronze", "2025-01-02", BATCHES["2025-01-02"])
+    result = entity.run("2025-01-02")
+
+    df = _silver(tmp_path, "silver", "2025-01-02")
+    assert df["id"].tolist() == [1, 2, 3]
+    assert result["row_count"] == 3
+
+
+def test_incremental_carries_state_forward_without_new_partitions(tmp_path):
+    entity = _entity(tmp_path, MergeMode.INCREMENTAL, "silver")
+    _write_bronze(tmp_path / "bronze", "2025-01-01", BATCHES["2025-01-01"])
+    entity.run("2025-01-01")
+
+    result = entity.run("2025-01-02")
+
+    assert result["row_count"] == 2
+    df = _silver(tmp_path, "silver", "2025-01-02")
+    assert df["_silver_run_date"].unique().tolist() == ["2025-01-02"]
+
+
+def test_incremental_recomputes_when_keys_change(tmp_path):
+    _write_bronze(tmp_path / "bronze", "2025-01-01", BATCHES["2025-01-01"])
+    _entity(tmp_path, MergeMode.INCREMENTAL, "silver").run("2025-01-01")
+    _write_bronze(tmp_path / "bronze", "2025-01-02", BATCHES["2025-01-02"])
+
+    changed = _entity(tmp_path, MergeMode.INCREMENTAL, "silver")
+    changed.unique_columns = ["id", "name"]
+    changed.run("2025-01-02")
+
+    # Full recompute over both partitions: (2, b) and (2, b2) are distinct keys
+    assert len(_silver(tmp_path, "silver", "2025-01-02")) == 4
+
+
+def test_merge_mode_from_yaml():
+    config = {
+        "domain": "sales",
+        "subject": "orders",
+        "unique_columns": ["id"],
+        "last_updated_column": "updated_at",
+        "source_path": "./bronze/dt={run_date}/*.parquet",
+        "target_path": "./silver/dt={run_date}/",
+        "merge_mode": "incremental",
+    }
+
+    assert load_silver_from_yaml(config).merge_mode == MergeMode.INCREMENTAL
+    assert (
+        load_silver_from_yaml({**config, "merge_mode": None}).merge_mode
+        == MergeMode.FULL
+    )
+
+
+@pytest.mark.parametrize("merge_mode", ["full", "incremental"])
+def test_merge_mode_recorded_in_metadata(tmp_path, merge_mode):
+    _write_bronze(tmp_path / "bronze", "2025-01-01", BATCHES["2025-01-01"])
+    _entity(tmp_path, MergeMode(merge_mode), "silver").run("2025-01-01")
+
+    metadata = json.loads(
+        (tmp_path / "silver" / "dt=2025-01-01" / "_metadata.json").read_text()
+    )
+    assert metadata["merge_mode"] == merge_mode
+
+
+def _scd2_entity(tmp_path: Path, merge_mode: MergeMode, name: str) -> SilverEntity:
+    entity = _entity(tmp_path, merge_mode, name)
+    entity.history_mode = HistoryMode.FULL_HISTORY
+    return entity
+
+
+def test_incremental_scd2_matches_full_rebuild(tmp_path):
+    full = _scd2_entity(tmp_path, MergeMode.FULL, "full")
+    incremental = _scd2_entity(tmp_path, MergeMode.INCREMENTAL, "incremental")
+
+    for run_date, rows in BATCHES.items():
+        _write_bronze(tmp_path / "bronze", run_date, rows)
+        full.run(run_date)
+        incremental.run(run_date)
+
+    def history(name: str) -> pd.DataFrame:
+        df = _silver(tmp_path, name, "2025-01-03")
+        return df.sort_values(["id", "effective_from"]).reset_index(drop=True)
+
+    actual = history("incremental")
+    pd.testing.assert_frame_equal(actual, history("full"))
+    assert actual["is_current"].tolist() == [0, 1, 0, 1, 1]
+    assert actual["effective_to"].iloc[0] == "2025-01-03"
+    assert pd.isna(actual["effective_to"].iloc[1])
@@ -0,0 +1,46 @@
+"""Tests that Silver executes its curated plan once per run."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from pipelines.lib import silver as silver_module
+from pipelines.lib.engine import get_engine
+from pipelines.lib.silver import SilverEntity
+
+
+def test_curated_table_materialized_once(tmp_path, monkeypatch):
+    pd.DataFrame(
+        {
+            "id": [1, 1, 2],
+            "name": ["a", "a2", "b"],
+            "updated_at": ["2025-01-01", "2025-01-02", "2025-01-01"],
+        }
+    ).to_parquet(tmp_path / "orders.parquet", index=False)
+
+    row_counts = []
+    write_artifacts = silver_module.write_artifacts
+
+    def spy(**kwargs):
+        row_counts.append(kwargs["row_count"])
+        return write_artifacts(**kwargs)
+
+    monkeypatch.setattr(silver_module, "write_artifacts", spy)
+
+    entity = SilverEntity(
+        domain="sales",
+        subject="orders",
+        source_path=str(tmp_path / "orders.parquet"),
+        target_path=str(tmp_path / "silver") + "/",
+        unique_columns=["id"],
+        last_updated_column="updated_at",
+        output_formats=["parquet", "csv"],
+    )
+    result = entity.run("2025-01-15")
+
+    # The writer is handed the count instead of re-running the dedupe
+    assert row_counts == [2]
+    assert result["row_count"] == 2
+    csv = pd.read_csv(tmp_path / "silver" / "orders.csv")
+    assert sorted(csv["name"]) == ["a2", "b"]
+    assert "_silver_curated" not in get_engine().list_tables()
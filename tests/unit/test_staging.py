@@ -0,0 +1,110 @@
+"""Tests for the local Bronze staging area."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import ibis
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from pipelines.lib.bronze import BronzeSource, LoadPattern, SourceType
+from pipelines.lib.staging import get_staging_root, stage_table, staging_area
+
+
+def test_staging_area_is_removed_on_exit(tmp_path, monkeypatch):
+    monkeypatch.setenv("PIPELINE_STAGING_DIR", str(tmp_path / "staging"))
+
+    with staging_area("orders") as staging_dir:
+        assert staging_dir.exists()
+        assert staging_dir.parent == tmp_path / "staging"
+        (staging_dir / "file.parquet").write_bytes(b"x")
+
+    assert not staging_dir.exists()
+
+
+def test_get_staging_root_defaults_to_temp(monkeypatch):
+    monkeypatch.delenv("PIPELINE_STAGING_DIR", raising=False)
+    import tempfile
+
+    assert get_staging_root() == Path(tempfile.gettempdir())
+
+
+def test_stage_table_spools_parquet_and_counts(tmp_path):
+    con = ibis.duckdb.connect()
+    t = ibis.memtable(pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]}))
+
+    staged = stage_table(t, con, tmp_path, "orders", chunk_size=2)
+
+    assert staged.row_count == 3
+    assert staged.path.exists()
+    assert pq.ParquetFile(staged.path).metadata.num_rows == 3
+    assert staged.table.count().execute() == 3
+    assert list(staged.table.columns) == ["id", "name"]
+
+
+def test_stage_table_empty_keeps_schema(tmp_path):
+    con = ibis.duckdb.connect()
+    t = ibis.memtable(pd.DataFrame({"id": [1]})).filter(ibis._.id > 10)
+
+    staged = stage_table(t, con, tmp_path, "empty")
+
+    assert staged.row_count == 0
+    assert list(staged.table.columns) == ["id"]
+
+
+class _CountingTable:
+    """Wraps an Ibis table and counts how often it is materialized."""
+
+    def __init__(self, table: ibis.Table) -> None:
+        self._table = table
+        self.executions = 0
+
+    def to_pyarrow_batches(self, **kwargs):
+        self.executions += 1
+        return self._table.to_pyarrow_batches(**kwargs)
+
+
+def test_bronze_run_executes_source_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+    source = BronzeSource(
+        system="erp",
+        entity="orders",
+        source_type=SourceType.FILE_CSV,
+        source_path=str(tmp_path / "orders.csv"),
+        target_path=str(tmp_path / "bronze" / "dt={run_date}"),
+        load_pattern=LoadPattern.INCREMENTAL_APPEND,
+        watermark_column="updated_at",
+    )
+    counting = _CountingTable(
+        ibis.memtable(
+            pd.DataFrame({"id": [1, 2], "updated_at": ["2025-01-01", "2025-01-02"]})
+        )
+    )
+    monkeypatch.setattr(source, "_read_source", lambda *args: counting)
+
+    result = source.run("2025-01-15")
+
+    assert counting.executions == 1
+    assert result["row_count"] == 2
+    assert result["new_watermark"] == "2025-01-02"
+    written = pd.read_parquet(tmp_path / "bronze" / "dt=2025-01-15" / "orders.parquet")
+    assert len(written) == 2
+
+
+@pytest.mark.parametrize("row_count", [None, 2])
+def test_write_artifacts_uses_given_row_count(tmp_path, row_count):
+    from pipelines.lib.artifact_writer import write_artifacts
+
+    t = ibis.memtable(pd.DataFrame({"id": [1, 2]}))
+    result = write_artifacts(
+        table=t,
+        target=str(tmp_path / "out"),
+        entity_name="orders",
+        columns=[{"name": "id"}],
+        run_date="2025-01-15",
+        row_count=row_count,
+    )
+
+    assert result.row_count == 2
@@ -0,0 +1,60 @@
+"""Tests for the process-wide storage client cache."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from pipelines.lib.storage import S3Storage, close_all_storage_clients
+from pipelines.lib.storage.clients import get_storage_client
+
+OPTIONS = {
+    "endpoint_url": "https://objects.example.local",
+    "key": "access",
+    "secret": "secret",
+    "addressing_style": "path",
+}
+
+
+def test_s3_backends_share_client_across_buckets():
+    with patch("pipelines.lib.storage.s3.boto3.client") as boto3_client:
+        boto3_client.side_effect = lambda *args, **kwargs: MagicMock()
+
+        bronze = S3Storage("s3://bronze/orders/", **OPTIONS).client
+        silver = S3Storage("s3://silver/orders/", **OPTIONS).client
+        other = S3Storage(
+            "s3://bronze/", **{**OPTIONS, "endpoint_url": "https://other.local"}
+        ).client
+
+    assert bronze is silver
+    assert other is not bronze
+    assert boto3_client.call_count == 2
+
+
+def test_concurrent_misses_create_one_client():
+    created = []
+
+    def factory():
+        created.append(object())
+        return created[-1]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        clients = list(
+            pool.map(
+                lambda _: get_storage_client("s3", {"endpoint_url": "x"}, factory),
+                range(32),
+            )
+        )
+
+    assert len(created) == 1
+    assert all(client is created[0] for client in clients)
+
+
+def test_close_all_storage_clients_closes_and_forgets():
+    client = MagicMock()
+    assert get_storage_client("s3", {}, lambda: client) is client
+
+    close_all_storage_clients()
+
+    client.close.assert_called_once()
+    assert get_storage_client("s3", {}, MagicMock) is not client
@@ -1,5 +1,6 @@
 """Unit tests for `pipelines.lib.storage.S3Storage` using a mock boto3 client."""
 
+import hashlib
 import io
 from datetime import datetime
 from typing import Any, Dict, List
@@ -27,31 +28,46 @@ class DummyPaginator:
 
     def __init__(self, objects: Dict[str, bytes]):
         self.objects = objects
+        self.calls: List[Dict[str, Any]] = []
 
     def paginate(self, Bucket: str, Prefix: str = "", **kwargs) -> List[Dict[str, Any]]:
         contents = []
+        common_prefixes: List[str] = []
         delimiter = kwargs.get("Delimiter")
         max_keys = kwargs.get("MaxKeys")
+        start_after = kwargs.get("StartAfter", "")
+        self.calls.append({"Prefix": Prefix, **kwargs})
 
-        for key, data in self.objects.items():
-            if key.startswith(Prefix):
+        for key, data in sorted(self.objects.items()):
+            if key.startswith(Prefix) and key > start_after:
                 # If delimiter is set, only include objects at this level
                 if delimiter:
                     relative_key = key[len(Prefix) :]
                     if delimiter in relative_key:
-                        continue  # Skip nested objects
+                        # Nested objects roll up into a common prefix
+                        common = Prefix + relative_key.split(delimiter)[0] + delimiter
+                        if common not in common_prefixes:
+                            common_prefixes.append(common)
+                        continue
 
                 contents.append(
                     {
                         "Key": key,
                         "Size": len(data),
                         "LastModified": datetime.now(),
+                        "ETag": f'"{hashlib.md5(data).hexdigest()}"',
                     }
                 )
                 if max_keys and len(contents) >= max_keys:
                     break
 
-        return [{"Contents": contents, "KeyCount": len(contents)}]
+        return [
+            {
+                "Contents": contents,
+                "CommonPrefixes": [{"Prefix": p} for p in common_prefixes],
+                "KeyCount": len(contents),
+            }
+        ]
 
 
 class DummyS3Client:
@@ -59,6 +75,9 @@ class DummyS3Client:
 
     def __init__(self) -> None:
         self.objects: Dict[str, bytes] = {}
+        self.paginator = DummyPaginator(self.objects)
+        self.uploads: Dict[str, Dict[int, bytes]] = {}
+        self.aborted: List[str] = []
 
     def get_object(self, Bucket: str, Key: str) -> Dict[str, Any]:
         if Key not in self.objects:
@@ -99,7 +118,33 @@ class DummyS3Client:
         return {}
 
     def get_paginator(self, operation: str):
-        return DummyPaginator(self.objects)
+        return self.paginator
+
+    def create_multipart_upload(self, Bucket: str, Key: str) -> Dict[str, Any]:
+        upload_id = f"upload-{len(self.uploads) + 1}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(
+        self, Bucket: str, Key: str, PartNumber: int, UploadId: str, Body: bytes
+    ) -> Dict[str, Any]:
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(
+        self, Bucket: str, Key: str, UploadId: str, MultipartUpload: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        parts = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        self.objects[Key] = b"".join(parts[n] for n in numbers)
+        return {}
+
+    def abort_multipart_upload(
+        self, Bucket: str, Key: str, UploadId: str
+    ) -> Dict[str, Any]:
+        self.uploads.pop(UploadId, None)
+        self.aborted.append(UploadId)
+        return {}
 
 
 @pytest.fixture
@@ -282,3 +327,207 @@ def test_s3_storage_bucket_no_trailing_slash():
     storage = S3Storage("s3://my-bucket/prefix")
     assert storage._bucket == "my-bucket"
     assert storage._prefix == "prefix"
+
+
+def test_list_partitions_uses_delimiter_listing(s3_storage: S3Storage):
+    write_test_files(
+        s3_storage,
+        [
+            "orders/_catalog.json",
+            "orders/dt=2025-01-14/orders.parquet",
+            "orders/dt=2025-01-14/_metadata.json",
+            "orders/dt=2025-01-15/orders.parquet",
+            "orders/dt=2025-01-16/part/orders.parquet",
+        ],
+    )
+
+    assert s3_storage.list_partitions("orders") == [
+        "2025-01-14",
+        "2025-01-15",
+        "2025-01-16",
+    ]
+    call = s3_storage.client.paginator.calls[-1]
+    assert call["Prefix"] == f"{AWS_PREFIX}/orders/dt="
+    assert call["Delimiter"] == "/"
+
+
+def test_list_partitions_start_after(s3_storage: S3Storage):
+    write_test_files(
+        s3_storage,
+        [f"orders/dt=2025-01-{day}/orders.parquet" for day in ("14", "15", "16")],
+    )
+
+    assert s3_storage.list_partitions("orders", start_after="2025-01-14") == [
+        "2025-01-15",
+        "2025-01-16",
+    ]
+    assert s3_storage.client.paginator.calls[-1]["StartAfter"] == (
+        f"{AWS_PREFIX}/orders/dt=2025-01-14"
+    )
+
+
+MIB = 1024 * 1024
+
+
+def test_open_write_small_object_uses_put_object(s3_storage: S3Storage):
+    with s3_storage.open_write("data/small.bin") as sink:
+        sink.write(b"abc")
+        sink.write(b"def")
+
+    assert s3_storage.read_bytes("data/small.bin") == b"abcdef"
+    assert s3_storage.client.uploads == {}
+
+
+def test_open_write_streams_multipart_upload(monkeypatch):
+    monkeypatch.setenv("PIPELINE_UPLOAD_PART_SIZE_MB", "5")
+    storage = S3Storage(BASE_PATH, upload_concurrency=2)
+    storage._client = DummyS3Client()
+    payload = bytes(range(256)) * (12 * MIB // 256)
+
+    with storage.open_write("data/large.bin") as sink:
+        for offset in range(0, len(payload), MIB):
+            sink.write(payload[offset : offset + MIB])
+        assert sink.tell() == len(payload)
+
+    # 12 MiB in 5 MiB parts: two full parts plus the remainder
+    assert storage.read_bytes("data/large.bin") == payload
+    assert storage.client.uploads == {}
+
+
+def test_open_write_aborts_on_error(s3_storage: S3Storage):
+    with pytest.raises(ValueError):
+        with s3_storage.open_write("data/failed.bin") as sink:
+            sink.write(b"x" * (20 * MIB))
+            raise ValueError("encoder failed")
+
+    assert not s3_storage.exists("data/failed.bin")
+    assert s3_storage.client.aborted == ["upload-1"]
+
+
+def test_parquet_streams_through_open_write(s3_storage: S3Storage):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.table({"id": list(range(1000))})
+    with s3_storage.open_write("data/orders.parquet") as sink:
+        pq.write_table(table, sink)
+
+    written = pq.read_table(io.BytesIO(s3_storage.read_bytes("data/orders.parquet")))
+    assert written.equals(table)
+
+
+def test_write_artifacts_checksums_without_download(monkeypatch):
+    import json
+
+    import ibis
+    import pandas as pd
+
+    from pipelines.lib.artifact_writer import write_artifacts
+    from pipelines.lib.checksum import compute_bytes_sha256
+
+    client = DummyS3Client()
+    reads: List[str] = []
+    get_object = client.get_object
+
+    def tracking_get_object(Bucket: str, Key: str) -> Dict[str, Any]:
+        reads.append(Key)
+        return get_object(Bucket, Key)
+
+    client.get_object = tracking_get_object  # type: ignore[method-assign]
+    monkeypatch.setattr("pipelines.lib.storage.s3.boto3.client", lambda *a, **k: client)
+
+    write_artifacts(
+        table=ibis.memtable(pd.DataFrame({"id": range(100)})),
+        target="s3://test-bucket/bronze/orders/",
+        entity_name="orders",
+        columns=[{"name": "id"}],
+        run_date="2025-01-15",
+    )
+
+    assert not any(key.endswith(".parquet") for key in reads)
+    parquet = client.objects["bronze/orders/orders.parquet"]
+    manifest = json.loads(client.objects["bronze/orders/_checksums.json"])
+    assert manifest["files"] == [
+        {
+            "path": "orders.parquet",
+            "size_bytes": len(parquet),
+            "sha256": compute_bytes_sha256(parquet),
+        }
+    ]
+
+
+def test_verify_checksum_manifest_streams_objects(monkeypatch, tmp_path):
+    import ibis
+    import pandas as pd
+
+    from pipelines.lib.artifact_writer import write_artifacts
+    from pipelines.lib.checksum import VerificationCache, verify_checksum_manifest
+
+    client = DummyS3Client()
+    monkeypatch.setattr("pipelines.lib.storage.s3.boto3.client", lambda *a, **k: client)
+    target = "s3://test-bucket/bronze/orders/"
+    write_artifacts(
+        table=ibis.memtable(pd.DataFrame({"id": range(100)})),
+        target=target,
+        entity_name="orders",
+        columns=[{"name": "id"}],
+        run_date="2025-01-15",
+    )
+    cache = VerificationCache(tmp_path / "cache.json")
+
+    assert verify_checksum_manifest(target, cache=cache).valid
+
+    # Same ETag: the cached digest is used instead of a download
+    reads: List[str] = []
+    get_object = client.get_object
+
+    def tracking_get_object(Bucket: str, Key: str) -> Dict[str, Any]:
+        reads.append(Key)
+        return get_object(Bucket, Key)
+
+    client.get_object = tracking_get_object  # type: ignore[method-assign]
+    assert verify_checksum_manifest(target, cache=VerificationCache(cache.path)).valid
+    assert not any(key.endswith(".parquet") for key in reads)
+
+    key = "bronze/orders/orders.parquet"
+    client.objects[key] = client.objects[key][:-1] + b"!"
+    result = verify_checksum_manifest(target, cache=VerificationCache(cache.path))
+    assert result.mismatched_files == ["orders.parquet"]
+
+
+def test_verify_checksum_manifest_partitioned_layout(monkeypatch):
+    from pipelines.lib.checksum import (
+        compute_bytes_sha256,
+        verify_checksum_manifest,
+        write_checksum_manifest_s3,
+    )
+
+    client = DummyS3Client()
+    monkeypatch.setattr("pipelines.lib.storage.s3.boto3.client", lambda *a, **k: client)
+    target = "s3://test-bucket/bronze/orders/dt=2025-01-15/"
+    storage = get_storage(target)
+    # Same file name in two Hive partitions
+    names = ["region=east/orders-0.parquet", "region=west/orders-0.parquet"]
+    for name in names:
+        storage.write_bytes(name, name.encode("utf-8"))
+    write_checksum_manifest_s3(
+        storage,
+        [
+            {
+                "path": name,
+                "size_bytes": len(name),
+                "sha256": compute_bytes_sha256(name.encode("utf-8")),
+            }
+            for name in names
+        ],
+        row_count=2,
+    )
+
+    result = verify_checksum_manifest(target)
+    assert result.valid
+    assert result.verified_files == names
+
+    storage.write_bytes(names[1], names[1][::-1].encode("utf-8"))
+    result = verify_checksum_manifest(target)
+    assert result.mismatched_files == [names[1]]
+    assert result.verified_files == [names[0]]
@@ -159,6 +159,153 @@ class TestGetWatermarkFromDestination:
             result = get_watermark_from_destination(path)
             assert result == "2025-01-15T10:30:00", f"Failed for path: {path}"
 
+    def test_prefers_new_watermark_over_last_watermark(self, tmp_path):
+        """A partition's own high mark wins over the mark it was read from."""
+        partition = tmp_path / "dt=2025-01-15"
+        partition.mkdir()
+        metadata = {
+            "last_watermark": "2025-01-14T00:00:00",
+            "new_watermark": "2025-01-15T10:30:00",
+        }
+        (partition / "_metadata.json").write_text(json.dumps(metadata))
+
+        assert get_watermark_from_destination(str(tmp_path)) == "2025-01-15T10:30:00"
+
+    def test_bronze_metadata_answers_without_parquet_scan(self, tmp_path, monkeypatch):
+        """Bronze records the new watermark and column stats while writing."""
+        import pandas as pd
+
+        from pipelines.lib import state
+        from pipelines.lib.bronze import BronzeSource, LoadPattern, SourceType
+        from pipelines.lib.catalog import CATALOG_FILENAME
+
+        monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+        csv_path = tmp_path / "orders.csv"
+        pd.DataFrame(
+            {"id": [3, 1, None], "updated_at": ["2025-01-14", "2025-01-15", None]}
+        ).to_csv(csv_path, index=False)
+        target = str(tmp_path / "bronze" / "dt={run_date}")
+        result = BronzeSource(
+            system="erp",
+            entity="orders",
+            source_type=SourceType.FILE_CSV,
+            source_path=str(csv_path),
+            target_path=target,
+            load_pattern=LoadPattern.INCREMENTAL_APPEND,
+            watermark_column="updated_at",
+        ).run("2025-01-15")
+
+        partition = tmp_path / "bronze" / "dt=2025-01-15"
+        metadata = json.loads((partition / "_metadata.json").read_text())
+        assert metadata["new_watermark"] == result["new_watermark"]
+        assert metadata["new_watermark"].startswith("2025-01-15")
+        assert metadata["column_stats"]["id"] == {
+            "min": 1.0,
+            "max": 3.0,
+            "null_count": 1,
+        }
+
+        # Without the catalog, the metadata alone answers; no Parquet scan
+        def scan(*args):
+            raise AssertionError("partition was scanned")
+
+        (tmp_path / "bronze" / CATALOG_FILENAME).unlink()
+        monkeypatch.setattr(state, "_scan_parquet_for_watermark", scan)
+        assert (
+            get_watermark_from_destination(target, "updated_at")
+            == result["new_watermark"]
+        )
+
+    def test_bronze_warns_when_watermark_has_no_max(self, tmp_path, monkeypatch):
+        """A watermark column without a max leaves the watermark, loudly."""
+        import pandas as pd
+        from structlog.testing import capture_logs
+
+        from pipelines.lib.bronze import BronzeSource, LoadPattern, SourceType
+
+        monkeypatch.setenv("PIPELINE_STATE_DIR", str(tmp_path / ".state"))
+        csv_path = tmp_path / "orders.csv"
+        pd.DataFrame({"id": [1, 2], "updated_at": [None, None]}).to_csv(
+            csv_path, index=False
+        )
+        source = BronzeSource(
+            system="erp",
+            entity="orders",
+            source_type=SourceType.FILE_CSV,
+            source_path=str(csv_path),
+            target_path=str(tmp_path / "bronze" / "dt={run_date}"),
+            load_pattern=LoadPattern.INCREMENTAL_APPEND,
+            watermark_column="updated_at",
+        )
+
+        with capture_logs() as logs:
+            result = source.run("2025-01-15")
+
+        assert "new_watermark" not in result
+        assert any(log["event"] == "bronze_watermark_not_advanced" for log in logs)
+
+    def test_catalog_bounds_the_partition_listing(self, tmp_path, monkeypatch):
+        """Only partitions newer than the catalogued one are listed."""
+        from pipelines.lib.catalog import update_catalog
+        from pipelines.lib.storage.local import LocalStorage
+
+        for dt in ("2025-01-14", "2025-01-15"):
+            partition = tmp_path / f"dt={dt}"
+            partition.mkdir()
+            (partition / "orders.parquet").write_bytes(b"data")
+            update_catalog(
+                str(partition),
+                row_count=1,
+                files=["orders.parquet"],
+                columns=[{"name": "id", "type": "int64"}],
+                watermark=f"{dt}T23:00:00",
+            )
+        # Written without artifacts, so it has metadata but no catalog entry
+        newer = tmp_path / "dt=2025-01-16"
+        newer.mkdir()
+        (newer / "_metadata.json").write_text(
+            json.dumps({"new_watermark": "2025-01-16T23:00:00"})
+        )
+        bounds = []
+        list_partitions = LocalStorage.list_partitions
+
+        def spy(self, prefix="", key="dt", *, start_after=None):
+            bounds.append(start_after)
+            return list_partitions(self, prefix, key, start_after=start_after)
+
+        monkeypatch.setattr(LocalStorage, "list_partitions", spy)
+
+        assert get_watermark_from_destination(str(tmp_path)) == "2025-01-16T23:00:00"
+        assert bounds == ["2025-01-15"]
+
+        # Without newer partitions the catalogued one is the latest
+        (newer / "_metadata.json").unlink()
+        newer.rmdir()
+        assert get_watermark_from_destination(str(tmp_path)) == "2025-01-15T23:00:00"
+
+    def test_deleted_catalog_partition_falls_back_to_full_listing(self, tmp_path):
+        """A catalogued partition whose data is gone is not trusted."""
+        from pipelines.lib.catalog import update_catalog
+
+        for dt in ("2025-01-14", "2025-01-15"):
+            partition = tmp_path / f"dt={dt}"
+            partition.mkdir()
+            (partition / "orders.parquet").write_bytes(b"data")
+            (partition / "_metadata.json").write_text(
+                json.dumps({"new_watermark": f"{dt}T23:00:00"})
+            )
+            update_catalog(
+                str(partition),
+                row_count=1,
+                files=["orders.parquet"],
+                columns=[{"name": "id", "type": "int64"}],
+            )
+        for child in (tmp_path / "dt=2025-01-15").iterdir():
+            child.unlink()
+        (tmp_path / "dt=2025-01-15").rmdir()
+
+        assert get_watermark_from_destination(str(tmp_path)) == "2025-01-14T23:00:00"
+
 
 class TestGetWatermarkWithSource:
     """Tests for get_watermark_with_source function."""